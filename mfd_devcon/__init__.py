@@ -2,5 +2,40 @@
 # SPDX-License-Identifier: MIT
 """Module for MFD Devcon."""
 
-from .parser import DevconParser, DevconHwids, DevconDriverNodes, DevconDriverFiles, DevconDevices, DevconResources
+from .pnp import PnpId
+from .output_log import OutputLogPolicy, configure_output_logging, get_output_log_policy
+from .lazy import LazyDeviceList
+from .parser import (
+    DriverNode,
+    FrozenDevconHwids,
+    FrozenDevconDriverNodes,
+    FrozenDevconDriverFiles,
+    FrozenDevconDevices,
+    FrozenDevconResources,
+    DevconParser,
+    DevconHwids,
+    DevconDriverNodes,
+    DevconDriverFiles,
+    DevconDevices,
+    DevconResources,
+    DevconDeviceSnapshot,
+    DeviceOutcome,
+    DevconDeviceOutcome,
+    DevconMutationResult,
+    DeviceState,
+    DevconDeviceStatus,
+    DevconDriverPackage,
+    DevconPackageDeployment,
+    parse_driver_date,
+    parse_driver_version,
+)
+from .cache import DevconCache
+from .instrumentation import DevconCallMetrics, InMemoryMetrics, PrometheusTextfileExporter, current_call
+from .platform_probe import PlatformInfo, forget_platform, probe_platform
+from .inventory import DeviceInventory
+from .driver_store import DriverPackageIndex
+from .driver_selection import driver_rank_key, newest_version, select_best_driver
+from .diff import DeviceChange, FieldChange, InventoryDiff, diff_field_changes, diff_inventories
 from .base import Devcon
+from .async_devcon import AsyncDevcon
+from .fleet import DevconFleet, DevconFleetHostBusy, DevconFleetResult, DevconFleetTimeout
@@ -0,0 +1,167 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for asyncio API of Devcon."""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator, Optional, Union
+
+from mfd_common_libs import log_levels
+
+from .base import Devcon
+from .cache import DevconCache
+from .instrumentation import MetricsSink
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+
+_ITERATOR_METHODS = frozenset({"iter_hwids", "iter_drivernodes", "iter_devices", "iter_resources"})
+_EXHAUSTED = object()
+
+
+class AsyncDevcon:
+    """
+    Asyncio API of Devcon.
+
+    Mirrors public API of Devcon: every method is a coroutine function and every iter_* method is an async generator.
+    Blocking calls run on a bounded thread pool, so event loop can drive many hosts at the same time.
+
+    Cancelling a call which is still waiting for a worker drops it. Call which is already running on remote host
+    cannot be interrupted, cancellation only stops awaiting its result.
+
+    Usage example:
+    >>> async with await AsyncDevcon.create(connection=connection) as devcon:
+    >>>     devices = await devcon.find_devices(pattern="=net")
+    """
+
+    def __init__(self, devcon: Devcon, *, max_workers: int = 1, executor: Optional[Executor] = None):
+        """
+        Initialize asyncio API for existing Devcon object.
+
+        :param devcon: Devcon object which calls are delegated to
+        :param max_workers: maximum number of concurrent calls, used when executor is not given.
+                            Default 1 serializes calls of this host, raise it only for thread-safe connections
+        :param executor: executor to run blocking calls on, e.g. shared by many hosts, not shut down by aclose
+        """
+        if executor is None and max_workers < 1:
+            raise ValueError(f"Invalid max_workers: {max_workers}. At least one worker is required")
+        self._devcon = devcon
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mfd_devcon")
+
+    @classmethod
+    async def create(
+        cls,
+        connection: "Connection",
+        absolute_path_to_binary_dir: Optional[Union[Path, str]] = None,
+        cache: Optional[DevconCache] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        *,
+        max_workers: int = 1,
+        executor: Optional[Executor] = None,
+    ) -> "AsyncDevcon":
+        """
+        Create Devcon without blocking event loop, its constructor checks tool availability on remote host.
+
+        :param connection: Connection object
+        :param absolute_path_to_binary_dir: absolute path to devcon binary directory
+        :param cache: cache of read-only command outputs, None to disable caching
+        :param metrics_sink: function called with DevconCallMetrics after every Devcon call, None to disable
+        :param max_workers: maximum number of concurrent calls, used when executor is not given
+        :param executor: executor to run blocking calls on, not shut down by aclose
+        :return: AsyncDevcon object
+        """
+        owns_executor = executor is None
+        executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mfd_devcon")
+        constructor = functools.partial(
+            Devcon,
+            connection=connection,
+            absolute_path_to_binary_dir=absolute_path_to_binary_dir,
+            cache=cache,
+            metrics_sink=metrics_sink,
+        )
+        try:
+            devcon = await asyncio.get_running_loop().run_in_executor(executor, constructor)
+        except BaseException:
+            if owns_executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        async_devcon = cls(devcon, executor=executor)
+        async_devcon._owns_executor = owns_executor
+        return async_devcon
+
+    @property
+    def devcon(self) -> Devcon:
+        """Devcon object which calls are delegated to."""
+        return self._devcon
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run blocking function on executor.
+
+        :param func: function to call
+        :return: value returned by function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _iterate(self, func: Callable[..., Iterator], *args, **kwargs) -> AsyncIterator:
+        """
+        Iterate blocking generator on executor, one item per executor call.
+
+        :param func: generator function to call
+        :return: async generator of items yielded by generator
+        """
+        iterator = await self._run(func, *args, **kwargs)
+        while True:
+            item = await self._run(next, iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return
+            yield item
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get asyncio counterpart of Devcon attribute.
+
+        :param name: attribute name
+        :return: coroutine function for methods, async generator function for iter_* methods, else attribute value
+        """
+        if name.startswith("_"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        attribute = getattr(self._devcon, name)
+        if not callable(attribute):
+            return attribute
+        if name in _ITERATOR_METHODS:
+
+            @functools.wraps(attribute)
+            def async_iterator(*args, **kwargs) -> AsyncIterator:
+                return self._iterate(attribute, *args, **kwargs)
+
+            return async_iterator
+
+        @functools.wraps(attribute)
+        async def coroutine(*args, **kwargs) -> Any:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Schedule devcon call: {name}")
+            return await self._run(attribute, *args, **kwargs)
+
+        return coroutine
+
+    def __dir__(self) -> list:
+        """List own attributes and public attributes of Devcon."""
+        return sorted(set(super().__dir__()) | {name for name in dir(self._devcon) if not name.startswith("_")})
+
+    async def aclose(self) -> None:
+        """Shut down own executor, waiting for running calls to finish without blocking event loop."""
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(None, functools.partial(self._executor.shutdown, True))
+
+    async def __aenter__(self) -> "AsyncDevcon":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
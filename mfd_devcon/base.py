@@ -2,22 +2,77 @@
 # SPDX-License-Identifier: MIT
 """Main devcon module."""
 
+import hashlib
 import logging
+import re
+import time
+import uuid
 
 from pathlib import Path
-from typing import Optional, Union, List
-from mfd_common_libs import add_logging_level, log_levels, os_supported
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union, List
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_common_libs.exceptions import UnexpectedOSException
 from mfd_connect import Connection, LocalConnection
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_connect.util import rpc_copy_utils
 from mfd_base_tool import ToolTemplate
 from mfd_typing import OSName, OSBitness
-from .exceptions import DevconNotAvailable, DevconException, DevconExecutionError
+from .cache import DevconCache
+from .inventory import DeviceInventory
+from .driver_store import DriverPackageIndex
+from .platform_probe import is_tool_available, mark_tool_available, probe_platform
+from .output_log import log_command
+from .instrumentation import MetricsSink, TimedParser, current_call, instrumented, measure_execution, note_command
+from .exceptions import DevconNotAvailable, DevconException, DevconExecutionError, DevconWaitTimeout
 
-from mfd_devcon import DevconParser, DevconHwids, DevconDriverNodes, DevconDriverFiles, DevconDevices, DevconResources
+from mfd_devcon import (
+    DevconParser,
+    DevconHwids,
+    DevconDriverNodes,
+    DevconDriverFiles,
+    DevconDevices,
+    DevconResources,
+    DevconDeviceSnapshot,
+    DeviceOutcome,
+    DevconDeviceOutcome,
+    DeviceState,
+    DevconDeviceStatus,
+    DevconPackageDeployment,
+)
 
 logger = logging.getLogger(__name__)
 add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 
+_SNAPSHOT_COMMANDS = ["find", "hwids", "drivernodes", "driverfiles", "resources"]
+_SNAPSHOT_DELIMITER = f"==mfd_devcon_{uuid.uuid4().hex}=="
+_NO_DEVICES_ERRORS = [
+    "No matching devices found",
+    "No devices for setup class",
+    "There are no devices in setup class",
+]
+_UNKNOWN_SETUP_CLASS_RE = re.compile(r'There is no "[^"]*" setup class')
+_PUBLISHED_NAME_RE = re.compile(r"\b(?P<published_name>oem[0-9]+\.inf)\b", re.IGNORECASE)
+_DEPLOYMENT_MANIFEST_SUFFIX = ".deployment"
+_WAIT_STATES = {"present": None, "absent": None, "started": DeviceState.RUNNING, "disabled": DeviceState.DISABLED}
+
+
+def _hash_directory(directory: Path) -> str:
+    """
+    Calculate content hash of directory, covering relative paths and contents of all its files.
+
+    :param directory: local directory
+    :return: hex digest of SHA-256
+    """
+    digest = hashlib.sha256()
+    for file in sorted(path for path in directory.rglob("*") if path.is_file()):
+        digest.update(file.relative_to(directory).as_posix().encode())
+        digest.update(b"\0")
+        with open(file, "rb") as file_content:
+            for chunk in iter(lambda: file_content.read(1024 * 1024), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 
 class Devcon(ToolTemplate):
     """Class for Devcon."""
@@ -28,12 +83,40 @@ class Devcon(ToolTemplate):
     }
 
     known_errors = ["Operation not permitted", "No matching devices found"]
+    max_command_length = 8191
     parser = DevconParser()
 
-    @os_supported(OSName.WINDOWS)
-    def __init__(self, connection: "Connection", absolute_path_to_binary_dir: str | Path = None):
-        """Initialize Devcon."""
+    def __init__(
+        self,
+        connection: "Connection",
+        absolute_path_to_binary_dir: str | Path = None,
+        cache: Optional[DevconCache] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+    ):
+        """
+        Initialize Devcon.
+
+        OS name and bitness of the host are probed once per connection (see probe_platform) and availability
+        of devcon is remembered per connection, so further Devcon objects for the same connection neither query
+        OS name and bitness again nor run devcon help.
+
+        :param connection: Connection object
+        :param absolute_path_to_binary_dir: path to dir where devcon binaries are stored
+        :param cache: cache for outputs of read-only commands, invalidated by every mutating command.
+                      Caching is disabled when not provided
+        :param metrics_sink: function called with DevconCallMetrics after every call of public method,
+                             e.g. InMemoryMetrics or PrometheusTextfileExporter.
+                             Instrumentation is disabled when not provided
+        :raises UnexpectedOSException: if host is not Windows
+        """
+        read_os = probe_platform(connection).os_name
+        if read_os != OSName.WINDOWS:
+            raise UnexpectedOSException(f"Found unexpected OS: {read_os.value}")
         self._connection = connection
+        self._cache = cache
+        self._metrics_sink = metrics_sink
+        if metrics_sink is not None:
+            self.parser = TimedParser(type(self).parser)
         self.absolute_path_to_binary_dir = absolute_path_to_binary_dir
         if not self.absolute_path_to_binary_dir:
             self.absolute_path_to_binary_dir = self._connection.path("c:\\mfd_tools\\devcon\\")
@@ -41,18 +124,25 @@ class Devcon(ToolTemplate):
 
     def _get_tool_exec_factory(self) -> str:
         """Get correct tool name."""
-        return self.tool_executable_name[(self._connection.get_os_name(), self._connection.get_os_bitness())]
+        platform = probe_platform(self._connection)
+        return self.tool_executable_name[(platform.os_name, platform.os_bitness)]
 
-    def check_if_available(self) -> None:
+    def check_if_available(self, force: bool = False) -> None:
         """
         Check if tool is available in system at the specified path.
 
+        Successful check is remembered per connection and tool path, so it is executed only once.
+
+        :param force: check again even if tool was already found available
         :raises DevconNotAvailable when tool not available
         """
+        if not force and is_tool_available(self._connection, self._tool_exec):
+            return
         logger.log(level=log_levels.MODULE_DEBUG, msg="Check if Devcon is available")
         self._connection.execute_command(
             f"{self._tool_exec} help", expected_return_codes=[0], custom_exception=DevconNotAvailable
         )
+        mark_tool_available(self._connection, self._tool_exec)
 
     def get_version(self) -> Optional[str]:
         """
@@ -63,20 +153,41 @@ class Devcon(ToolTemplate):
         logger.log(level=log_levels.MODULE_DEBUG, msg="Tool version is not available for devcon")
         return "N/A"
 
-    def enable_devices(self, device_id: str = "", pattern: str = "", reboot: bool = False) -> str:
+    def invalidate(self) -> None:
+        """Drop cached outputs of read-only commands, if caching is enabled."""
+        if self._cache is not None:
+            self._cache.invalidate()
+
+    def _execute_command(self, command: str, **kwargs) -> ConnectionCompletedProcess:
         """
-        Enable devices on the computer.
+        Execute command on the host, accounting it to metrics of instrumented call in progress.
 
+        :param command: command line to execute
+        :param kwargs: arguments of Connection.execute_command
+        :return: ConnectionCompletedProcess object
+        """
+        with measure_execution(command, self._tool_exec) as metrics:
+            output = self._connection.execute_command(command, **kwargs)
+        if metrics is not None:
+            metrics.stdout_bytes += len(output.stdout or "")
+        return output
+
+    def _mutate_devices(self, subcommand: str, device_id: str, pattern: str, reboot: bool, action: str) -> str:
+        """
+        Execute mutating devcon command for devices specified either by device_id or pattern.
+
+        :param subcommand: devcon command to execute, e.g. enable
         :param device_id: hardware ID, compatible ID, or device instance ID of a device
-        :param pattern: devices to be enabled specified by ID, class, or all devices (*)
+        :param pattern: devices specified by ID, class, or all devices (*)
         :param reboot: Set to True if conditional reboot needs to be enabled, else False
+        :param action: description of command for logging, e.g. Enabling
         :return: output of executed devcon command
         :raises DevconExecutionError: if devcon command execution fails
         :raises DevconException: if devcon command output consists of known errors
         """
         if not device_id and not pattern:
-            raise AttributeError("Please provide inputs: device_id or pattern for command: devcon enable")
-        command_list = [self._tool_exec, "enable"]
+            raise AttributeError(f"Please provide inputs: device_id or pattern for command: devcon {subcommand}")
+        command_list = [self._tool_exec, subcommand]
         if reboot:
             command_list.insert(1, "/r")
         if device_id:
@@ -84,13 +195,29 @@ class Devcon(ToolTemplate):
         else:
             command_list.append(f'"{pattern}"')
         command = " ".join(command_list)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Enabling devices using command: {command}")
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
+        log_command(logger, f"{action} devices using command", command)
+        output = self._execute_command(command, custom_exception=DevconExecutionError, shell=True)
+        self.invalidate()
         for e in self.known_errors:
             if e in output.stdout:
                 raise DevconException(f"Error while running devcon command: {e}")
         return output.stdout
 
+    @instrumented
+    def enable_devices(self, device_id: str = "", pattern: str = "", reboot: bool = False) -> str:
+        """
+        Enable devices on the computer.
+
+        :param device_id: hardware ID, compatible ID, or device instance ID of a device
+        :param pattern: devices to be enabled specified by ID, class, or all devices (*)
+        :param reboot: Set to True if conditional reboot needs to be enabled, else False
+        :return: output of executed devcon command
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon command output consists of known errors
+        """
+        return self._mutate_devices("enable", device_id, pattern, reboot, "Enabling")
+
+    @instrumented
     def disable_devices(self, device_id: str = "", pattern: str = "", reboot: bool = False) -> str:
         """
         Disable devices on the computer.
@@ -102,23 +229,9 @@ class Devcon(ToolTemplate):
         :raises DevconExecutionError: if devcon command execution fails
         :raises DevconException: if devcon command output consists of known errors
         """
-        if not device_id and not pattern:
-            raise AttributeError("Please provide inputs: device_id or pattern for command: devcon disable")
-        command_list = [self._tool_exec, "disable"]
-        if reboot:
-            command_list.insert(1, "/r")
-        if device_id:
-            command_list.append(f'"@{device_id}"')
-        else:
-            command_list.append(f'"{pattern}"')
-        command = " ".join(command_list)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Disabling devices using command: {command}")
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
-        for e in self.known_errors:
-            if e in output.stdout:
-                raise DevconException(f"Error while running devcon command: {e}")
-        return output.stdout
+        return self._mutate_devices("disable", device_id, pattern, reboot, "Disabling")
 
+    @instrumented
     def rescan_devices(self) -> str:
         """
         Rescan to update the device list for the computer.
@@ -129,12 +242,14 @@ class Devcon(ToolTemplate):
         """
         logger.log(level=log_levels.MODULE_DEBUG, msg="Rescan devices using command: devcon rescan")
         command = f"{self._tool_exec} rescan"
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError)
+        output = self._execute_command(command, custom_exception=DevconExecutionError)
+        self.invalidate()
         for e in self.known_errors:
             if e in output.stdout:
                 raise DevconException(f"Error while running devcon command: {e}")
         return output.stdout
 
+    @instrumented
     def remove_devices(self, device_id: str = "", pattern: str = "", reboot: bool = False) -> str:
         """
         Remove the device from the device tree and deletes the device stack for the device.
@@ -146,23 +261,9 @@ class Devcon(ToolTemplate):
         :raises DevconExecutionError: if devcon command execution fails
         :raises DevconException: if devcon command output consists of known errors
         """
-        if not device_id and not pattern:
-            raise AttributeError("Please provide inputs: device_id or pattern for command: devcon remove")
-        command_list = [self._tool_exec, "remove"]
-        if reboot:
-            command_list.insert(1, "/r")
-        if device_id:
-            command_list.append(f'"@{device_id}"')
-        else:
-            command_list.append(f'"{pattern}"')
-        command = " ".join(command_list)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Removing devices using command: {command}")
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
-        for e in self.known_errors:
-            if e in output.stdout:
-                raise DevconException(f"Error while running devcon command: {e}")
-        return output.stdout
+        return self._mutate_devices("remove", device_id, pattern, reboot, "Removing")
 
+    @instrumented
     def update_drivers(self, device_id: str, inf_file: Union["Path", str], reboot: bool = False) -> str:
         """
         Replace the current device drivers for a specified device with drivers listed in the specified INF file.
@@ -178,13 +279,15 @@ class Devcon(ToolTemplate):
         if reboot:
             command_list.insert(1, "/r")
         command = " ".join(command_list)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Updating drivers using command: {command}")
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
+        log_command(logger, "Updating drivers using command", command)
+        output = self._execute_command(command, custom_exception=DevconExecutionError, shell=True)
+        self.invalidate()
         for e in self.known_errors:
             if e in output.stdout:
                 raise DevconException(f"Error while running devcon command: {e}")
         return output.stdout
 
+    @instrumented
     def restart_devices(self, device_id: str = "", pattern: str = "", reboot: bool = False) -> str:
         """
         Stop and restart the specified devices.
@@ -196,73 +299,229 @@ class Devcon(ToolTemplate):
         :raises DevconExecutionError: if devcon command execution fails
         :raises DevconException: if devcon command output consists of known errors
         """
-        if not device_id and not pattern:
-            raise AttributeError("Please provide inputs: device_id or pattern for command: devcon restart")
-        command_list = [self._tool_exec, "restart"]
+        return self._mutate_devices("restart", device_id, pattern, reboot, "Restarting")
+
+    def _pack_device_ids(self, command_prefix: str, device_ids: List[str]) -> List[str]:
+        """
+        Pack device instance IDs into as few command lines as Windows command length limit allows.
+
+        :param command_prefix: devcon command line without devices
+        :param device_ids: device instance IDs to append to command line as @ID arguments
+        :return: command lines
+        :raises DevconException: if command line with single device exceeds the limit
+        """
+        commands, command = [], command_prefix
+        for device_id in dict.fromkeys(device_ids):
+            argument = f' "@{device_id}"'
+            if len(command_prefix) + len(argument) > self.max_command_length:
+                raise DevconException(f"Command line for device {device_id} exceeds {self.max_command_length} chars")
+            if len(command) + len(argument) > self.max_command_length:
+                commands.append(command)
+                command = command_prefix
+            command += argument
+        if command != command_prefix:
+            commands.append(command)
+        return commands
+
+    def _mutate_devices_batch(
+        self, subcommand: str, device_ids: List[str], reboot: bool
+    ) -> Dict[str, DevconDeviceOutcome]:
+        """
+        Execute mutating devcon command for many devices with as few devcon invocations as possible.
+
+        :param subcommand: devcon command to execute, e.g. enable
+        :param device_ids: device instance IDs of devices
+        :param reboot: Set to True if conditional reboot needs to be enabled, else False
+        :return: outcome parsed from devcon output for each of device_ids, NOT_FOUND if device was not reported
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if operation is not permitted
+        """
+        if not device_ids:
+            raise AttributeError(f"Please provide inputs: device_ids for command: devcon {subcommand}")
+        command_list = [self._tool_exec, subcommand]
         if reboot:
             command_list.insert(1, "/r")
+        outcomes = {}
+        for command in self._pack_device_ids(" ".join(command_list), device_ids):
+            log_command(logger, f"Run devcon {subcommand} using command", command)
+            output = self._execute_command(command, custom_exception=DevconExecutionError, shell=True)
+            self.invalidate()
+            if "Operation not permitted" in output.stdout:
+                raise DevconException("Error while running devcon command: Operation not permitted")
+            for device in self.parser.parse_devcon_mutation(output.stdout).devices:
+                outcomes[device.device_instance_id.upper()] = device
+        return {
+            device_id: outcomes.get(device_id.upper(), DevconDeviceOutcome(device_id, DeviceOutcome.NOT_FOUND))
+            for device_id in device_ids
+        }
+
+    @instrumented
+    def enable_devices_batch(self, device_ids: List[str], reboot: bool = False) -> Dict[str, DevconDeviceOutcome]:
+        """
+        Enable many devices, packing as many device IDs into each devcon invocation as possible.
+
+        :param device_ids: device instance IDs of devices
+        :param reboot: Set to True if conditional reboot needs to be enabled, else False
+        :return: outcome for each of device_ids, e.g. ENABLED, NOT_FOUND if device was not reported
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if operation is not permitted
+        """
+        return self._mutate_devices_batch("enable", device_ids, reboot)
+
+    @instrumented
+    def disable_devices_batch(self, device_ids: List[str], reboot: bool = False) -> Dict[str, DevconDeviceOutcome]:
+        """
+        Disable many devices, packing as many device IDs into each devcon invocation as possible.
+
+        :param device_ids: device instance IDs of devices
+        :param reboot: Set to True if conditional reboot needs to be enabled, else False
+        :return: outcome for each of device_ids, e.g. DISABLED, NOT_FOUND if device was not reported
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if operation is not permitted
+        """
+        return self._mutate_devices_batch("disable", device_ids, reboot)
+
+    @instrumented
+    def restart_devices_batch(self, device_ids: List[str], reboot: bool = False) -> Dict[str, DevconDeviceOutcome]:
+        """
+        Restart many devices, packing as many device IDs into each devcon invocation as possible.
+
+        :param device_ids: device instance IDs of devices
+        :param reboot: Set to True if conditional reboot needs to be enabled, else False
+        :return: outcome for each of device_ids, e.g. RESTARTED, NOT_FOUND if device was not reported
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if operation is not permitted
+        """
+        return self._mutate_devices_batch("restart", device_ids, reboot)
+
+    @instrumented
+    def remove_devices_batch(self, device_ids: List[str], reboot: bool = False) -> Dict[str, DevconDeviceOutcome]:
+        """
+        Remove many devices, packing as many device IDs into each devcon invocation as possible.
+
+        :param device_ids: device instance IDs of devices
+        :param reboot: Set to True if conditional reboot needs to be enabled, else False
+        :return: outcome for each of device_ids, e.g. REMOVED, NOT_FOUND if device was not reported
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if operation is not permitted
+        """
+        return self._mutate_devices_batch("remove", device_ids, reboot)
+
+    def _run_query(self, subcommand: str, device_id: str = "", pattern: str = "", cached: bool = True) -> str:
+        """
+        Execute read-only devcon command for devices specified either by device_id or pattern.
+
+        :param subcommand: devcon command to execute, e.g. hwids
+        :param device_id: hardware ID, compatible ID, or device instance ID of a device
+        :param pattern: devices specified by ID, class, or all devices (*)
+        :param cached: serve output from cache if possible, False for volatile device state
+        :return: output of executed devcon command
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon command output consists of known errors
+        """
+        if not device_id and not pattern:
+            raise AttributeError(f"Please provide inputs: device_id or pattern for command: devcon {subcommand}")
+        command_list = [self._tool_exec, subcommand]
         if device_id:
             command_list.append(f'"@{device_id}"')
         else:
             command_list.append(f'"{pattern}"')
         command = " ".join(command_list)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Restarting devices using command: {command}")
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
-        for e in self.known_errors:
+        log_command(logger, f"Run devcon {subcommand} using command", command)
+        return self._execute_query(command, self.known_errors, cached=cached)
+
+    def _execute_query(self, command: str, errors: List[str], cached: bool = True) -> str:
+        """
+        Execute read-only devcon command, serving output from cache if possible.
+
+        :param command: devcon command line
+        :param errors: errors which must not be present in the output
+        :param cached: serve output from cache and store it there, False for volatile device state
+        :return: output of executed devcon command
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon command output consists of known errors
+        """
+        cached = cached and self._cache is not None
+        if cached:
+            cached_output = self._cache.get(command)
+            if cached_output is not None:
+                metrics = current_call()
+                if metrics is not None:
+                    note_command(metrics, command, self._tool_exec)
+                return cached_output
+        output = self._execute_command(command, custom_exception=DevconExecutionError, shell=True)
+        for e in errors:
             if e in output.stdout:
                 raise DevconException(f"Error while running devcon command: {e}")
+        if cached:
+            self._cache.put(command, output.stdout)
         return output.stdout
 
-    def get_hwids(self, device_id: str = "", pattern: str = "") -> List[DevconHwids]:
+    @instrumented
+    def get_hwids(self, device_id: str = "", pattern: str = "", lazy: bool = False) -> Sequence[DevconHwids]:
         """
         Display the hardware IDs, compatible IDs, and device instance IDs of the specified devices.
 
         :param device_id: hardware ID, compatible ID, or device instance ID of a device
         :param pattern: devices to get hwids for specified by ID, class, or all devices (*)
+        :param lazy: return LazyDeviceList parsing devices only when accessed
         :return: parsed devcon output
         :raises DevconExecutionError: if devcon command execution fails
         :raises DevconException: if devcon command output consists of known errors
         """
-        if not device_id and not pattern:
-            raise AttributeError("Please provide inputs: device_id or pattern for command: devcon hwids")
-        command_list = [self._tool_exec, "hwids"]
-        if device_id:
-            command_list.append(f'"@{device_id}"')
-        else:
-            command_list.append(f'"{pattern}"')
-        command = " ".join(command_list)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Get hwids using command: {command}")
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
-        for e in self.known_errors:
-            if e in output.stdout:
-                raise DevconException(f"Error while running devcon command: {e}")
-        return self.parser.parse_devcon_hwids(output.stdout)
+        return self.parser.parse_devcon_hwids(self._run_query("hwids", device_id=device_id, pattern=pattern), lazy=lazy)
+
+    @instrumented
+    def iter_hwids(self, device_id: str = "", pattern: str = "") -> Iterator[DevconHwids]:
+        """
+        Yield the hardware IDs, compatible IDs, and device instance IDs of the specified devices one by one.
+
+        Command is executed immediately, devices are parsed lazily while iterating.
+        Number of devices is validated against devcon output only when iteration is exhausted.
 
-    def get_drivernodes(self, device_id: str = "", pattern: str = "") -> List[DevconDriverNodes]:
+        :param device_id: hardware ID, compatible ID, or device instance ID of a device
+        :param pattern: devices to get hwids for specified by ID, class, or all devices (*)
+        :return: generator of parsed devices
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon command output consists of known errors
+        """
+        return self.parser.iter_hwids(self._run_query("hwids", device_id=device_id, pattern=pattern))
+
+    @instrumented
+    def get_drivernodes(
+        self, device_id: str = "", pattern: str = "", lazy: bool = False
+    ) -> Sequence[DevconDriverNodes]:
         """
         Get all driver packages that are compatible with the device, along with their version and ranking.
 
         :param device_id: hardware ID, compatible ID, or device instance ID of a device
         :param pattern: devices to get drivernodes for specified by ID, class, or all devices (*)
+        :param lazy: return LazyDeviceList parsing devices only when accessed
         :return: parsed devcon output
         :raises DevconExecutionError: if devcon command execution fails
         :raises DevconException: if devcon command output consists of known errors
         """
-        if not device_id and not pattern:
-            raise AttributeError("Please provide inputs: device_id or pattern for command: devcon drivernodes")
-        command_list = [self._tool_exec, "drivernodes"]
-        if device_id:
-            command_list.append(f'"@{device_id}"')
-        else:
-            command_list.append(f'"{pattern}"')
-        command = " ".join(command_list)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Get drivernodes using command: {command}")
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
-        for e in self.known_errors:
-            if e in output.stdout:
-                raise DevconException(f"Error while running devcon command: {e}")
-        return self.parser.parse_devcon_drivernodes(output.stdout)
+        return self.parser.parse_devcon_drivernodes(
+            self._run_query("drivernodes", device_id=device_id, pattern=pattern), lazy=lazy
+        )
+
+    @instrumented
+    def iter_drivernodes(self, device_id: str = "", pattern: str = "") -> Iterator[DevconDriverNodes]:
+        """
+        Yield driver packages compatible with each of the specified devices one by one.
+
+        Command is executed immediately, devices are parsed lazily while iterating.
+        Number of devices is validated against devcon output only when iteration is exhausted.
+
+        :param device_id: hardware ID, compatible ID, or device instance ID of a device
+        :param pattern: devices to get drivernodes for specified by ID, class, or all devices (*)
+        :return: generator of parsed devices
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon command output consists of known errors
+        """
+        return self.parser.iter_drivernodes(self._run_query("drivernodes", device_id=device_id, pattern=pattern))
 
+    @instrumented
     def get_driverfiles(self, device_id: str = "", pattern: str = "") -> List[DevconDriverFiles]:
         """
         Get the full path and file name of installed INF files and device driver files for the specified devices.
@@ -273,21 +532,11 @@ class Devcon(ToolTemplate):
         :raises DevconExecutionError: if devcon command execution fails
         :raises DevconException: if devcon command output consists of known errors
         """
-        if not device_id and not pattern:
-            raise AttributeError("Please provide inputs: device_id or pattern for command: devcon driverfiles")
-        command_list = [self._tool_exec, "driverfiles"]
-        if device_id:
-            command_list.append(f'"@{device_id}"')
-        else:
-            command_list.append(f'"{pattern}"')
-        command = " ".join(command_list)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Get driverfiles using command: {command}")
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
-        for e in self.known_errors:
-            if e in output.stdout:
-                raise DevconException(f"Error while running devcon command: {e}")
-        return self.parser.parse_devcon_driverfiles(output.stdout)
+        return self.parser.parse_devcon_driverfiles(
+            self._run_query("driverfiles", device_id=device_id, pattern=pattern)
+        )
 
+    @instrumented
     def find_devices(self, device_id: str = "", pattern: str = "") -> List[DevconDevices]:
         """
         Find devices that are currently attached to the computer.
@@ -298,21 +547,25 @@ class Devcon(ToolTemplate):
         :raises DevconExecutionError: if devcon command execution fails
         :raises DevconException: if devcon command output consists of known errors
         """
-        if not device_id and not pattern:
-            raise AttributeError("Please provide inputs: device_id or pattern for command: devcon find")
-        command_list = [self._tool_exec, "find"]
-        if device_id:
-            command_list.append(f'"@{device_id}"')
-        else:
-            command_list.append(f'"{pattern}"')
-        command = " ".join(command_list)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Find devices using command: {command}")
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
-        for e in self.known_errors:
-            if e in output.stdout:
-                raise DevconException(f"Error while running devcon command: {e}")
-        return self.parser.parse_devcon_devices(output.stdout)
+        return self.parser.parse_devcon_devices(self._run_query("find", device_id=device_id, pattern=pattern))
+
+    @instrumented
+    def iter_devices(self, device_id: str = "", pattern: str = "") -> Iterator[DevconDevices]:
+        """
+        Yield devices that are currently attached to the computer one by one.
+
+        Command is executed immediately, devices are parsed lazily while iterating.
+        Number of devices is validated against devcon output only when iteration is exhausted.
+
+        :param device_id: hardware ID, compatible ID, or device instance ID of a device
+        :param pattern: devices to look for specified by ID, class, or all devices (*)
+        :return: generator of parsed devices
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon command output consists of known errors
+        """
+        return self.parser.iter_devices(self._run_query("find", device_id=device_id, pattern=pattern))
 
+    @instrumented
     def listclass(self, class_name: str) -> List[DevconDevices]:
         """
         List all devices in the specified device setup classes.
@@ -335,15 +588,27 @@ class Devcon(ToolTemplate):
         )
         command_list = [self._tool_exec, "listclass", class_name]
         command = " ".join(command_list)
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
-        for e in errors:
-            if e in output.stdout:
-                raise DevconException(f"Error while running devcon command: {e}")
-        return self.parser.parse_devcon_devices(output.stdout, command="listclass")
+        return self.parser.parse_devcon_devices(self._execute_query(command, errors), command="listclass")
+
+    @staticmethod
+    def _filter_resources(devcon_resources: DevconResources, resource_filter: str) -> DevconResources:
+        """
+        Keep only resources of device which contain resource_filter.
+
+        :param devcon_resources: parsed resources of a device
+        :param resource_filter: resources to be kept, "all" keeps every resource
+        :return: filtered data structure
+        """
+        if resource_filter != "all":
+            devcon_resources.resources = [
+                resource for resource in devcon_resources.resources if resource_filter.lower() in resource.lower()
+            ]
+        return devcon_resources
 
+    @instrumented
     def get_resources(
-        self, device_id: str = "", pattern: str = "", resource_filter: str = "all"
-    ) -> List[DevconResources]:
+        self, device_id: str = "", pattern: str = "", resource_filter: str = "all", lazy: bool = False
+    ) -> Sequence[DevconResources]:
         """
         Get the resources allocated to the specified devices.
 
@@ -351,33 +616,63 @@ class Devcon(ToolTemplate):
         :param pattern: devices to get resources for specified by ID, class, or all devices (*)
         :param resource_filter: specify resources to be fetched for a given device.
                                 return only specified resources if any
+        :param lazy: return LazyDeviceList parsing devices only when accessed
         :return: parsed devcon output
         :raises DevconExecutionError: if devcon command execution fails
         :raises DevconException: if devcon command output consists of known errors
         """
+        parsed_output = self.parser.parse_devcon_resources(
+            self._run_query("resources", device_id=device_id, pattern=pattern), lazy=lazy
+        )
+        if lazy:
+            return parsed_output.map(lambda entry: self._filter_resources(entry, resource_filter))
+        return [self._filter_resources(entry, resource_filter) for entry in parsed_output]
+
+    @instrumented
+    def iter_resources(
+        self, device_id: str = "", pattern: str = "", resource_filter: str = "all"
+    ) -> Iterator[DevconResources]:
+        """
+        Yield the resources allocated to each of the specified devices one by one.
+
+        Command is executed immediately, devices are parsed lazily while iterating.
+        Number of devices is validated against devcon output only when iteration is exhausted.
+
+        :param device_id: hardware ID, compatible ID, or device instance ID of a device
+        :param pattern: devices to get resources for specified by ID, class, or all devices (*)
+        :param resource_filter: specify resources to be fetched for a given device.
+                                return only specified resources if any
+        :return: generator of parsed devices
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon command output consists of known errors
+        """
+        parsed_output = self.parser.iter_resources(self._run_query("resources", device_id=device_id, pattern=pattern))
+        return (self._filter_resources(entry, resource_filter) for entry in parsed_output)
+
+    @instrumented
+    def snapshot(self, device_id: str = "", pattern: str = "") -> List[DevconDeviceSnapshot]:
+        """
+        Get full state of the specified devices in a single round trip.
+
+        Commands: find, hwids, drivernodes, driverfiles and resources are chained in one shell invocation,
+        their outputs are separated with unique delimiter and merged per device.
+
+        :param device_id: hardware ID, compatible ID, or device instance ID of a device
+        :param pattern: devices to get state for specified by ID, class, or all devices (*)
+        :return: merged state of each device found by devcon find
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon command output consists of known errors
+        """
         if not device_id and not pattern:
-            raise AttributeError("Please provide inputs: device_id or pattern for command: devcon resources")
-        command_list = [self._tool_exec, "resources"]
-        if device_id:
-            command_list.append(f'"@{device_id}"')
-        else:
-            command_list.append(f'"{pattern}"')
-        command = " ".join(command_list)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Get resources using command: {command}")
-        output = self._connection.execute_command(command, custom_exception=DevconExecutionError, shell=True)
-        for e in self.known_errors:
-            if e in output.stdout:
-                raise DevconException(f"Error while running devcon command: {e}")
-        parsed_output = self.parser.parse_devcon_resources(output.stdout)
-        if resource_filter != "all":
-            for entry in range(len(parsed_output)):
-                filtered_resources = []
-                for resource in parsed_output[entry].resources:
-                    if resource_filter.lower() in resource.lower():
-                        filtered_resources.append(resource)
-                parsed_output[entry].resources = filtered_resources
-        return parsed_output
+            raise AttributeError("Please provide inputs: device_id or pattern for devcon snapshot")
+        devices = f'"@{device_id}"' if device_id else f'"{pattern}"'
+        command = f" & echo {_SNAPSHOT_DELIMITER} & ".join(
+            f"{self._tool_exec} {subcommand} {devices}" for subcommand in _SNAPSHOT_COMMANDS
+        )
+        log_command(logger, "Get devices snapshot using command", command)
+        return self.parser.parse_devcon_snapshot(self._execute_query(command, self.known_errors), _SNAPSHOT_DELIMITER)
 
+    @instrumented
     def get_device_id(self, device_name: str, command: str = "find", class_name: str = "net") -> Union[str, None]:
         """
         Get the device instance ID from the specified device name.
@@ -400,3 +695,434 @@ class Devcon(ToolTemplate):
             if device_name.strip() == device.device_desc:
                 return device.device_instance_id
         return None
+
+    @instrumented
+    def get_device_ids(
+        self, device_names: List[str], command: str = "find", class_name: str = "net", duplicates: str = "raise"
+    ) -> Dict[str, Union[str, List[str], None]]:
+        """
+        Get the device instance IDs of many device names from a single enumeration of the setup class.
+
+        :param device_names: names of the requested devices
+        :param command: devcon command to execute for finding the device ids
+        :param class_name: device setup class of the specified devices
+        :param duplicates: handling of names matching many devices: raise - raise DevconException,
+                           first - first device in devcon output (like get_device_id), all - list of all device IDs
+        :return: device instance ID (or list of device instance IDs) of each requested name, None if not found
+        :raises DevconException: if a name matches many devices and duplicates is raise
+        """
+        _valid_duplicates = ["raise", "first", "all"]
+        if duplicates not in _valid_duplicates:
+            raise AttributeError(
+                f"Invalid value = {duplicates} for attribute: duplicates. Valid values are: {_valid_duplicates}"
+            )
+        inventory = self.get_device_inventory([class_name], command=command)
+        device_ids = {}
+        for device_name in device_names:
+            matches = [device.device_instance_id for device in inventory.by_name(device_name)]
+            if duplicates == "all":
+                device_ids[device_name] = matches
+            elif len(matches) > 1 and duplicates == "raise":
+                raise DevconException(f"Device name {device_name} matches many devices: {matches}")
+            else:
+                device_ids[device_name] = matches[0] if matches else None
+        return device_ids
+
+    @instrumented
+    def get_device_inventory(self, class_names: Optional[List[str]] = None, command: str = "find") -> DeviceInventory:
+        """
+        Enumerate devices once and index them for repeated lookups.
+
+        Commands for all setup classes are chained in one shell invocation, their outputs are separated
+        with unique delimiter. Setup classes without devices are skipped, unknown setup classes are errors.
+
+        :param class_names: device setup classes to enumerate, None for all devices (not indexed by class)
+        :param command: devcon command to execute for enumerating devices: find or listclass (requires class_names)
+        :return: inventory of enumerated devices
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon command output consists of known errors
+        """
+        _valid_commands = ["find", "listclass"]
+        if command not in _valid_commands:
+            raise AttributeError(
+                f"Invalid value = {command} for attribute: command. Valid commands are: {_valid_commands}"
+            )
+        if class_names is None:
+            if command != "find":
+                raise AttributeError("Please provide inputs: class_names for command: devcon listclass")
+            return DeviceInventory(self.find_devices(pattern="*"))
+        if not class_names:
+            raise AttributeError("Please provide value for class_names. Input: class_names cannot be empty")
+        commands = [
+            (
+                f"{self._tool_exec} find ={class_name}"
+                if command == "find"
+                else f"{self._tool_exec} listclass {class_name}"
+            )
+            for class_name in class_names
+        ]
+        chained_command = f" & echo {_SNAPSHOT_DELIMITER} & ".join(commands)
+        log_command(logger, "Get device inventory using command", chained_command)
+        sections = self._execute_query(chained_command, ["Operation not permitted"]).split(_SNAPSHOT_DELIMITER)
+        if len(sections) != len(class_names):
+            raise DevconException(f"Expected {len(class_names)} outputs of devcon {command}, got {len(sections)}")
+        devices, setup_classes = [], {}
+        for class_name, section in zip(class_names, sections):
+            unknown_class = _UNKNOWN_SETUP_CLASS_RE.search(section)
+            if unknown_class:
+                raise DevconException(f"Error while running devcon command: {unknown_class.group()}")
+            if any(e in section for e in _NO_DEVICES_ERRORS):
+                continue
+            for device in self.parser.iter_devices(section, command=command):
+                devices.append(device)
+                setup_classes[device.device_instance_id] = class_name
+        return DeviceInventory(devices, setup_classes)
+
+    @instrumented
+    def get_driver_packages(self) -> DriverPackageIndex:
+        """
+        Enumerate third-party driver packages in the driver store with a single devcon dp_enum.
+
+        :return: index of driver packages by published name, provider, class and version
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if operation is not permitted
+        """
+        command = f"{self._tool_exec} dp_enum"
+        log_command(logger, "Enumerate driver packages using command", command)
+        return DriverPackageIndex(
+            self.parser.parse_devcon_dp_enum(self._execute_query(command, ["Operation not permitted"]))
+        )
+
+    @instrumented
+    def add_driver_package(self, inf_file: Union["Path", str]) -> str:
+        """
+        Stage driver package in the driver store with devcon dp_add.
+
+        :param inf_file: full path of the INF file of the package on the host
+        :return: published name of the package, e.g. oem12.inf
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon did not report published name of the package
+        """
+        command = f'{self._tool_exec} dp_add "{inf_file}"'
+        log_command(logger, "Adding driver package using command", command)
+        output = self._execute_command(command, custom_exception=DevconExecutionError, shell=True)
+        self.invalidate()
+        published_name_match = _PUBLISHED_NAME_RE.search(output.stdout)
+        if not published_name_match:
+            raise DevconException(f"Error while adding driver package {inf_file}: {output.stdout.strip()}")
+        return published_name_match.group("published_name")
+
+    @instrumented
+    def delete_driver_package(self, published_name: str, force: bool = False) -> str:
+        """
+        Remove third-party driver package from the driver store with devcon dp_delete.
+
+        :param published_name: published name of the package, e.g. oem12.inf
+        :param force: delete the package even if devices are still using it
+        :return: output of executed devcon command
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon failed to delete the package
+        """
+        command_list = [self._tool_exec, "dp_delete", published_name]
+        if force:
+            command_list.insert(2, "-f")
+        command = " ".join(command_list)
+        log_command(logger, "Deleting driver package using command", command)
+        output = self._execute_command(command, custom_exception=DevconExecutionError, shell=True)
+        self.invalidate()
+        if "failed" in output.stdout.lower():
+            raise DevconException(f"Error while deleting driver package {published_name}: {output.stdout.strip()}")
+        return output.stdout
+
+    @instrumented
+    def deploy_driver_package(
+        self,
+        package_dir: Union["Path", str],
+        inf_name: str,
+        remote_dir: Union["Path", str, None] = None,
+        force: bool = False,
+        timeout: int = 600,
+    ) -> DevconPackageDeployment:
+        """
+        Copy local driver package directory to the host and stage it in the driver store, skipping unchanged packages.
+
+        Package is keyed by SHA-256 of its content, remembered in a manifest file on the host next to the copy.
+        One round trip reads the manifest and the driver store (dp_enum): if the same content is already staged,
+        nothing is copied. Otherwise package is copied with rpc_copy_utils into a directory named after its hash
+        and staged with dp_add, after which the manifest is rewritten and the copy of previous version removed.
+        Previously deployed version of the package is then deleted with dp_delete. Its deletion fails while devices
+        still use it, which does not fail the deployment: the package is reported in failed_to_remove and kept
+        in the manifest, so following deployments retry the cleanup.
+
+        :param package_dir: local directory of driver package
+        :param inf_name: name of the INF file of the package, relative to package_dir
+        :param remote_dir: directory on the host for package copies, packages subdirectory of devcon dir by default
+        :param force: copy and stage the package even if it is already deployed
+        :param timeout: timeout of copying in seconds
+        :return: deployment details, copied is False if the package was already deployed
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if dp_enum is not permitted or dp_add fails
+        """
+        package_dir = Path(package_dir)
+        if not (package_dir / inf_name).is_file():
+            raise AttributeError(f"INF file {inf_name} not found in driver package directory {package_dir}")
+        content_hash = _hash_directory(package_dir)
+        if remote_dir:
+            remote_root = self._connection.path(remote_dir)
+        else:
+            remote_root = self._connection.path(self.absolute_path_to_binary_dir, "packages")
+        inf_stem = Path(inf_name).stem
+        manifest = remote_root / f"{inf_stem}{_DEPLOYMENT_MANIFEST_SUFFIX}"
+        command = f'type "{manifest}" & echo {_SNAPSHOT_DELIMITER} & {self._tool_exec} dp_enum'
+        log_command(logger, "Check deployed driver package using command", command)
+        output = self._execute_command(
+            command, custom_exception=DevconExecutionError, shell=True, expected_return_codes=None
+        )
+        manifest_output, _, dp_enum_output = output.stdout.partition(_SNAPSHOT_DELIMITER)
+        if "Operation not permitted" in dp_enum_output:
+            raise DevconException("Error while running devcon command: Operation not permitted")
+        manifest_fields = manifest_output.split()
+        previous_hash, previous_name = manifest_fields[:2] if len(manifest_fields) >= 2 else (None, None)
+        packages = DriverPackageIndex(self.parser.parse_devcon_dp_enum(dp_enum_output))
+        stale_names = [name for name in manifest_fields[2:] if name in packages]
+        if not force and previous_hash == content_hash and previous_name in packages:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Driver package {previous_name} is already deployed")
+            removed, failed_to_remove = self._delete_stale_driver_packages(stale_names)
+            if removed:
+                self._write_deployment_manifest(manifest, content_hash, previous_name, failed_to_remove)
+            return DevconPackageDeployment(
+                published_name=previous_name,
+                content_hash=content_hash,
+                remote_path=str(remote_root / f"{inf_stem}_{content_hash[:16]}" / package_dir.name / inf_name),
+                removed=removed,
+                failed_to_remove=failed_to_remove,
+            )
+        remote_package_dir = remote_root / f"{inf_stem}_{content_hash[:16]}"
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Copying driver package {package_dir} to {remote_package_dir}")
+        rpc_copy_utils.copy(
+            src_conn=LocalConnection(),
+            dst_conn=self._connection,
+            source=package_dir,
+            target=remote_package_dir,
+            timeout=timeout,
+        )
+        remote_inf = remote_package_dir / package_dir.name / inf_name
+        published_name = self.add_driver_package(remote_inf)
+        if previous_name and previous_name.lower() != published_name.lower() and previous_name in packages:
+            stale_names.append(previous_name)
+        stale_names = [name for name in stale_names if name.lower() != published_name.lower()]
+        remove_commands = []
+        if previous_hash and previous_hash != content_hash:
+            remove_commands.append(f'rmdir /s /q "{remote_root / f"{inf_stem}_{previous_hash[:16]}"}"')
+        self._write_deployment_manifest(manifest, content_hash, published_name, stale_names, remove_commands)
+        removed, failed_to_remove = self._delete_stale_driver_packages(stale_names)
+        if removed:
+            self._write_deployment_manifest(manifest, content_hash, published_name, failed_to_remove)
+        return DevconPackageDeployment(
+            published_name=published_name,
+            content_hash=content_hash,
+            remote_path=str(remote_inf),
+            copied=True,
+            removed=removed,
+            failed_to_remove=failed_to_remove,
+        )
+
+    def _write_deployment_manifest(
+        self,
+        manifest: "Path",
+        content_hash: str,
+        published_name: str,
+        stale_names: List[str],
+        extra_commands: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Write deployment manifest on the host: content hash, published name and packages left to delete.
+
+        :param manifest: path of the manifest on the host
+        :param content_hash: SHA-256 of deployed package content
+        :param published_name: published name of deployed package
+        :param stale_names: published names of previous versions which could not be deleted yet
+        :param extra_commands: commands chained after writing the manifest, e.g. removing previous copy
+        """
+        commands = [f'echo {" ".join([content_hash, published_name, *stale_names])}> "{manifest}"']
+        commands.extend(extra_commands or [])
+        self._execute_command(" & ".join(commands), shell=True, expected_return_codes=None)
+
+    def _delete_stale_driver_packages(self, published_names: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Delete previous versions of deployed package, failure (e.g. package still in use) is not an error.
+
+        :param published_names: published names of packages to delete
+        :return: deleted packages and packages which failed to delete
+        """
+        removed, failed_to_remove = [], []
+        for published_name in published_names:
+            try:
+                self.delete_driver_package(published_name)
+            except DevconException as e:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Keeping stale driver package {published_name}: {e}")
+                failed_to_remove.append(published_name)
+            else:
+                removed.append(published_name)
+        return removed, failed_to_remove
+
+    @instrumented
+    def get_status(
+        self, device_ids: Optional[List[str]] = None, pattern: str = "", lazy: bool = False
+    ) -> Sequence[DevconDeviceStatus]:
+        """
+        Get the status (running, stopped, disabled or problem code) of the driver of the specified devices.
+
+        Device IDs are packed into as few devcon invocations as Windows command length limit allows.
+        Device state is volatile, so status is always queried, bypassing the cache.
+
+        :param device_ids: device instance IDs of devices
+        :param pattern: devices to get status for specified by ID, class, or all devices (*)
+        :param lazy: return LazyDeviceList parsing devices only when accessed, only for pattern
+        :return: parsed devcon output
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if devcon command output consists of known errors
+        """
+        if not device_ids and not pattern:
+            raise AttributeError("Please provide inputs: device_ids or pattern for command: devcon status")
+        if not device_ids:
+            return self.parser.parse_devcon_status(self._run_query("status", pattern=pattern, cached=False), lazy=lazy)
+        statuses = []
+        for command in self._pack_device_ids(f"{self._tool_exec} status", device_ids):
+            log_command(logger, "Run devcon status using command", command)
+            statuses.extend(self.parser.iter_status(self._execute_query(command, self.known_errors, cached=False)))
+        return statuses
+
+    def _query_device_states(
+        self, device_ids: List[str], patterns: List[str], state: str
+    ) -> Dict[str, Optional[DeviceState]]:
+        """
+        Query current state of devices, bypassing the cache.
+
+        :param device_ids: device instance IDs of devices
+        :param patterns: devices specified by ID, class, or all devices (*)
+        :param state: awaited state, present and absent are queried with devcon find, others with devcon status
+        :return: state of each reported device keyed by upper-cased device instance ID, None for devcon find
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if operation is not permitted
+        """
+        subcommand = "find" if _WAIT_STATES[state] is None else "status"
+        command_prefix = f"{self._tool_exec} {subcommand}"
+        if device_ids:
+            commands = self._pack_device_ids(command_prefix, device_ids)
+        else:
+            commands = [" ".join([command_prefix, *(f'"{pattern}"' for pattern in patterns)])]
+        states = {}
+        for command in commands:
+            output = self._execute_command(command, custom_exception=DevconExecutionError, shell=True)
+            if "Operation not permitted" in output.stdout:
+                raise DevconException("Error while running devcon command: Operation not permitted")
+            if any(e in output.stdout for e in _NO_DEVICES_ERRORS):
+                continue
+            if subcommand == "find":
+                states.update(
+                    (device.device_instance_id.upper(), None) for device in self.parser.iter_devices(output.stdout)
+                )
+            else:
+                states.update(
+                    (device.device_pnp.upper(), device.state) for device in self.parser.iter_status(output.stdout)
+                )
+        return states
+
+    @staticmethod
+    def _pending_devices(
+        states: Dict[str, Optional[DeviceState]], device_ids: List[str], patterns: List[str], state: str
+    ) -> List[str]:
+        """
+        Get devices which did not reach awaited state yet.
+
+        :param states: current state of each reported device keyed by upper-cased device instance ID
+        :param device_ids: awaited device instance IDs, each of them must reach the state
+        :param patterns: awaited patterns, present requires any matching device, absent requires none,
+                         started and disabled require at least one matching device and all of them in the state
+        :param state: awaited state
+        :return: device instance IDs or patterns not in awaited state, empty if condition holds
+        """
+        if device_ids:
+            if state == "absent":
+                return [device_id for device_id in device_ids if device_id.upper() in states]
+            if state == "present":
+                return [device_id for device_id in device_ids if device_id.upper() not in states]
+            return [device_id for device_id in device_ids if states.get(device_id.upper()) != _WAIT_STATES[state]]
+        if state == "absent":
+            satisfied = not states
+        elif state == "present":
+            satisfied = bool(states)
+        else:
+            satisfied = bool(states) and all(device_state == _WAIT_STATES[state] for device_state in states.values())
+        return [] if satisfied else patterns
+
+    @instrumented
+    def wait_for(
+        self,
+        device_ids: Optional[List[str]] = None,
+        patterns: Optional[List[str]] = None,
+        state: str = "present",
+        timeout: float = 60,
+        initial_interval: float = 0.1,
+        max_interval: float = 5,
+        backoff: float = 2.0,
+    ) -> float:
+        """
+        Wait until devices reach awaited state, e.g. after restart_devices, enable_devices or rescan_devices.
+
+        All devices are queried with one devcon invocation per poll (more only if device IDs exceed command length
+        limit), cache is bypassed. Interval between polls starts at initial_interval and is multiplied by backoff
+        after every poll up to max_interval, last sleep is shortened to the deadline.
+        Cache is invalidated once condition holds, as devices changed asynchronously.
+
+        :param device_ids: device instance IDs, each of them must reach the state
+        :param patterns: devices specified by ID, class, or all devices (*), matched together:
+                         present - any device matches, absent - no device matches,
+                         started and disabled - at least one device matches and all matching devices are in the state
+        :param state: awaited state: present, absent, started (driver is running) or disabled
+        :param timeout: maximum time to wait in seconds
+        :param initial_interval: interval after first poll in seconds
+        :param max_interval: maximum interval between polls in seconds
+        :param backoff: factor multiplying interval after every poll
+        :return: time waited in seconds
+        :raises DevconWaitTimeout: if condition does not hold before timeout
+        :raises DevconExecutionError: if devcon command execution fails
+        :raises DevconException: if operation is not permitted
+        """
+        if not device_ids and not patterns:
+            raise AttributeError("Please provide inputs: device_ids or patterns for devcon wait_for")
+        if device_ids and patterns:
+            raise AttributeError("Please provide only one of inputs: device_ids or patterns for devcon wait_for")
+        if state not in _WAIT_STATES:
+            raise AttributeError(
+                f"Invalid value = {state} for attribute: state. Valid states are: {list(_WAIT_STATES)}"
+            )
+        if initial_interval <= 0 or max_interval < initial_interval or backoff < 1:
+            raise AttributeError(
+                "Invalid polling intervals, expected: 0 < initial_interval <= max_interval and backoff >= 1"
+            )
+        device_ids, patterns = list(device_ids or []), list(patterns or [])
+        start = time.monotonic()
+        deadline = start + timeout
+        interval = initial_interval
+        polls = 0
+        while True:
+            pending = self._pending_devices(
+                self._query_device_states(device_ids, patterns, state), device_ids, patterns, state
+            )
+            polls += 1
+            now = time.monotonic()
+            if not pending:
+                self.invalidate()
+                logger.log(
+                    level=log_levels.MODULE_DEBUG,
+                    msg=f"Devices reached state {state} after {polls} poll(s) in {now - start:.2f}s",
+                )
+                return now - start
+            if now >= deadline:
+                raise DevconWaitTimeout(
+                    f"Devices did not reach state {state} within {timeout}s after {polls} poll(s): {', '.join(pending)}"
+                )
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * backoff, max_interval)
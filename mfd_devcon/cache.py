@@ -0,0 +1,74 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Devcon output cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+
+class DevconCache:
+    """
+    Size-bounded LRU cache of devcon outputs with time-to-live.
+
+    Raw outputs are cached, not parsed data structures, so callers can freely modify returned objects.
+    """
+
+    def __init__(self, ttl: Optional[float] = 60.0, max_size: int = 128, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize cache.
+
+        :param ttl: time in seconds after which entry expires, None for entries valid until invalidation
+        :param max_size: maximum number of entries, least recently used entry is evicted when exceeded
+        :param clock: monotonic time source
+        """
+        if max_size < 1:
+            raise ValueError(f"Invalid max_size: {max_size}. Cache must hold at least one entry")
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get number of cached entries, including expired ones not evicted yet."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """
+        Get cached output.
+
+        :param key: cache key, e.g. devcon command line
+        :return: cached output or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or self._clock() - entry[0] < self.ttl):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: str) -> None:
+        """
+        Cache output.
+
+        :param key: cache key, e.g. devcon command line
+        :param value: output to cache
+        """
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,151 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for comparing inventories of devices."""
+
+import dataclasses
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+_KEY_FIELDS = ("device_instance_id", "device_pnp")
+
+
+@dataclass(slots=True)
+class FieldChange:
+    """Structure for change of a single field of a device, path is dotted, e.g. driver_nodes.0.driver_version."""
+
+    path: str
+    old: Any = None
+    new: Any = None
+
+
+@dataclass(slots=True)
+class DeviceChange:
+    """Structure for changes of a device present in both inventories."""
+
+    device_instance_id: str
+    old: Any
+    new: Any
+    changes: List[FieldChange] = field(default_factory=list)
+
+    def get(self, path: str) -> Optional[FieldChange]:
+        """
+        Get change of field.
+
+        :param path: dotted path of field
+        :return: field change or None if field did not change
+        """
+        return next((change for change in self.changes if change.path == path), None)
+
+
+@dataclass(slots=True)
+class InventoryDiff:
+    """Structure for differences between two inventories."""
+
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+    modified: List[DeviceChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+
+def _record_key(record: Any) -> str:
+    """
+    Get case-insensitive device instance ID of record.
+
+    :param record: record with device_instance_id or device_pnp field
+    :return: upper-cased device instance ID
+    """
+    for key_field in _KEY_FIELDS:
+        value = getattr(record, key_field, None)
+        if value is not None:
+            return str(value).upper()
+    raise AttributeError(f"Record {record!r} has no device_instance_id or device_pnp field")
+
+
+def _is_record(value: Any) -> bool:
+    """Check if value is a mapping or a record, flattened by its keys or fields."""
+    return isinstance(value, Mapping) or (dataclasses.is_dataclass(value) and not isinstance(value, type))
+
+
+def _flatten(value: Any, path: str, fields: Dict[str, Any]) -> None:
+    """
+    Flatten record into dotted paths of its leaf values.
+
+    Mappings (e.g. driver nodes) are flattened by keys, records by fields except device instance ID,
+    and lists and tuples of mappings or records (e.g. frozen driver nodes) by index.
+    Field of nested record named like the field holding it is not repeated in path,
+    e.g. resources.resources is flattened to resources. Other lists and tuples are leaf values.
+
+    :param value: value to flatten
+    :param path: dotted path of value
+    :param fields: flattened fields to fill
+    """
+    if isinstance(value, Mapping):
+        for key, item in value.items():
+            _flatten(item, f"{path}.{key}" if path else str(key), fields)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        parent = path.rsplit(".", 1)[-1]
+        for record_field in dataclasses.fields(value):
+            if record_field.name in _KEY_FIELDS:
+                continue
+            if record_field.name == parent:
+                child_path = path
+            else:
+                child_path = f"{path}.{record_field.name}" if path else record_field.name
+            _flatten(getattr(value, record_field.name), child_path, fields)
+    elif isinstance(value, (list, tuple)) and value and all(_is_record(item) for item in value):
+        for index, item in enumerate(value):
+            _flatten(item, f"{path}.{index}" if path else str(index), fields)
+    elif isinstance(value, (list, tuple)):
+        fields[path] = list(value)
+    else:
+        fields[path] = value
+
+
+def diff_field_changes(old: Any, new: Any) -> List[FieldChange]:
+    """
+    Compare two records of the same device field by field.
+
+    :param old: record before change
+    :param new: record after change
+    :return: changed fields, missing fields are reported with None value
+    """
+    old_fields, new_fields = {}, {}
+    _flatten(old, "", old_fields)
+    _flatten(new, "", new_fields)
+    changes = [
+        FieldChange(path, value, new_fields.get(path))
+        for path, value in old_fields.items()
+        if new_fields.get(path) != value
+    ]
+    changes.extend(FieldChange(path, None, value) for path, value in new_fields.items() if path not in old_fields)
+    return changes
+
+
+def diff_inventories(old: Iterable[Any], new: Iterable[Any]) -> InventoryDiff:
+    """
+    Compare two inventories of devices keyed by device instance ID in linear time.
+
+    Works with results of Devcon.snapshot, find_devices, get_hwids, get_drivernodes, get_driverfiles, get_resources
+    and their frozen or lazy variants, as long as both inventories hold the same type of records.
+
+    :param old: records before change, e.g. before rescan_devices, update_drivers or reboot
+    :param new: records after change
+    :return: added and removed records in order of their inventory, modified devices in order of new inventory
+    """
+    old_records = {_record_key(record): record for record in old}
+    new_records = {_record_key(record): record for record in new}
+    inventory_diff = InventoryDiff()
+    for key, record in new_records.items():
+        old_record = old_records.get(key)
+        if old_record is None:
+            inventory_diff.added.append(record)
+            continue
+        changes = diff_field_changes(old_record, record)
+        if changes:
+            device_instance_id = getattr(record, "device_instance_id", None) or record.device_pnp
+            inventory_diff.modified.append(DeviceChange(device_instance_id, old_record, record, changes))
+    inventory_diff.removed = [record for key, record in old_records.items() if key not in new_records]
+    return inventory_diff
@@ -0,0 +1,83 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for selecting drivers from driver nodes of many devices in a single pass."""
+
+import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from .parser import DriverNode
+
+# worse than any rank reported by devcon, ranks are 32-bit
+_UNKNOWN_RANK = 1 << 32
+
+
+def _device_driver_nodes(record: Any) -> Tuple[str, Iterator[DriverNode]]:
+    """
+    Get device ID and driver nodes of drivernodes record or of device snapshot.
+
+    :param record: DevconDriverNodes, FrozenDevconDriverNodes or DevconDeviceSnapshot
+    :return: device ID and driver nodes
+    """
+    device = getattr(record, "device_pnp", None) or record.device_instance_id
+    nodes = record.driver_nodes
+    if nodes is not None and hasattr(nodes, "driver_nodes"):
+        nodes = nodes.driver_nodes
+    if not nodes:
+        return device, iter(())
+    if isinstance(nodes, dict):
+        nodes = nodes.values()
+    return device, (node if isinstance(node, DriverNode) else DriverNode(**node) for node in nodes)
+
+
+def _matching_nodes(nodes: Iterator[DriverNode], provider: Optional[str]) -> Iterator[DriverNode]:
+    """Filter driver nodes by provider name, case-insensitive."""
+    if provider is None:
+        return nodes
+    return (node for node in nodes if node.provider_name and node.provider_name.lower() == provider)
+
+
+def driver_rank_key(node: DriverNode) -> Tuple[int, datetime.date, Tuple[int, ...]]:
+    """
+    Get key ordering driver nodes like Windows does when choosing driver to install, the best is the greatest.
+
+    Lower rank wins, ties are broken by newer date, then by higher version. Unknown values lose.
+
+    :param node: driver node
+    :return: comparable key
+    """
+    rank = node.rank
+    return (-(_UNKNOWN_RANK if rank is None else rank), node.date or datetime.date.min, node.version)
+
+
+def select_best_driver(records: Iterable[Any], provider: Optional[str] = None) -> Dict[str, Optional[DriverNode]]:
+    """
+    Select best driver node of each device: lowest rank, then newest date, then highest version.
+
+    :param records: DevconDriverNodes, FrozenDevconDriverNodes or DevconDeviceSnapshot records,
+                    e.g. result of get_drivernodes or snapshot
+    :param provider: consider only driver nodes of this provider, case-insensitive, None for all
+    :return: best driver node for each device ID, None if device has no (matching) driver nodes
+    """
+    provider = provider.lower() if provider is not None else None
+    best = {}
+    for record in records:
+        device, nodes = _device_driver_nodes(record)
+        best[device] = max(_matching_nodes(nodes, provider), key=driver_rank_key, default=None)
+    return best
+
+
+def newest_version(records: Iterable[Any], provider: Optional[str] = None) -> Dict[str, Optional[Tuple[int, ...]]]:
+    """
+    Get the highest driver version available for each device, e.g. to check version compliance.
+
+    :param records: DevconDriverNodes, FrozenDevconDriverNodes or DevconDeviceSnapshot records,
+                    e.g. result of get_drivernodes or snapshot
+    :param provider: consider only driver nodes of this provider, case-insensitive, None for all
+    :return: highest version as tuple of ints for each device ID, None if device has no (matching) driver nodes
+    """
+    provider = provider.lower() if provider is not None else None
+    newest = {}
+    for record in records:
+        device, nodes = _device_driver_nodes(record)
+        newest[device] = max((node.version for node in _matching_nodes(nodes, provider)), default=None)
+    return newest
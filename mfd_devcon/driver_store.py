@@ -0,0 +1,123 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for indexed third-party driver packages of the driver store enumerated by Devcon."""
+
+from collections import defaultdict
+from pathlib import PureWindowsPath
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .parser import DevconDriverPackage, parse_driver_version
+
+
+class DriverPackageIndex:
+    """
+    Driver packages from a single devcon dp_enum, indexed for constant time lookups.
+
+    Indexes: published name (oemNN.inf), provider, class and version, all case-insensitive.
+    Versions are compared numerically, so 1.10.0.0 is newer than 1.9.0.0 and 1.2 matches 1.2.0.0.
+    """
+
+    def __init__(self, packages: Iterable[DevconDriverPackage]):
+        """
+        Build indexes.
+
+        :param packages: driver packages from devcon dp_enum
+        """
+        self._packages: List[DevconDriverPackage] = list(packages)
+        self._by_inf: Dict[str, DevconDriverPackage] = {}
+        self._by_provider: Dict[str, List[DevconDriverPackage]] = defaultdict(list)
+        self._by_class: Dict[str, List[DevconDriverPackage]] = defaultdict(list)
+        self._by_version: Dict[Tuple[int, ...], List[DevconDriverPackage]] = defaultdict(list)
+        for package in self._packages:
+            self._by_inf[package.published_name.lower()] = package
+            self._by_provider[(package.provider or "").lower()].append(package)
+            self._by_class[(package.class_name or "").lower()].append(package)
+            self._by_version[self._normalized_version(package.driver_version)].append(package)
+
+    @staticmethod
+    def _normalized_version(version: Optional[str]) -> Tuple[int, ...]:
+        """Get version key without trailing zeros, so 1.2 and 1.2.0.0 are the same version."""
+        key = list(parse_driver_version(version))
+        while key and key[-1] == 0:
+            key.pop()
+        return tuple(key)
+
+    def __len__(self) -> int:
+        return len(self._packages)
+
+    def __iter__(self) -> Iterator[DevconDriverPackage]:
+        return iter(self._packages)
+
+    def __contains__(self, published_name: str) -> bool:
+        return self.by_inf(published_name) is not None
+
+    def by_inf(self, published_name: str) -> Optional[DevconDriverPackage]:
+        """
+        Get driver package by its published name.
+
+        :param published_name: published INF name, e.g. oem12.inf, or its path, case-insensitive
+        :return: driver package or None if not found
+        """
+        return self._by_inf.get(PureWindowsPath(published_name.strip()).name.lower())
+
+    def by_provider(self, provider: str) -> List[DevconDriverPackage]:
+        """
+        Get driver packages of provider.
+
+        :param provider: provider name, e.g. Intel, case-insensitive
+        :return: matching driver packages, in enumeration order
+        """
+        return list(self._by_provider.get(provider.strip().lower(), []))
+
+    def by_class(self, class_name: str) -> List[DevconDriverPackage]:
+        """
+        Get driver packages of device setup class.
+
+        :param class_name: class description reported by dp_enum, e.g. Network adapters, case-insensitive
+        :return: matching driver packages, in enumeration order
+        """
+        return list(self._by_class.get(class_name.strip().lower(), []))
+
+    def by_version(self, version: str) -> List[DevconDriverPackage]:
+        """
+        Get driver packages of driver version.
+
+        :param version: driver version, e.g. 1.2.30.4
+        :return: matching driver packages, in enumeration order
+        """
+        return list(self._by_version.get(self._normalized_version(version), []))
+
+    def find(
+        self, provider: Optional[str] = None, class_name: Optional[str] = None, version: Optional[str] = None
+    ) -> List[DevconDriverPackage]:
+        """
+        Get driver packages matching all given criteria.
+
+        :param provider: provider name, case-insensitive, None for any
+        :param class_name: class description, case-insensitive, None for any
+        :param version: driver version, None for any
+        :return: matching driver packages, in enumeration order
+        """
+        candidates = self._packages
+        if provider is not None:
+            candidates = self._by_provider.get(provider.strip().lower(), [])
+        if class_name is not None:
+            in_class = {id(package) for package in self._by_class.get(class_name.strip().lower(), [])}
+            candidates = [package for package in candidates if id(package) in in_class]
+        if version is not None:
+            in_version = {id(package) for package in self._by_version.get(self._normalized_version(version), [])}
+            candidates = [package for package in candidates if id(package) in in_version]
+        return list(candidates)
+
+    def newest(self, provider: Optional[str] = None, class_name: Optional[str] = None) -> Optional[DevconDriverPackage]:
+        """
+        Get driver package with the highest driver version.
+
+        :param provider: provider name, case-insensitive, None for any
+        :param class_name: class description, case-insensitive, None for any
+        :return: newest matching driver package, first in enumeration order on ties, None if nothing matches
+        """
+        candidates = self.find(provider=provider, class_name=class_name)
+        if not candidates:
+            return None
+        return max(candidates, key=lambda package: parse_driver_version(package.driver_version))
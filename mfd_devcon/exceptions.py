@@ -20,3 +20,11 @@ class DevconExecutionError(DevconException, subprocess.CalledProcessError):
 
 class DevconParserException(Exception):
     """Handle Devcon parser exceptions."""
+
+
+class DevconWaitTimeout(DevconException):
+    """Handle devices not reaching awaited state before deadline."""
+
+
+class DevconReplayError(DevconException):
+    """Handle commands missing in replayed devcon corpus."""
@@ -0,0 +1,262 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for running Devcon operations across many hosts in parallel."""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
+
+from mfd_common_libs import log_levels
+
+from .base import Devcon
+from .cache import DevconCache
+from .exceptions import DevconException
+from .instrumentation import MetricsSink
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+
+
+class DevconFleetTimeout(DevconException):
+    """Handle host not finishing Devcon operation within timeout."""
+
+
+@dataclass
+class DevconFleetResult:
+    """Structure for result of Devcon operation on a host."""
+
+    connection: "Connection"
+    value: Any = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Check if operation succeeded on host."""
+        return self.error is None
+
+
+class DevconFleetHostBusy(DevconFleetTimeout):
+    """Handle host still running Devcon operation which timed out in one of previous runs."""
+
+
+class _HostCall:
+    """Call of Devcon operation on a host, started when it is handed to a free worker thread."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.started = time.monotonic()
+
+
+class DevconFleet:
+    """
+    Run Devcon operations across many hosts in parallel.
+
+    Every host gets its own Devcon object, created on first use in a worker thread. Calls are started only when
+    a worker is free, at most max_workers at the same time, on one thread pool shared by all runs. Host which does
+    not finish within timeout, counted from start of its call, gets DevconFleetTimeout result and run does not wait
+    for it. Its call cannot be interrupted and keeps running in background, holding its thread until it finishes,
+    and another thread of the pool replaces it, so hung hosts do not starve the others. Until then the host is busy
+    and following runs give it DevconFleetHostBusy result instead of starting another operation, so the pool never
+    has more than max_workers threads plus one per busy host.
+
+    Usage example:
+    >>> fleet = DevconFleet(connections, max_workers=16, timeout=120)
+    >>> for result in fleet.run("find_devices", pattern="=net"):
+    >>>     print(result.connection, result.value if result.ok else result.error)
+    >>> fleet.close()
+    """
+
+    def __init__(
+        self,
+        connections: Iterable["Connection"],
+        absolute_path_to_binary_dir: Optional[Union[Path, str]] = None,
+        cache_factory: Optional[Callable[[], DevconCache]] = None,
+        *,
+        max_workers: int = 8,
+        timeout: Optional[float] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+    ):
+        """
+        Initialize fleet.
+
+        :param connections: Connection objects of hosts
+        :param absolute_path_to_binary_dir: absolute path to devcon binary directory, same on every host
+        :param cache_factory: function creating cache for each host, None to disable caching
+        :param max_workers: maximum number of hosts running operation at the same time
+        :param timeout: default time in seconds for host to finish operation, None to wait forever
+        :param metrics_sink: metrics sink shared by Devcon objects of all hosts, calls are labeled by host
+        """
+        if max_workers < 1:
+            raise ValueError(f"Invalid max_workers: {max_workers}. At least one worker is required")
+        self.connections = list(connections)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._absolute_path_to_binary_dir = absolute_path_to_binary_dir
+        self._cache_factory = cache_factory
+        self._metrics_sink = metrics_sink
+        self._devcons: Dict[int, Devcon] = {}
+        self._devcons_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._busy: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "DevconFleet":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut down worker threads of fleet.
+
+        :param wait: wait for operations still running on busy hosts
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    @property
+    def busy(self) -> List["Connection"]:
+        """Connections of hosts still running operation which timed out."""
+        with self._lock:
+            return [self.connections[index] for index in sorted(self._busy)]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get thread pool shared by all runs, create it on first use.
+
+        Run keeps at most max_workers calls in progress, the remaining threads replace ones held by busy hosts.
+
+        :return: thread pool with max_workers threads and one more for every host
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers + len(self.connections), thread_name_prefix="mfd_devcon_fleet"
+                )
+            return self._executor
+
+    def _mark_busy(self, index: int, future: Future) -> None:
+        """
+        Mark host as busy until its timed out call finishes and gives worker thread back.
+
+        :param index: index of host connection
+        :param future: future of timed out call
+        """
+
+        def _finished(_: Future) -> None:
+            with self._lock:
+                if self._busy.get(index) is future:
+                    del self._busy[index]
+
+        with self._lock:
+            self._busy[index] = future
+        future.add_done_callback(_finished)
+
+    @property
+    def devcons(self) -> List[Optional[Devcon]]:
+        """Devcon objects of hosts, None for hosts not used yet or whose Devcon creation failed."""
+        return [self._devcons.get(index) for index in range(len(self.connections))]
+
+    def _get_devcon(self, index: int) -> Devcon:
+        """
+        Get Devcon object of host, create it on first use.
+
+        :param index: index of host connection
+        :return: Devcon object
+        """
+        devcon = self._devcons.get(index)
+        if devcon is None:
+            devcon = Devcon(
+                connection=self.connections[index],
+                absolute_path_to_binary_dir=self._absolute_path_to_binary_dir,
+                cache=self._cache_factory() if self._cache_factory else None,
+                metrics_sink=self._metrics_sink,
+            )
+            with self._devcons_lock:
+                devcon = self._devcons.setdefault(index, devcon)
+        return devcon
+
+    def _call(self, host_call: _HostCall, operation: Union[str, Callable[..., Any]], args: tuple, kwargs: dict) -> Any:
+        """
+        Run operation on host in worker thread.
+
+        :param host_call: call details of host
+        :param operation: name of Devcon method or function taking Devcon object as first argument
+        :return: value returned by operation
+        """
+        devcon = self._get_devcon(host_call.index)
+        if isinstance(operation, str):
+            return getattr(devcon, operation)(*args, **kwargs)
+        return operation(devcon, *args, **kwargs)
+
+    def run(
+        self, operation: Union[str, Callable[..., Any]], *args, timeout: Optional[float] = ..., **kwargs
+    ) -> List[DevconFleetResult]:
+        """
+        Run Devcon operation on every host.
+
+        :param operation: name of Devcon method, e.g. find_devices, or function taking Devcon object as first argument
+        :param args: positional arguments of operation
+        :param timeout: time in seconds for host to finish operation, default is fleet timeout, None to wait forever
+        :param kwargs: keyword arguments of operation
+        :return: result of every host, in order of connections
+        """
+        timeout = self.timeout if timeout is ... else timeout
+        name = operation if isinstance(operation, str) else getattr(operation, "__name__", repr(operation))
+        logger.log(
+            level=log_levels.MODULE_DEBUG, msg=f"Run {name} on {len(self.connections)} hosts, timeout: {timeout}"
+        )
+        results = [DevconFleetResult(connection=connection) for connection in self.connections]
+        executor = self._get_executor()
+        with self._lock:
+            busy = set(self._busy)
+        queued = []
+        for index in range(len(self.connections)):
+            if index in busy:
+                results[index].error = DevconFleetHostBusy(
+                    f"{name} not started on {self.connections[index]}, previous operation still running"
+                )
+            else:
+                queued.append(index)
+        queued.reverse()
+        pending: Dict[Future, _HostCall] = {}
+        while pending or queued:
+            while queued and len(pending) < self.max_workers:
+                host_call = _HostCall(queued.pop())
+                pending[executor.submit(self._call, host_call, operation, args, kwargs)] = host_call
+            wait_timeout = None
+            if timeout is not None:
+                now = time.monotonic()
+                wait_timeout = max(min(call.started + timeout - now for call in pending.values()), 0)
+            done, _ = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                host_call = pending.pop(future)
+                result = results[host_call.index]
+                result.duration = time.monotonic() - host_call.started
+                try:
+                    result.value = future.result()
+                except Exception as e:
+                    result.error = e
+            if timeout is not None:
+                now = time.monotonic()
+                for future, host_call in list(pending.items()):
+                    if now - host_call.started >= timeout:
+                        del pending[future]
+                        self._mark_busy(host_call.index, future)
+                        results[host_call.index].duration = now - host_call.started
+                        results[host_call.index].error = DevconFleetTimeout(
+                            f"{name} did not finish within {timeout} seconds on {self.connections[host_call.index]}"
+                        )
+        failed = sum(not result.ok for result in results)
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"{name} finished, failed on {failed} hosts")
+        return results
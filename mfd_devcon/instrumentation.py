@@ -0,0 +1,408 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for per-call instrumentation of Devcon: metrics records, sinks and exporters."""
+
+import contextvars
+import functools
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from mfd_common_libs import log_levels
+
+logger = logging.getLogger(__name__)
+
+MetricsSink = Callable[["DevconCallMetrics"], None]
+
+_current_call: "contextvars.ContextVar[Optional[DevconCallMetrics]]" = contextvars.ContextVar(
+    "mfd_devcon_current_call", default=None
+)
+_QUANTILES = (50, 90, 99)
+_DURATION_FIELDS = ("duration", "execution_time", "parse_time")
+
+
+@dataclass(slots=True)
+class DevconCallMetrics:
+    """
+    Structure for metrics of a single Devcon method call.
+
+    execution_time, stdout_bytes and round_trips cover all remote executions of the call, cache hits cost none.
+    parse_time covers DevconParser calls made before the method returned, so parsing done later
+    by iter_* generators and lazy lists is not included.
+    """
+
+    method: str
+    host: Optional[str] = None
+    subcommands: List[str] = field(default_factory=list)
+    duration: float = 0.0
+    execution_time: float = 0.0
+    round_trips: int = 0
+    stdout_bytes: int = 0
+    parse_time: float = 0.0
+    device_count: Optional[int] = None
+    exception: Optional[str] = None
+
+    @property
+    def subcommand(self) -> str:
+        """Devcon subcommands executed by the call, joined with +, e.g. find+hwids."""
+        return "+".join(self.subcommands)
+
+    def add_subcommand(self, subcommand: str) -> None:
+        """
+        Note devcon subcommand executed by the call.
+
+        :param subcommand: devcon subcommand, e.g. hwids
+        """
+        if subcommand not in self.subcommands:
+            self.subcommands.append(subcommand)
+
+
+def current_call() -> Optional[DevconCallMetrics]:
+    """
+    Get metrics of instrumented Devcon call in progress in current thread or task.
+
+    :return: metrics being collected, None if no instrumented call is in progress
+    """
+    return _current_call.get()
+
+
+def note_command(metrics: DevconCallMetrics, command: str, tool_exec: str) -> None:
+    """
+    Note devcon subcommands of command line, including commands chained with &.
+
+    :param metrics: metrics of instrumented call
+    :param command: executed command line
+    :param tool_exec: path to devcon executable
+    """
+    for single_command in command.split(" & "):
+        single_command = single_command.strip()
+        if not single_command.startswith(tool_exec):
+            continue
+        arguments = [argument for argument in single_command[len(tool_exec) :].split() if argument.lower() != "/r"]
+        if arguments:
+            metrics.add_subcommand(arguments[0].lower())
+
+
+@contextmanager
+def measure_execution(command: str, tool_exec: str) -> Iterator[Optional[DevconCallMetrics]]:
+    """
+    Account remote execution of command to metrics of instrumented call in progress.
+
+    :param command: command line to execute
+    :param tool_exec: path to devcon executable
+    :return: context yielding metrics to add stdout size to, None if no instrumented call is in progress
+    """
+    metrics = _current_call.get()
+    if metrics is None:
+        yield None
+        return
+    note_command(metrics, command, tool_exec)
+    start = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.execution_time += time.perf_counter() - start
+        metrics.round_trips += 1
+
+
+def _device_count(result: Any) -> Optional[int]:
+    """Get number of devices of method result, None for raw outputs and generators."""
+    if isinstance(result, (str, bytes)) or not hasattr(result, "__len__"):
+        return None
+    return len(result)
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Decorate Devcon method to report its DevconCallMetrics to metrics sink of the object.
+
+    Nested instrumented calls (e.g. get_device_id calling find_devices) are accounted to the outermost call.
+    Without metrics sink the method is called directly. Failure of the sink is logged and never replaces
+    result or exception of the method.
+
+    :param method: Devcon method
+    :return: decorated method
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args, **kwargs) -> Any:
+        sink = getattr(self, "_metrics_sink", None)
+        if sink is None or _current_call.get() is not None:
+            return method(self, *args, **kwargs)
+        host = getattr(self._connection, "ip", None)
+        metrics = DevconCallMetrics(method=method.__name__, host=None if host is None else str(host))
+        token = _current_call.set(metrics)
+        start = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+            metrics.device_count = _device_count(result)
+            return result
+        except Exception as e:
+            metrics.exception = type(e).__name__
+            raise
+        finally:
+            metrics.duration = time.perf_counter() - start
+            _current_call.reset(token)
+            try:
+                sink(metrics)
+            except Exception as e:
+                logger.log(
+                    level=log_levels.MODULE_DEBUG,
+                    msg=f"Metrics sink {sink!r} failed for {metrics.method}: {type(e).__name__}: {e}",
+                )
+
+    return wrapper
+
+
+class TimedParser:
+    """Proxy of DevconParser adding duration of each parser call to metrics of instrumented call in progress."""
+
+    def __init__(self, parser: Any):
+        """
+        Initialize proxy.
+
+        :param parser: DevconParser object
+        """
+        self._parser = parser
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._parser, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def timed(*args, **kwargs) -> Any:
+            metrics = _current_call.get()
+            if metrics is None:
+                return attribute(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                metrics.parse_time += time.perf_counter() - start
+
+        return timed
+
+
+def percentile(values: Sequence[float], quantile: float) -> float:
+    """
+    Calculate percentile with linear interpolation between closest ranks.
+
+    :param values: sorted values
+    :param quantile: percentile in range [0, 100]
+    :return: percentile value, NaN for no values
+    """
+    if not values:
+        return math.nan
+    position = (len(values) - 1) * quantile / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class InMemoryMetrics:
+    """Metrics sink keeping recent calls in memory and reporting their percentiles, safe to share between threads."""
+
+    def __init__(self, max_calls: int = 10000):
+        """
+        Initialize sink.
+
+        :param max_calls: number of most recent calls kept, older ones are dropped
+        """
+        self._calls: Deque[DevconCallMetrics] = deque(maxlen=max_calls)
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics: DevconCallMetrics) -> None:
+        with self._lock:
+            self._calls.append(metrics)
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def calls(self, method: Optional[str] = None, host: Optional[str] = None) -> List[DevconCallMetrics]:
+        """
+        Get recorded calls.
+
+        :param method: Devcon method name, None for all
+        :param host: host of connection, None for all
+        :return: calls from the oldest
+        """
+        with self._lock:
+            calls = list(self._calls)
+        return [
+            call for call in calls if (method is None or call.method == method) and (host is None or call.host == host)
+        ]
+
+    def percentiles(
+        self,
+        metric: str = "execution_time",
+        method: Optional[str] = None,
+        host: Optional[str] = None,
+        quantiles: Iterable[float] = _QUANTILES,
+    ) -> Dict[float, float]:
+        """
+        Get percentiles of metric over recorded calls.
+
+        :param metric: numeric field of DevconCallMetrics, e.g. execution_time, parse_time, stdout_bytes
+        :param method: Devcon method name, None for all
+        :param host: host of connection, None for all
+        :param quantiles: percentiles to calculate, in range [0, 100]
+        :return: value of each percentile, NaN if no calls were recorded
+        """
+        values = sorted(getattr(call, metric) for call in self.calls(method, host) if getattr(call, metric) is not None)
+        return {quantile: percentile(values, quantile) for quantile in quantiles}
+
+    def summary(self, quantiles: Iterable[float] = _QUANTILES) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize recorded calls per Devcon method.
+
+        :param quantiles: percentiles to calculate, in range [0, 100]
+        :return: for each method: calls, errors, total round_trips and stdout_bytes,
+                 and percentiles of duration, execution_time and parse_time, e.g. execution_time_p99
+        """
+        quantiles = tuple(quantiles)
+        by_method: Dict[str, List[DevconCallMetrics]] = {}
+        for call in self.calls():
+            by_method.setdefault(call.method, []).append(call)
+        summary = {}
+        for method, calls in by_method.items():
+            method_summary = {
+                "calls": len(calls),
+                "errors": sum(call.exception is not None for call in calls),
+                "round_trips": sum(call.round_trips for call in calls),
+                "stdout_bytes": sum(call.stdout_bytes for call in calls),
+            }
+            for metric in _DURATION_FIELDS:
+                values = sorted(getattr(call, metric) for call in calls)
+                for quantile in quantiles:
+                    method_summary[f"{metric}_p{quantile:g}"] = percentile(values, quantile)
+            summary[method] = method_summary
+        return summary
+
+
+def _labels(labels: Dict[str, Optional[str]]) -> str:
+    """Render Prometheus label set, escaping label values."""
+    rendered = []
+    for name, value in labels.items():
+        value = "" if value is None else str(value)
+        value = value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        rendered.append(f'{name}="{value}"')
+    return "{" + ",".join(rendered) + "}"
+
+
+def _number(value: float) -> str:
+    """Render sample value in Prometheus text format without losing precision."""
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    return repr(value)
+
+
+class PrometheusTextfileExporter:
+    """
+    Metrics sink exporting Devcon calls in Prometheus text format, for node_exporter textfile collector.
+
+    Counters (calls, errors, round trips, stdout bytes, devices) and _sum and _count of summaries of duration,
+    execution_time and parse_time are cumulative since creation of the exporter, quantiles of the summaries
+    are percentiles of recent calls kept by the aggregator.
+    File is replaced atomically every flush_every calls and on write().
+    """
+
+    def __init__(
+        self,
+        path: Union[Path, str],
+        aggregator: Optional[InMemoryMetrics] = None,
+        flush_every: int = 50,
+        quantiles: Iterable[float] = _QUANTILES,
+    ):
+        """
+        Initialize exporter.
+
+        :param path: path of .prom file in textfile collector directory
+        :param aggregator: aggregator of calls used for percentiles, new InMemoryMetrics if not provided
+        :param flush_every: number of calls after which file is rewritten, 0 to write only on write()
+        :param quantiles: percentiles reported in summaries, in range [0, 100]
+        """
+        self.path = Path(path)
+        self.aggregator = aggregator if aggregator is not None else InMemoryMetrics()
+        self.flush_every = flush_every
+        self.quantiles = tuple(quantiles)
+        self._counters: Dict[Tuple[str, str, str, str], Dict[str, float]] = {}
+        self._totals: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics: DevconCallMetrics) -> None:
+        self.aggregator(metrics)
+        key = (metrics.host or "", metrics.method, metrics.subcommand, metrics.exception or "")
+        with self._lock:
+            counters = self._counters.setdefault(key, {"calls": 0, "round_trips": 0, "stdout_bytes": 0, "devices": 0})
+            counters["calls"] += 1
+            counters["round_trips"] += metrics.round_trips
+            counters["stdout_bytes"] += metrics.stdout_bytes
+            counters["devices"] += metrics.device_count or 0
+            totals = self._totals.setdefault((metrics.host or "", metrics.method), {"count": 0})
+            totals["count"] += 1
+            for metric in _DURATION_FIELDS:
+                totals[metric] = totals.get(metric, 0.0) + getattr(metrics, metric)
+            self._pending += 1
+            flush = bool(self.flush_every) and self._pending >= self.flush_every
+        if flush:
+            self.write()
+
+    def render(self) -> str:
+        """
+        Render metrics in Prometheus text exposition format.
+
+        :return: text of .prom file
+        """
+        lines = []
+        with self._lock:
+            counters = dict(self._counters)
+            totals = {key: dict(values) for key, values in self._totals.items()}
+        for name, counter, description in (
+            ("devcon_calls_total", "calls", "Devcon method calls."),
+            ("devcon_round_trips_total", "round_trips", "Remote executions of devcon commands."),
+            ("devcon_stdout_bytes_total", "stdout_bytes", "Bytes of devcon output received."),
+            ("devcon_devices_total", "devices", "Devices returned by devcon method calls."),
+        ):
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            for (host, method, subcommand, exception), values in sorted(counters.items()):
+                labels = {"host": host, "method": method, "subcommand": subcommand, "exception": exception}
+                lines.append(f"{name}{_labels(labels)} {_number(values[counter])}")
+        calls = self.aggregator.calls()
+        groups: Dict[Tuple[str, str], List[DevconCallMetrics]] = {}
+        for call in calls:
+            groups.setdefault((call.host or "", call.method), []).append(call)
+        for metric in _DURATION_FIELDS:
+            name = f"devcon_{metric}_seconds"
+            lines.append(f"# HELP {name} {metric.replace('_', ' ').capitalize()} of devcon method calls in seconds.")
+            lines.append(f"# TYPE {name} summary")
+            for host, method in sorted(groups.keys() | totals.keys()):
+                values = sorted(getattr(call, metric) for call in groups.get((host, method), ()))
+                for quantile in self.quantiles:
+                    labels = {"host": host, "method": method, "quantile": f"{quantile / 100:g}"}
+                    lines.append(f"{name}{_labels(labels)} {_number(percentile(values, quantile))}")
+                if (host, method) in totals:
+                    labels = {"host": host, "method": method}
+                    lines.append(f"{name}_sum{_labels(labels)} {_number(totals[host, method][metric])}")
+                    lines.append(f"{name}_count{_labels(labels)} {totals[host, method]['count']}")
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        """Write metrics to the file atomically, so the collector never reads a partial file."""
+        text = self.render()
+        temporary_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary_path.write_text(text)
+        os.replace(temporary_path, self.path)
+        with self._lock:
+            self._pending = 0
@@ -0,0 +1,132 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for indexed inventory of devices enumerated by Devcon."""
+
+import bisect
+import difflib
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .parser import DevconDevices
+
+
+class DeviceInventory:
+    """
+    Devices from a single enumeration, indexed for constant time lookups.
+
+    Indexes: exact description, device instance ID (case-insensitive), setup class (case-insensitive),
+    vendor ID, vendor and device ID, vendor, device and subsystem ID. Prefix and fuzzy description queries
+    use sorted and case-folded descriptions.
+    """
+
+    def __init__(self, devices: Iterable[DevconDevices], setup_classes: Optional[Dict[str, str]] = None):
+        """
+        Build indexes.
+
+        :param devices: devices from devcon find or listclass
+        :param setup_classes: setup class of device instance IDs, devices without it are not indexed by class
+        """
+        self._devices: List[DevconDevices] = list(devices)
+        setup_classes = {device_id.upper(): setup_class for device_id, setup_class in (setup_classes or {}).items()}
+        self._by_name: Dict[str, List[DevconDevices]] = defaultdict(list)
+        self._by_instance_id: Dict[str, DevconDevices] = {}
+        self._by_class: Dict[str, List[DevconDevices]] = defaultdict(list)
+        self._by_ids: Dict[Tuple[Optional[str], ...], List[DevconDevices]] = defaultdict(list)
+        self._by_folded_name: Dict[str, List[DevconDevices]] = defaultdict(list)
+        for device in self._devices:
+            instance_id = device.device_instance_id.upper()
+            self._by_name[device.device_desc].append(device)
+            self._by_folded_name[(device.device_desc or "").casefold()].append(device)
+            self._by_instance_id[instance_id] = device
+            if instance_id in setup_classes:
+                self._by_class[setup_classes[instance_id].lower()].append(device)
+            pnp_id = device.pnp_id
+            if pnp_id.vendor is not None:
+                self._by_ids[(pnp_id.vendor,)].append(device)
+                self._by_ids[(pnp_id.vendor, pnp_id.device)].append(device)
+                self._by_ids[(pnp_id.vendor, pnp_id.device, pnp_id.subsystem)].append(device)
+        self._sorted_names: List[Tuple[str, int]] = sorted(
+            ((device.device_desc or "").casefold(), index) for index, device in enumerate(self._devices)
+        )
+        self._sorted_keys = [name for name, _ in self._sorted_names]
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def __iter__(self) -> Iterator[DevconDevices]:
+        return iter(self._devices)
+
+    def __contains__(self, device_instance_id: str) -> bool:
+        return device_instance_id.upper() in self._by_instance_id
+
+    def by_name(self, device_name: str) -> List[DevconDevices]:
+        """
+        Get devices with exactly matching description.
+
+        :param device_name: device description, surrounding whitespaces are ignored
+        :return: matching devices, in enumeration order
+        """
+        return list(self._by_name.get(device_name.strip(), []))
+
+    def by_instance_id(self, device_instance_id: str) -> Optional[DevconDevices]:
+        """
+        Get device by its instance ID.
+
+        :param device_instance_id: device instance ID, case-insensitive
+        :return: device or None if not found
+        """
+        return self._by_instance_id.get(device_instance_id.upper())
+
+    def by_class(self, class_name: str) -> List[DevconDevices]:
+        """
+        Get devices of setup class.
+
+        :param class_name: device setup class, case-insensitive
+        :return: devices of setup class, in enumeration order
+        """
+        return list(self._by_class.get(class_name.lower(), []))
+
+    def by_ids(self, vendor: str, device: Optional[str] = None, subsystem: Optional[str] = None) -> List[DevconDevices]:
+        """
+        Get devices by vendor, device and subsystem IDs of PnpId, e.g. VEN_8086&DEV_1592&SUBSYS_00028086.
+
+        :param vendor: vendor ID, e.g. 8086
+        :param device: device ID, e.g. 1592, None for any
+        :param subsystem: subsystem ID, e.g. 00028086, requires device
+        :return: matching devices, in enumeration order
+        """
+        if subsystem is not None and device is None:
+            raise AttributeError("Please provide input: device together with subsystem")
+        key = tuple(value.upper() for value in (vendor, device, subsystem) if value is not None)
+        return list(self._by_ids.get(key, []))
+
+    def startswith(self, prefix: str) -> List[DevconDevices]:
+        """
+        Get devices with description starting with prefix.
+
+        :param prefix: description prefix, case-insensitive
+        :return: matching devices, sorted by description
+        """
+        prefix = prefix.strip().casefold()
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+        matches = []
+        for position in range(start, len(self._sorted_names)):
+            name, index = self._sorted_names[position]
+            if not name.startswith(prefix):
+                break
+            matches.append(self._devices[index])
+        return matches
+
+    def search(self, device_name: str, limit: int = 5, cutoff: float = 0.6) -> List[DevconDevices]:
+        """
+        Get devices with description similar to device_name.
+
+        :param device_name: approximate device description, case-insensitive
+        :param limit: maximum number of distinct descriptions to match
+        :param cutoff: minimal similarity ratio in range [0, 1]
+        :return: matching devices, best matches first
+        """
+        close_names = difflib.get_close_matches(
+            device_name.strip().casefold(), list(self._by_folded_name), n=limit, cutoff=cutoff
+        )
+        return [device for name in close_names for device in self._by_folded_name[name]]
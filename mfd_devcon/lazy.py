@@ -0,0 +1,128 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for lazily parsed Devcon outputs."""
+
+import re
+from collections.abc import Sequence
+from typing import Callable, Generic, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from .exceptions import DevconParserException
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_HEADER_RE = re.compile(r"^[^\s]+[ \t]*\r?$", re.MULTILINE)
+_TRAILER_TEXT = "matching device(s) found"
+_TRAILER_RE = re.compile(r"[ \t]*(?P<num_devices>[0-9]+) matching device\(s\) found")
+
+
+class LazyDeviceList(Sequence, Generic[T]):
+    """
+    Read-only list of devices parsed from devcon output on demand.
+
+    len() is taken from "N matching device(s) found." trailer without touching device blocks.
+    On first item access, boundaries of device blocks are indexed in a single pass over output
+    and their number is validated against the trailer. Every block is parsed only when accessed, then cached.
+    """
+
+    def __init__(self, output: str, parse_block: Callable[[str, List[str]], T], command: str):
+        """
+        Initialize lazy list.
+
+        :param output: devcon command raw output
+        :param parse_block: function parsing device instance ID and stripped lines of its block into data structure
+        :param command: devcon command which produced the output, used in error messages
+        """
+        self._output = output
+        self._parse_block = parse_block
+        self._command = command
+        self._num_devices: Optional[int] = None
+        self._trailer_start: Optional[int] = None
+        self._blocks: Optional[List[Tuple[str, int, int]]] = None
+        self._records: List[Optional[T]] = []
+
+    def _read_trailer(self) -> int:
+        """
+        Find number of devices in output trailer.
+
+        :return: number of devices
+        :raises DevconParserException: if trailer is missing
+        """
+        if self._num_devices is None:
+            position = self._output.rfind(_TRAILER_TEXT)
+            trailer = (
+                _TRAILER_RE.match(self._output, self._output.rfind("\n", 0, position) + 1) if position >= 0 else None
+            )
+            if trailer is None:
+                raise DevconParserException(f"ERROR while parsing Devcon output for {self._command}")
+            self._num_devices = int(trailer.group("num_devices"))
+            self._trailer_start = trailer.start()
+        return self._num_devices
+
+    def _index(self) -> List[Tuple[str, int, int]]:
+        """
+        Index device instance ID, start and end offset of each device block.
+
+        :return: index of device blocks
+        :raises DevconParserException: if trailer is missing or number of blocks does not match it
+        """
+        if self._blocks is None:
+            num_devices = self._read_trailer()
+            headers = list(_HEADER_RE.finditer(self._output, 0, self._trailer_start))
+            ends = [header.start() for header in headers[1:]] + [self._trailer_start]
+            blocks = [(header.group().strip(), header.end(), end) for header, end in zip(headers, ends)]
+            if len(blocks) != num_devices:
+                raise DevconParserException(f"ERROR while parsing Devcon output for {self._command}")
+            self._blocks = blocks
+            self._records = [None] * len(blocks)
+        return self._blocks
+
+    @property
+    def parsed(self) -> int:
+        """Number of device blocks parsed so far."""
+        return sum(record is not None for record in self._records)
+
+    def validate(self) -> None:
+        """
+        Validate number of device blocks against output trailer without parsing them.
+
+        :raises DevconParserException: if trailer is missing or number of blocks does not match it
+        """
+        self._index()
+
+    def map(self, func: Callable[[T], R]) -> "LazyDeviceList[R]":
+        """
+        Get lazy list applying func to every device when it is parsed.
+
+        :param func: function transforming parsed data structure
+        :return: new lazy list over the same output
+        """
+        parse_block = self._parse_block
+        return LazyDeviceList(self._output, lambda device, lines: func(parse_block(device, lines)), self._command)
+
+    def __len__(self) -> int:
+        return self._read_trailer()
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        blocks = self._index()
+        if isinstance(index, slice):
+            return [self[position] for position in range(len(blocks))[index]]
+        position = range(len(blocks))[index]
+        record = self._records[position]
+        if record is None:
+            device, start, end = blocks[position]
+            lines = [line.strip() for line in self._output[start:end].splitlines() if line.strip()]
+            record = self._records[position] = self._parse_block(device, lines)
+        return record
+
+    def __iter__(self) -> Iterator[T]:
+        for position in range(len(self._index())):
+            yield self[position]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} devices, {self.parsed} parsed)"
@@ -0,0 +1,145 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for cheap, size-bounded debug logging of devcon commands and raw outputs."""
+
+import itertools
+import logging
+import threading
+from dataclasses import dataclass
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Optional, Union
+
+from mfd_common_libs import log_levels
+
+CAPTURE_LOGGER_NAME = "mfd_devcon.capture"
+
+_lock = threading.Lock()
+_sample_counter = itertools.count()
+_capture_handler: Optional[RotatingFileHandler] = None
+
+
+@dataclass(frozen=True, slots=True)
+class OutputLogPolicy:
+    """
+    Structure for policy of logging devcon commands and raw outputs.
+
+    max_chars bounds each logged command or output, keeping its head and tail (None logs whole text).
+    Only every sample_every-th raw output is logged, others are reported by size only.
+    capture_file, if set, receives every full raw output,
+    rotated at capture_max_bytes with capture_backup_count backups.
+    """
+
+    max_chars: Optional[int] = 2048
+    sample_every: int = 1
+    capture_file: Optional[Union[Path, str]] = None
+    capture_max_bytes: int = 10 * 1024 * 1024
+    capture_backup_count: int = 3
+
+    def __post_init__(self):
+        if self.max_chars is not None and self.max_chars < 0:
+            raise AttributeError(f"Invalid max_chars: {self.max_chars}. Must be non-negative or None")
+        if self.sample_every < 1:
+            raise AttributeError(f"Invalid sample_every: {self.sample_every}. Must be at least 1")
+
+
+_policy = OutputLogPolicy()
+
+
+class BoundedText:
+    """Log message truncated to head and tail of text, built only when a handler emits the record."""
+
+    __slots__ = ("prefix", "text", "max_chars")
+
+    def __init__(self, prefix: str, text: str, max_chars: Optional[int]):
+        """
+        Initialize message.
+
+        :param prefix: text preceding the bounded part, never truncated
+        :param text: text to be bounded
+        :param max_chars: maximum number of characters of text kept, None for all
+        """
+        self.prefix = prefix
+        self.text = text
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        text = self.text
+        if self.max_chars is not None and len(text) > self.max_chars:
+            head = self.max_chars // 2
+            tail = self.max_chars - head
+            omitted = len(text) - self.max_chars
+            text = f"{text[:head]}\n... [{omitted} of {len(self.text)} chars truncated] ...\n{text[len(text) - tail:]}"
+        return f"{self.prefix}{text}"
+
+
+def configure_output_logging(policy: Optional[OutputLogPolicy] = None) -> OutputLogPolicy:
+    """
+    Set policy of logging devcon commands and raw outputs, for all Devcon objects.
+
+    :param policy: new policy, default policy if not provided
+    :return: previous policy
+    """
+    global _policy, _capture_handler
+    policy = policy if policy is not None else OutputLogPolicy()
+    capture_logger = logging.getLogger(CAPTURE_LOGGER_NAME)
+    with _lock:
+        previous, _policy = _policy, policy
+        if _capture_handler is not None:
+            capture_logger.removeHandler(_capture_handler)
+            _capture_handler.close()
+            _capture_handler = None
+        if policy.capture_file is not None:
+            _capture_handler = RotatingFileHandler(
+                policy.capture_file,
+                maxBytes=policy.capture_max_bytes,
+                backupCount=policy.capture_backup_count,
+                encoding="utf-8",
+            )
+            _capture_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            capture_logger.addHandler(_capture_handler)
+            capture_logger.setLevel(logging.DEBUG)
+            capture_logger.propagate = False
+    return previous
+
+
+def get_output_log_policy() -> OutputLogPolicy:
+    """
+    Get current policy of logging devcon commands and raw outputs.
+
+    :return: current policy
+    """
+    return _policy
+
+
+def log_command(logger: logging.Logger, message: str, command: str) -> None:
+    """
+    Log devcon command line, bounded by policy, if logger is enabled for MODULE_DEBUG level.
+
+    :param logger: logger of module
+    :param message: description of command, e.g. Enabling devices using command
+    :param command: command line
+    """
+    if logger.isEnabledFor(log_levels.MODULE_DEBUG):
+        logger.log(level=log_levels.MODULE_DEBUG, msg=BoundedText(f"{message}: ", command, _policy.max_chars))
+
+
+def log_output(logger: logging.Logger, output: str, command: str) -> None:
+    """
+    Log devcon raw output according to policy, sending full output to capture file if configured.
+
+    Nothing is formatted when logger is not enabled for MODULE_DEBUG level and no capture file is set.
+
+    :param logger: logger of module
+    :param output: devcon command raw output
+    :param command: devcon command which produced output, e.g. hwids
+    """
+    policy = _policy
+    if policy.capture_file is not None:
+        logging.getLogger(CAPTURE_LOGGER_NAME).debug("devcon %s output:\n%s", command, output)
+    if not logger.isEnabledFor(log_levels.MODULE_DEBUG):
+        return
+    if policy.sample_every > 1 and next(_sample_counter) % policy.sample_every:
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"devcon {command} output: {len(output)} chars (not sampled)")
+        return
+    logger.log(level=log_levels.MODULE_DEBUG, msg=BoundedText(f"devcon {command} output:\n", output, policy.max_chars))
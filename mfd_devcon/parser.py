@@ -2,20 +2,201 @@
 # SPDX-License-Identifier: MIT
 """Main for Devcon parser."""
 
+import datetime
 import logging
 import re
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
-
-from mfd_common_libs import log_levels
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .exceptions import DevconParserException
+from .lazy import LazyDeviceList
+from .output_log import log_output
+from .pnp import PnpId
 
 logger = logging.getLogger(__name__)
 
+_MATCHING_DEVICES_RE = re.compile(r"(?P<num_devices>[0-9]+) matching device\(s\) found")
+_DEVICE_STATUS_RE = re.compile(r"^(?P<device>[^\s:]+)\s*:\s*(?P<status>\S.*?)\s*$")
+_NO_DEVICES_SUMMARY_RE = re.compile(r"^No (matching )?devices (found|were )", re.IGNORECASE)
+_MUTATION_SUMMARY_RE = re.compile(r"^(?P<not_all>Not all of )?(?P<count>[0-9]+) device\(s\)", re.IGNORECASE)
+_PROBLEM_CODE_RE = re.compile(r"problem:\s*(?P<code>[0-9]+)", re.IGNORECASE)
+_DP_ENUM_HEADER = "Driver Packages are on this machine"
+_DP_ENUM_FIELDS = (
+    ("Provider:", "provider"),
+    ("Class:", "class_name"),
+    ("Date:", "driver_date"),
+    ("Version:", "driver_version"),
+)
+_DRIVER_NODE_FIELDS = (
+    ("Inf file is ", "inf_file"),
+    ("Inf section is ", "inf_section"),
+    ("Driver description is ", "driver_desc"),
+    ("Manufacturer name is ", "manufacturer_name"),
+    ("Provider name is ", "provider_name"),
+    ("Driver date is ", "driver_date"),
+    ("Driver version is ", "driver_version"),
+    ("Driver node rank is ", "driver_node_rank"),
+    ("Driver node flags are ", "driver_node_flags"),
+)
+_DRIVER_NODE_KEYS = tuple(key for _, key in _DRIVER_NODE_FIELDS)
+
+
+def parse_driver_version(version: Optional[str]) -> Tuple[int, ...]:
+    """
+    Get comparable driver version, e.g. 1.2.30.4 gives (1, 2, 30, 4).
+
+    :param version: driver version, None for unknown
+    :return: numeric parts of the version up to first non-numeric one, empty for unknown version
+    """
+    if not version:
+        return ()
+    key = []
+    for part in version.strip().split("."):
+        if not part.isdigit():
+            break
+        key.append(int(part))
+    return tuple(key)
+
+
+def parse_driver_date(driver_date: Optional[str]) -> Optional[datetime.date]:
+    """
+    Get date of driver reported by devcon as month/day/year, e.g. 5/13/2024.
+
+    :param driver_date: driver date, None for unknown
+    :return: parsed date, None for unknown or invalid date
+    """
+    if not driver_date:
+        return None
+    try:
+        month, day, year = (int(part) for part in driver_date.strip().split("/"))
+        return datetime.date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _parse_int(value: Optional[str], base: int) -> Optional[int]:
+    """Get integer of devcon field in base, or hex if prefixed with 0x, None for unknown or invalid value."""
+    if not value or not value.strip():
+        return None
+    value = value.split()[0]
+    try:
+        return int(value, 16 if value.lower().startswith("0x") else base)
+    except ValueError:
+        return None
+
+
+class _DevicePnpRecord:
+    """Base of records identified by device_pnp."""
+
+    __slots__ = ()
+
+    @property
+    def pnp_id(self) -> PnpId:
+        """Parsed and interned device_pnp."""
+        return PnpId.parse(self.device_pnp)
+
+
+class _DeviceInstanceRecord:
+    """Base of records identified by device_instance_id."""
+
+    __slots__ = ()
+
+    @property
+    def pnp_id(self) -> PnpId:
+        """Parsed and interned device_instance_id."""
+        return PnpId.parse(self.device_instance_id)
+
+
+class _MemoizedMapping(Mapping):
+    """Base of read-only mappings keeping memoized values in a slot outside of dataclass fields."""
+
+    __slots__ = ("_typed",)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DriverNode(_MemoizedMapping):
+    """
+    Structure for a driver node of devcon drivernodes.
+
+    Behaves like read-only dict of fields present in devcon output, so it compares equal to such dict.
+    Use as_dict() to get mutable dict of that shape, like driver nodes were before.
+    Typed version, date, rank and flags are parsed from the strings on first access.
+    """
+
+    inf_file: Optional[str] = None
+    inf_section: Optional[str] = None
+    driver_desc: Optional[str] = None
+    manufacturer_name: Optional[str] = None
+    provider_name: Optional[str] = None
+    driver_date: Optional[str] = None
+    driver_version: Optional[str] = None
+    driver_node_rank: Optional[str] = None
+    driver_node_flags: Optional[str] = None
+
+    def _typed_fields(self) -> tuple:
+        """Get version, date, rank and flags, parsed on first access and kept in the node."""
+        typed = getattr(self, "_typed", None)
+        if typed is None:
+            typed = (
+                parse_driver_version(self.driver_version),
+                parse_driver_date(self.driver_date),
+                _parse_int(self.driver_node_rank, 10),
+                _parse_int(self.driver_node_flags, 16),
+            )
+            object.__setattr__(self, "_typed", typed)
+        return typed
+
+    @property
+    def version(self) -> Tuple[int, ...]:
+        """Driver version as comparable tuple of ints, empty if unknown."""
+        return self._typed_fields()[0]
+
+    @property
+    def date(self) -> Optional[datetime.date]:
+        """Driver date, None if unknown."""
+        return self._typed_fields()[1]
+
+    @property
+    def rank(self) -> Optional[int]:
+        """Driver node rank, lower is better match, None if unknown."""
+        return self._typed_fields()[2]
+
+    @property
+    def flags(self) -> Optional[int]:
+        """Driver node flags (reported in hex), None if unknown."""
+        return self._typed_fields()[3]
+
+    def as_dict(self) -> Dict[str, str]:
+        """Get mutable dict of fields present in devcon output, in shape of former driver node dicts."""
+        return dict(self.items())
+
+    def __setitem__(self, key: str, value: str) -> None:
+        raise TypeError(f"{type(self).__name__} is read-only, use as_dict() to get mutable dict of its fields")
+
+    def __getitem__(self, key: str) -> str:
+        value = getattr(self, key, None) if key in _DRIVER_NODE_KEYS else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in _DRIVER_NODE_KEYS if getattr(self, key) is not None)
+
+    def __len__(self) -> int:
+        return sum(getattr(self, key) is not None for key in _DRIVER_NODE_KEYS)
 
-@dataclass
-class DevconHwids:
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, key) for key in _DRIVER_NODE_KEYS))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
+@dataclass(slots=True)
+class DevconHwids(_DevicePnpRecord):
     """Structure for devcon hwids."""
 
     device_pnp: str
@@ -23,18 +204,31 @@ class DevconHwids:
     hardware_ids: List[str]
     compatible_ids: Optional[List[str]] = None
 
+    def freeze(self) -> "FrozenDevconHwids":
+        """Get immutable, hashable copy."""
+        return FrozenDevconHwids(self.device_pnp, self.name, tuple(self.hardware_ids), tuple(self.compatible_ids or ()))
 
-@dataclass
-class DevconDriverNodes:
+
+@dataclass(slots=True)
+class DevconDriverNodes(_DevicePnpRecord):
     """Structure for devcon drivernodes."""
 
     device_pnp: str
     name: str
-    driver_nodes: Optional[dict] = None
+    driver_nodes: Optional[Dict[str, DriverNode]] = None
+
+    def freeze(self) -> "FrozenDevconDriverNodes":
+        """Get immutable, hashable copy, driver nodes are ordered by their number."""
+        nodes = sorted((self.driver_nodes or {}).items(), key=lambda item: int(item[0]) if item[0].isdigit() else 0)
+        return FrozenDevconDriverNodes(
+            self.device_pnp,
+            self.name,
+            tuple(node if isinstance(node, DriverNode) else DriverNode(**node) for _, node in nodes),
+        )
 
 
-@dataclass
-class DevconDriverFiles:
+@dataclass(slots=True)
+class DevconDriverFiles(_DevicePnpRecord):
     """Structure for devcon driverfiles."""
 
     device_pnp: str
@@ -42,137 +236,368 @@ class DevconDriverFiles:
     installed_from: str
     driver_files: List[str]
 
+    def freeze(self) -> "FrozenDevconDriverFiles":
+        """Get immutable, hashable copy."""
+        return FrozenDevconDriverFiles(self.device_pnp, self.name, self.installed_from, tuple(self.driver_files))
+
 
-@dataclass
-class DevconDevices:
+@dataclass(slots=True)
+class DevconDevices(_DeviceInstanceRecord):
     """Structure for devcon find and devcon listclass."""
 
     device_instance_id: str
     device_desc: Optional[str] = ""
 
+    def freeze(self) -> "FrozenDevconDevices":
+        """Get immutable, hashable copy."""
+        return FrozenDevconDevices(self.device_instance_id, self.device_desc)
 
-@dataclass
-class DevconResources:
+
+@dataclass(slots=True)
+class DevconResources(_DevicePnpRecord):
     """Structure for devcon resources."""
 
     device_pnp: str
     name: str
     resources: Optional[List[str]] = None
 
+    def freeze(self) -> "FrozenDevconResources":
+        """Get immutable, hashable copy."""
+        return FrozenDevconResources(self.device_pnp, self.name, tuple(self.resources or ()))
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenDevconHwids(_DevicePnpRecord):
+    """Immutable structure for devcon hwids."""
+
+    device_pnp: str
+    name: str
+    hardware_ids: Tuple[str, ...]
+    compatible_ids: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenDevconDriverNodes(_DevicePnpRecord):
+    """Immutable structure for devcon drivernodes."""
+
+    device_pnp: str
+    name: str
+    driver_nodes: Tuple[DriverNode, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenDevconDriverFiles(_DevicePnpRecord):
+    """Immutable structure for devcon driverfiles."""
+
+    device_pnp: str
+    name: str
+    installed_from: str
+    driver_files: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenDevconDevices(_DeviceInstanceRecord):
+    """Immutable structure for devcon find and devcon listclass."""
+
+    device_instance_id: str
+    device_desc: Optional[str] = ""
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenDevconResources(_DevicePnpRecord):
+    """Immutable structure for devcon resources."""
+
+    device_pnp: str
+    name: str
+    resources: Tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
+class DevconDeviceSnapshot(_DeviceInstanceRecord):
+    """Structure for merged outputs of devcon find, hwids, drivernodes, driverfiles and resources for a device."""
+
+    device_instance_id: str
+    device_desc: Optional[str] = ""
+    hwids: Optional[DevconHwids] = None
+    driver_nodes: Optional[DevconDriverNodes] = None
+    driver_files: Optional[DevconDriverFiles] = None
+    resources: Optional[DevconResources] = None
+
+
+class DeviceOutcome(Enum):
+    """Outcome of mutating devcon command (enable, disable, restart, remove) for a device."""
+
+    ENABLED = "enabled"
+    DISABLED = "disabled"
+    RESTARTED = "restarted"
+    REMOVED = "removed"
+    REQUIRES_REBOOT = "requires reboot"
+    FAILED = "failed"
+    NOT_FOUND = "not found"
+    UNKNOWN = "unknown"
+
+
+@dataclass(slots=True)
+class DevconDeviceOutcome(_DeviceInstanceRecord):
+    """Structure for a device line of devcon enable, disable, restart and remove."""
+
+    device_instance_id: str
+    outcome: DeviceOutcome
+    status: Optional[str] = ""
+
+
+class DeviceState(Enum):
+    """State of a device reported by devcon status."""
+
+    RUNNING = "running"
+    STOPPED = "stopped"
+    DISABLED = "disabled"
+    PROBLEM = "problem"
+    UNKNOWN = "unknown"
+
+
+@dataclass(slots=True)
+class DevconDeviceStatus(_DevicePnpRecord):
+    """Structure for devcon status."""
+
+    device_pnp: str
+    name: str
+    state: DeviceState
+    problem_code: Optional[int] = None
+    status: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class DevconDriverPackage:
+    """Structure for a third-party driver package of devcon dp_enum, fields reported as unknown are None."""
+
+    published_name: str
+    provider: Optional[str] = None
+    class_name: Optional[str] = None
+    driver_date: Optional[str] = None
+    driver_version: Optional[str] = None
+
+
+@dataclass(slots=True)
+class DevconPackageDeployment:
+    """Structure for driver package deployed to the driver store with Devcon.deploy_driver_package."""
+
+    published_name: str
+    content_hash: str
+    remote_path: str
+    copied: bool = False
+    removed: List[str] = field(default_factory=list)
+    failed_to_remove: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class DevconMutationResult:
+    """Structure for devcon enable, disable, restart and remove."""
+
+    devices: List[DevconDeviceOutcome] = field(default_factory=list)
+    count: Optional[int] = None
+    requires_reboot: bool = False
+
 
 class DevconParser:
     """Class for parsing devcon command outputs."""
 
-    def _fetch_hw_and_compatible_ids(self, output_per_device: str) -> Tuple[List[str], List[str]]:
+    def _split_device_blocks(self, output: str, command: str) -> Iterator[Tuple[str, List[str]]]:
         """
-        Parse hardware and compatible ID's for each device.
+        Split devcon output into per-device blocks walking its lines only once.
+
+        Block starts with unindented line holding a single token (device instance ID)
+        and lasts until the next such line or the "N matching device(s) found." trailer.
 
-        :param output_per_device: devcon output per device
-        :return parsed hardware and compatible ids
+        :param output: devcon command raw output
+        :param command: devcon command which produced the output, used in error messages
+        :return: generator of device instance ID and stripped lines of its block
+        :raises DevconParserException: if trailer is missing or number of blocks does not match it
         """
+        num_devices = None
+        found_devices = 0
+        device, block = None, []
+        for line in output.splitlines():
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if line[0].isspace():
+                if device is not None:
+                    block.append(stripped)
+                continue
+            if " " not in stripped and "\t" not in stripped:
+                if device is not None:
+                    yield device, block
+                device, block = stripped, []
+                found_devices += 1
+                continue
+            num_devices_match = _MATCHING_DEVICES_RE.match(stripped)
+            if num_devices_match:
+                num_devices = int(num_devices_match.group("num_devices"))
+            elif device is not None:
+                block.append(stripped)
+        if device is not None:
+            yield device, block
+        if num_devices is None or num_devices != found_devices:
+            raise DevconParserException(f"ERROR while parsing Devcon output for {command}")
+
+    def _parse_hwids_block(self, device: str, lines: List[str]) -> DevconHwids:
+        """
+        Parse name, hardware and compatible ID's of a single device.
+
+        :param device: device instance ID
+        :param lines: stripped lines of device block
+        :return: parsed data structure for the device
+        """
+        name = ""
         hw_ids, compatible_ids = [], []
-        ids_re = re.search(r".*(?P<hw_and_compatible>Hardware IDs:(?:\s+.+\s)+)", output_per_device)
-        if ids_re:
-            ids = ids_re.groupdict()["hw_and_compatible"]
-            hw_ids_str, compatible_ids_str = ids, None
-            if "Compatible IDs:" in ids:
-                splits = ids.split("Compatible IDs:\n")
-                hw_ids_str, compatible_ids_str = splits[0], splits[1]
-            hwids_split = hw_ids_str.strip().split("\n")
-            for entry in hwids_split:
-                if hwids_split.index(entry) != 0:
-                    hw_ids.append(entry.strip())
-            if compatible_ids_str is not None:
-                compatible_ids_split = compatible_ids_str.strip().split("\n")
-                for entry in compatible_ids_split:
-                    compatible_ids.append(entry.strip())
-        return hw_ids, compatible_ids
-
-    def parse_devcon_hwids(self, output: str) -> List[DevconHwids]:
+        ids = None
+        for line in lines:
+            if line == "Hardware IDs:":
+                ids = hw_ids
+            elif line == "Compatible IDs:":
+                ids = compatible_ids
+            elif ids is not None:
+                ids.append(line)
+            elif not name and line.startswith("Name:"):
+                name = line[5:].strip()
+        return DevconHwids(device_pnp=device, name=name, hardware_ids=hw_ids, compatible_ids=compatible_ids)
+
+    def _parse_drivernodes_block(self, device: str, lines: List[str]) -> DevconDriverNodes:
+        """
+        Parse name and driver nodes of a single device.
+
+        :param device: device instance ID
+        :param lines: stripped lines of device block
+        :return: parsed data structure for the device
+        """
+        name = ""
+        drivernodes = {}
+        node_number, node_details = None, None
+        for line in lines:
+            if line.startswith("Driver node #"):
+                if node_details is not None:
+                    drivernodes[node_number] = DriverNode(**node_details)
+                node_number, node_details = line[13:].rstrip(":"), {}
+            elif node_details is not None:
+                for prefix, key in _DRIVER_NODE_FIELDS:
+                    if line.startswith(prefix):
+                        node_details[key] = line[len(prefix) :]
+                        break
+            elif not name and line.startswith("Name:"):
+                name = line[5:].strip()
+        if node_details is not None:
+            drivernodes[node_number] = DriverNode(**node_details)
+        return DevconDriverNodes(device_pnp=device, name=name, driver_nodes=drivernodes)
+
+    def _parse_resources_block(self, device: str, lines: List[str]) -> DevconResources:
+        """
+        Parse name and resources of a single device.
+
+        :param device: device instance ID
+        :param lines: stripped lines of device block
+        :return: parsed data structure for the device
+        """
+        name = ""
+        resources = []
+        in_resources = False
+        for line in lines:
+            if in_resources:
+                resources.append(line)
+            elif line == "Device is currently using the following resources:":
+                in_resources = True
+            elif not name and line.startswith("Name:"):
+                name = line[5:].strip()
+        return DevconResources(device_pnp=device, name=name, resources=resources)
+
+    def _parse_status_block(self, device: str, lines: List[str]) -> DevconDeviceStatus:
+        """
+        Parse name and state of a single device.
+
+        :param device: device instance ID
+        :param lines: stripped lines of device block
+        :return: parsed data structure for the device
+        """
+        name = ""
+        status = []
+        for line in lines:
+            if not name and line.startswith("Name:"):
+                name = line[5:].strip()
+            else:
+                status.append(line)
+        state, problem_code = DeviceState.UNKNOWN, None
+        for line in status:
+            lowered = line.lower()
+            problem_code_match = _PROBLEM_CODE_RE.search(line)
+            if "disabled" in lowered:
+                state = DeviceState.DISABLED
+            elif problem_code_match or "has a problem" in lowered:
+                state = DeviceState.PROBLEM
+                problem_code = int(problem_code_match.group("code")) if problem_code_match else None
+            elif "stopped" in lowered:
+                state = DeviceState.STOPPED
+            elif "running" in lowered:
+                state = DeviceState.RUNNING
+            else:
+                continue
+            break
+        return DevconDeviceStatus(device_pnp=device, name=name, state=state, problem_code=problem_code, status=status)
+
+    def iter_hwids(self, output: str) -> Iterator[DevconHwids]:
+        """
+        Parse devcon output for command: devcon hwids, yielding each device as soon as its block is complete.
+
+        Number of devices is validated against the output trailer once all devices are yielded.
+
+        :param output: devcon command raw output
+        :return: generator of data structures for each device
+        :raises DevconParserException: if parser is unable to parse hardware and compatible ID's
+        """
+        log_output(logger, output, "hwids")
+        for device, lines in self._split_device_blocks(output, "hwids"):
+            yield self._parse_hwids_block(device, lines)
+
+    def parse_devcon_hwids(self, output: str, lazy: bool = False) -> Sequence[DevconHwids]:
         """
         Parse devcon output for command: devcon hwids.
 
         :param output: devcon command raw output
+        :param lazy: return LazyDeviceList parsing device blocks only when accessed
         :return: parsed devcon output containing data structure for each device
         :raises DevonParserException: if parser is unable to parse hardware and compatible ID's
         """
-        logger.log(level=log_levels.MODULE_DEBUG, msg=output)
-        num_devices_match = re.search(r"(?P<num_devices>[0-9]+) matching device\(s\) found", output)
-        if not num_devices_match:
-            raise DevconParserException("ERROR while parsing Devcon output for resources")
-        num_devices = int(num_devices_match.groupdict()["num_devices"])
-        output_per_device_split = re.split(r"^\S+\n", output, flags=re.M)
-        output_per_device = list(filter(None, output_per_device_split))
-        if len(output_per_device) != num_devices:
-            raise DevconParserException("ERROR while parsing Devcon output for resources")
-        devices = re.findall(r"^(\S+)\n", output, flags=re.M)
-        if not devices:
-            raise DevconParserException("ERROR while parsing Devcon output for resources")
-        if len(list(devices)) != num_devices:
-            raise DevconParserException("ERROR while parsing Devcon output for resources")
-        devcon_hwids_op = []
-        for device, output_per_device_value in zip(devices, output_per_device):
-            pnp = device
-            name = ""
-            name_re = re.search(r"Name:\s(?P<name>.+)\n", output_per_device_value)
-            if name_re:
-                name = name_re.groupdict()["name"]
-            hw_ids, compatible_ids = self._fetch_hw_and_compatible_ids(output_per_device_value)
-            devcon_hwids_op.append(
-                DevconHwids(device_pnp=pnp, name=name, hardware_ids=hw_ids, compatible_ids=compatible_ids)
-            )
-        return devcon_hwids_op
+        if lazy:
+            log_output(logger, output, "hwids")
+            return LazyDeviceList(output, self._parse_hwids_block, "hwids")
+        return list(self.iter_hwids(output))
+
+    def iter_drivernodes(self, output: str) -> Iterator[DevconDriverNodes]:
+        """
+        Parse devcon output for command: devcon drivernodes, yielding each device as soon as its block is complete.
 
-    def parse_devcon_drivernodes(self, output: str) -> List[DevconDriverNodes]:
+        Number of devices is validated against the output trailer once all devices are yielded.
+
+        :param output: devcon command raw output
+        :return: generator of data structures for each device
+        :raises DevconParserException: if parser is unable to parse devcon output for drivernodes
+        """
+        log_output(logger, output, "drivernodes")
+        for device, lines in self._split_device_blocks(output, "drivernodes"):
+            yield self._parse_drivernodes_block(device, lines)
+
+    def parse_devcon_drivernodes(self, output: str, lazy: bool = False) -> Sequence[DevconDriverNodes]:
         """
         Parse devcon output for command: devcon drivernodes.
 
         :param output: devcon command raw output
+        :param lazy: return LazyDeviceList parsing device blocks only when accessed
         :return: parsed devcon output containing data structure for each device
         :raises DevonParserException: if parser is unable to parse devcon output for drivernodes
         """
-        logger.log(level=log_levels.MODULE_DEBUG, msg=output)
-        num_devices_match = re.search(r"(?P<num_devices>[0-9]+) matching device\(s\) found", output)
-        if not num_devices_match:
-            raise DevconParserException("ERROR while parsing Devcon output for drivernodes")
-        num_devices = int(num_devices_match.groupdict()["num_devices"])
-        output_per_device_split = re.split(r"\S+\s+Name:\s.+\s+", output, flags=re.M)
-        output_per_device = list(filter(None, output_per_device_split))
-        if len(output_per_device) != num_devices:
-            raise DevconParserException("ERROR while parsing Devcon output for drivernodes")
-        devices = re.findall(r"^(\S+)\s+Name:\s+(.+)\n", output, flags=re.M)
-        if not devices:
-            raise DevconParserException("ERROR while parsing Devcon output for drivernodes")
-        if len(list(devices)) != num_devices:
-            raise DevconParserException("ERROR while parsing Devcon output for drivernodes")
-        device_drivernodes = []
-        for device, output_per_device_value in zip(devices, output_per_device):
-            pnp = device[0]
-            name = device[1]
-            drivernodes_search = re.finditer(
-                r"Driver node #(?P<num>[0-9]+):\s+Inf file is\s+(?P<inf_file>.+)\s+Inf section is\s+(?P<inf_section>.+)"
-                r"\s+Driver description is\s+(?P<driver_desc>.+)\s+Manufacturer name is\s+(?P<manufacturer_name>.+)\s+"
-                r"Provider name is\s+(?P<provider_name>.+)\s+Driver date is\s+(?P<driver_date>.+)\s+Driver version "
-                r"is\s+(?P<driver_version>.+)\s+Driver node rank is\s+(?P<driver_node_rank>.+)\s+Driver node "
-                r"flags are\s+(?P<driver_node_flags>.+)\s",
-                output_per_device_value,
-            )
-            drivernodes = {}
-            for driver_node in drivernodes_search:
-                node_details = {}
-                node_num = driver_node.groupdict()["num"]
-                node_details["inf_file"] = driver_node.groupdict()["inf_file"]
-                node_details["inf_section"] = driver_node.groupdict()["inf_section"]
-                node_details["driver_desc"] = driver_node.groupdict()["driver_desc"]
-                node_details["manufacturer_name"] = driver_node.groupdict()["manufacturer_name"]
-                node_details["provider_name"] = driver_node.groupdict()["provider_name"]
-                node_details["driver_date"] = driver_node.groupdict()["driver_date"]
-                node_details["driver_version"] = driver_node.groupdict()["driver_version"]
-                node_details["driver_node_rank"] = driver_node.groupdict()["driver_node_rank"]
-                node_details["driver_node_flags"] = driver_node.groupdict()["driver_node_flags"]
-                drivernodes[node_num] = node_details
-            device_drivernodes.append(DevconDriverNodes(device_pnp=pnp, name=name, driver_nodes=drivernodes))
-        return device_drivernodes
+        if lazy:
+            log_output(logger, output, "drivernodes")
+            return LazyDeviceList(output, self._parse_drivernodes_block, "drivernodes")
+        return list(self.iter_drivernodes(output))
 
     def parse_devcon_driverfiles(self, output: str) -> List[DevconDriverFiles]:
         """
@@ -182,7 +607,7 @@ class DevconParser:
         :return: parsed devcon output containing data structure for each device
         :raises DevonParserException: if parser is unable to parse devcon output for driverfiles
         """
-        logger.log(level=log_levels.MODULE_DEBUG, msg=output)
+        log_output(logger, output, "driverfiles")
         num_devices_match = re.search(r"(?P<num_devices>[0-9]+) matching device\(s\) found", output)
         if not num_devices_match:
             raise DevconParserException("ERROR while parsing Devcon output for driverfiles")
@@ -215,14 +640,16 @@ class DevconParser:
             )
         return driverfiles
 
-    def parse_devcon_devices(self, output: str, command: str = "find") -> List[DevconDevices]:
+    def iter_devices(self, output: str, command: str = "find") -> Iterator[DevconDevices]:
         """
-        Parse devcon output for command: devcon find/ devcon listclass.
+        Parse devcon output for command: devcon find/ devcon listclass, yielding devices one by one.
+
+        Number of devices is validated against the output trailer once all devices are yielded.
 
         :param output: devcon command output
         :param command: devcon command executed for which output is to be parsed. example: find, listclass
-        :return: parsed devcon output containing data structure for each device
-        :raises DevonParserException: if parser is unable to parse devcon output for specified devcon command
+        :return: generator of data structures for each device
+        :raises DevconParserException: if parser is unable to parse devcon output for specified devcon command
         """
         _valid_commands = ["find", "listclass"]
         if command not in _valid_commands:
@@ -234,9 +661,9 @@ class DevconParser:
         if not num_devices_match:
             raise DevconParserException("ERROR while parsing Devcon output for find device")
         num_devices = int(num_devices_match.groupdict()["num_devices"])
-        devices = []
+        found_devices = 0
         for device in output.split("\n"):
-            if "matching device(s) found" in device or "Listing" in device or not device:
+            if "matching device(s) found" in device or "Listing" in device or not device.strip():
                 continue
             if ":" in device:
                 dev_splits = device.split(":")
@@ -245,50 +672,190 @@ class DevconParser:
             else:
                 device_id = device.strip()
                 device_desc = ""
-            devices.append(DevconDevices(device_instance_id=device_id, device_desc=device_desc))
-        if num_devices != len(devices):
+            found_devices += 1
+            yield DevconDevices(device_instance_id=device_id, device_desc=device_desc)
+        if num_devices != found_devices:
             raise DevconParserException("Could not parse Devcon output for all devices")
-        return devices
 
-    def parse_devcon_resources(self, output: str) -> List[DevconResources]:
+    def parse_devcon_devices(self, output: str, command: str = "find") -> List[DevconDevices]:
+        """
+        Parse devcon output for command: devcon find/ devcon listclass.
+
+        :param output: devcon command output
+        :param command: devcon command executed for which output is to be parsed. example: find, listclass
+        :return: parsed devcon output containing data structure for each device
+        :raises DevonParserException: if parser is unable to parse devcon output for specified devcon command
+        """
+        return list(self.iter_devices(output, command=command))
+
+    def iter_resources(self, output: str) -> Iterator[DevconResources]:
+        """
+        Parse devcon output for command: devcon resources, yielding each device as soon as its block is complete.
+
+        Number of devices is validated against the output trailer once all devices are yielded.
+
+        :param output: devcon command output
+        :return: generator of data structures for each device
+        :raises DevconParserException: if parser is unable to parse devcon output for resources
+        """
+        log_output(logger, output, "resources")
+        for device, lines in self._split_device_blocks(output, "resources"):
+            yield self._parse_resources_block(device, lines)
+
+    def parse_devcon_resources(self, output: str, lazy: bool = False) -> Sequence[DevconResources]:
         """
         Parse devcon output for command: devcon resources.
 
         :param output: devcon command output
+        :param lazy: return LazyDeviceList parsing device blocks only when accessed
         :return: parsed devcon output containing data structure for each device
         :raises DevonParserException: if parser is unable to parse devcon output for resources
         """
-        logger.log(level=log_levels.MODULE_DEBUG, msg=output)
-        num_devices_match = re.search(r"(?P<num_devices>[0-9]+) matching device\(s\) found", output)
-        if not num_devices_match:
-            raise DevconParserException("ERROR while parsing Devcon output for resources")
-        num_devices = int(num_devices_match.groupdict()["num_devices"])
-        output_per_device_split = re.split(r"^\S+\n", output, flags=re.M)
-        output_per_device = list(filter(None, output_per_device_split))
-        if len(output_per_device) != num_devices:
-            raise DevconParserException("ERROR while parsing Devcon output for resources")
-        devices = re.findall(r"^(\S+)\n", output, flags=re.M)
-        if not devices:
-            raise DevconParserException("ERROR while parsing Devcon output for resources")
-        if len(list(devices)) != num_devices:
-            raise DevconParserException("ERROR while parsing Devcon output for resources")
-        devcon_resources = []
-        for device, output_per_device_value in zip(devices, output_per_device):
-            resources = []
-            pnp = device
-            name_re = re.search(r"Name:\s(.+)\n", output_per_device_value)
-            if name_re:
-                name = name_re.group(1)
-            else:
-                name = ""
-            resources_search = re.search(
-                r"Device is currently using the following resources:\n(?P<resources>(\s+.+\n*)+)",
-                output_per_device_value,
+        if lazy:
+            log_output(logger, output, "resources")
+            return LazyDeviceList(output, self._parse_resources_block, "resources")
+        return list(self.iter_resources(output))
+
+    def iter_status(self, output: str) -> Iterator[DevconDeviceStatus]:
+        """
+        Parse devcon output for command: devcon status, yielding each device as soon as its block is complete.
+
+        Number of devices is validated against the output trailer once all devices are yielded.
+
+        :param output: devcon command output
+        :return: generator of data structures for each device
+        :raises DevconParserException: if parser is unable to parse devcon output for status
+        """
+        log_output(logger, output, "status")
+        for device, lines in self._split_device_blocks(output, "status"):
+            yield self._parse_status_block(device, lines)
+
+    def parse_devcon_status(self, output: str, lazy: bool = False) -> Sequence[DevconDeviceStatus]:
+        """
+        Parse devcon output for command: devcon status.
+
+        :param output: devcon command output
+        :param lazy: return LazyDeviceList parsing device blocks only when accessed
+        :return: parsed devcon output containing data structure for each device
+        :raises DevonParserException: if parser is unable to parse devcon output for status
+        """
+        if lazy:
+            log_output(logger, output, "status")
+            return LazyDeviceList(output, self._parse_status_block, "status")
+        return list(self.iter_status(output))
+
+    def parse_devcon_dp_enum(self, output: str) -> List[DevconDriverPackage]:
+        """
+        Parse devcon output for command: devcon dp_enum.
+
+        :param output: devcon command output
+        :return: parsed devcon output containing data structure for each third-party driver package
+        :raises DevonParserException: if parser is unable to parse devcon output for dp_enum
+        """
+        log_output(logger, output, "dp_enum")
+        if "There are no 3rd party" in output:
+            return []
+        if _DP_ENUM_HEADER not in output:
+            raise DevconParserException("ERROR while parsing Devcon output for dp_enum")
+        packages = []
+        in_packages = False
+        for line in output.splitlines():
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if not in_packages:
+                in_packages = _DP_ENUM_HEADER in stripped
+                continue
+            if not line[0].isspace():
+                packages.append(DevconDriverPackage(published_name=stripped))
+                continue
+            if not packages:
+                raise DevconParserException("ERROR while parsing Devcon output for dp_enum")
+            for prefix, key in _DP_ENUM_FIELDS:
+                if stripped.startswith(prefix):
+                    value = stripped[len(prefix) :].strip()
+                    setattr(packages[-1], key, None if value.lower() == "unknown" else value)
+                    break
+        return packages
+
+    @staticmethod
+    def _parse_device_status(status: str) -> DeviceOutcome:
+        """
+        Map devcon device status, e.g. "Disabled" or "Enabled on reboot", to outcome.
+
+        :param status: status reported by devcon for a device
+        :return: outcome
+        """
+        status = status.lower()
+        if "failed" in status:
+            return DeviceOutcome.FAILED
+        if "reboot" in status:
+            return DeviceOutcome.REQUIRES_REBOOT
+        try:
+            return DeviceOutcome(status)
+        except ValueError:
+            return DeviceOutcome.UNKNOWN
+
+    def parse_devcon_mutation(self, output: str) -> DevconMutationResult:
+        """
+        Parse output of devcon enable, disable, restart and remove into per-device outcomes.
+
+        :param output: devcon command raw output
+        :return: outcome of each device reported in output, count of devices from summary line
+                 (0 if no devices matched, None if summary line is missing) and whether reboot is required
+        """
+        log_output(logger, output, "enable/disable/restart/remove")
+        result = DevconMutationResult()
+        for line in output.splitlines():
+            if not line or line[0].isspace():
+                continue
+            stripped = line.strip()
+            if _NO_DEVICES_SUMMARY_RE.match(stripped):
+                result.count = 0
+                continue
+            summary_match = _MUTATION_SUMMARY_RE.match(stripped)
+            if summary_match:
+                result.count = int(summary_match.group("count"))
+                result.requires_reboot |= summary_match.group("not_all") is not None
+                continue
+            status_match = _DEVICE_STATUS_RE.match(stripped)
+            if status_match:
+                outcome = self._parse_device_status(status_match.group("status"))
+                result.devices.append(
+                    DevconDeviceOutcome(
+                        device_instance_id=status_match.group("device"),
+                        outcome=outcome,
+                        status=status_match.group("status"),
+                    )
+                )
+                result.requires_reboot |= outcome is DeviceOutcome.REQUIRES_REBOOT
+        return result
+
+    def parse_devcon_snapshot(self, output: str, delimiter: str) -> List[DevconDeviceSnapshot]:
+        """
+        Parse combined output of devcon find, hwids, drivernodes, driverfiles and resources commands.
+
+        :param output: outputs of the commands executed in that order, separated by lines with delimiter
+        :param delimiter: unique string separating outputs of the commands
+        :return: merged data structure for each device found, in order of devcon find output
+        :raises DevconParserException: if output does not consist of all commands outputs
+        """
+        sections = output.split(delimiter)
+        if len(sections) != 5:
+            raise DevconParserException(f"ERROR while parsing Devcon snapshot, expected 5 outputs, got {len(sections)}")
+        find_output, hwids_output, drivernodes_output, driverfiles_output, resources_output = sections
+        hwids = {entry.device_pnp: entry for entry in self.iter_hwids(hwids_output)}
+        driver_nodes = {entry.device_pnp: entry for entry in self.iter_drivernodes(drivernodes_output)}
+        driver_files = {entry.device_pnp: entry for entry in self.parse_devcon_driverfiles(driverfiles_output)}
+        resources = {entry.device_pnp: entry for entry in self.iter_resources(resources_output)}
+        return [
+            DevconDeviceSnapshot(
+                device_instance_id=device.device_instance_id,
+                device_desc=device.device_desc,
+                hwids=hwids.get(device.device_instance_id),
+                driver_nodes=driver_nodes.get(device.device_instance_id),
+                driver_files=driver_files.get(device.device_instance_id),
+                resources=resources.get(device.device_instance_id),
             )
-            if resources_search:
-                resource_str = resources_search.groupdict()["resources"]
-                resource_splits = filter(None, resource_str.split("\n"))
-                for resource in resource_splits:
-                    resources.append(resource.strip())
-            devcon_resources.append(DevconResources(device_pnp=pnp, name=name, resources=resources))
-        return devcon_resources
+            for device in self.iter_devices(find_output)
+        ]
@@ -0,0 +1,83 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for memoized probing of platform of hosts behind connections."""
+
+import threading
+import typing
+from dataclasses import dataclass
+from typing import Optional, Set
+from weakref import WeakKeyDictionary
+
+from mfd_typing import OSBitness, OSName, OSType
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+
+_platforms: "WeakKeyDictionary[Connection, PlatformInfo]" = WeakKeyDictionary()
+_available_tools: "WeakKeyDictionary[Connection, Set[str]]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformInfo:
+    """Structure for platform of host behind connection, os_type is None if connection does not report it."""
+
+    os_name: OSName
+    os_bitness: OSBitness
+    os_type: Optional[OSType] = None
+
+
+def probe_platform(connection: "Connection") -> PlatformInfo:
+    """
+    Get OS name, bitness and type of host, asking the connection only on first call for it.
+
+    Results are kept as long as the connection object lives.
+
+    :param connection: Connection object
+    :return: platform of host
+    """
+    with _lock:
+        platform = _platforms.get(connection)
+    if platform is not None:
+        return platform
+    try:
+        os_type = connection.get_os_type()
+    except NotImplementedError:
+        os_type = None
+    platform = PlatformInfo(os_name=connection.get_os_name(), os_bitness=connection.get_os_bitness(), os_type=os_type)
+    with _lock:
+        return _platforms.setdefault(connection, platform)
+
+
+def is_tool_available(connection: "Connection", tool_exec: str) -> bool:
+    """
+    Check if tool was already found available on host.
+
+    :param connection: Connection object
+    :param tool_exec: path to tool executable on host
+    :return: True if tool was marked available for the connection
+    """
+    with _lock:
+        return tool_exec in _available_tools.get(connection, ())
+
+
+def mark_tool_available(connection: "Connection", tool_exec: str) -> None:
+    """
+    Remember that tool is available on host.
+
+    :param connection: Connection object
+    :param tool_exec: path to tool executable on host
+    """
+    with _lock:
+        _available_tools.setdefault(connection, set()).add(tool_exec)
+
+
+def forget_platform(connection: "Connection") -> None:
+    """
+    Drop memoized platform and tool availability of host, e.g. after reinstalling it or removing tools.
+
+    :param connection: Connection object
+    """
+    with _lock:
+        _platforms.pop(connection, None)
+        _available_tools.pop(connection, None)
@@ -0,0 +1,101 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for PnP device instance ID model."""
+
+import sys
+from functools import lru_cache
+from typing import Optional, Tuple
+
+_ID_FIELDS = {
+    "VEN_": "vendor",
+    "VID_": "vendor",
+    "DEV_": "device",
+    "PID_": "device",
+    "SUBSYS_": "subsystem",
+    "REV_": "revision",
+}
+
+
+class PnpId:
+    """
+    Immutable, hashable PnP device instance ID, e.g. PCI\\VEN_8086&DEV_1592&SUBSYS_00028086&REV_02\\4&273B1A92&0&000002.
+
+    Device instance ID consists of bus (enumerator), hardware part and instance path separated by backslashes.
+    Vendor, device, subsystem and revision are taken from VEN_/VID_, DEV_/PID_, SUBSYS_ and REV_ tokens
+    of hardware part, None if missing. IDs are compared case-insensitively.
+    Use PnpId.parse to get interned object, so every ID string is parsed only once.
+    """
+
+    __slots__ = (
+        "instance_id",
+        "bus",
+        "hardware_id",
+        "instance_path",
+        "vendor",
+        "device",
+        "subsystem",
+        "revision",
+        "_key",
+    )
+
+    def __init__(self, instance_id: str):
+        """
+        Parse device instance ID.
+
+        :param instance_id: device instance ID
+        """
+        parts = instance_id.strip().split("\\", 2)
+        parts += [""] * (3 - len(parts))
+        values = dict.fromkeys(_ID_FIELDS.values())
+        for token in parts[1].split("&"):
+            for prefix, name in _ID_FIELDS.items():
+                if token[: len(prefix)].upper() == prefix:
+                    values[name] = sys.intern(token[len(prefix) :].upper())
+                    break
+        setattr_ = super().__setattr__
+        setattr_("instance_id", instance_id.strip())
+        setattr_("bus", sys.intern(parts[0].upper()))
+        setattr_("hardware_id", parts[1])
+        setattr_("instance_path", parts[2])
+        for name, value in values.items():
+            setattr_(name, value)
+        setattr_("_key", self.instance_id.upper())
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def parse(instance_id: str) -> "PnpId":
+        """
+        Get interned PnpId of device instance ID, parsing it only on first use.
+
+        :param instance_id: device instance ID
+        :return: PnpId object, the same object for repeated calls with the same ID
+        """
+        return PnpId(instance_id)
+
+    @property
+    def vendor_device(self) -> Tuple[Optional[str], Optional[str]]:
+        """Vendor and device ID, e.g. ("8086", "1592"), convenient for grouping."""
+        return self.vendor, self.device
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PnpId):
+            return self._key == other._key
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __str__(self) -> str:
+        return self.instance_id
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.instance_id!r})"
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        return type(self), (self.instance_id,)
@@ -0,0 +1,13 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module with helpers for testing and benchmarking MFD Devcon without Windows host."""
+
+from .synthetic import (
+    SyntheticDevice,
+    SyntheticDriverPackage,
+    SyntheticDevconOutput,
+    generate_devices,
+    generate_driver_packages,
+)
+from .fake_connection import FakeConnectionStats, FakeDevconConnection, SimulatedWindowsConnection
+from .recording import CorpusEntry, DevconCorpus, RecordingConnection, ReplayConnection, devcon_subcommand
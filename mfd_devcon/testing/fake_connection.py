@@ -0,0 +1,347 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""In-process fake Connection answering devcon command lines from synthetic device model."""
+
+import re
+import shlex
+import time
+from dataclasses import dataclass, field
+from pathlib import PureWindowsPath
+from typing import Callable, Iterable, List, Optional, Tuple, Type
+
+from mfd_connect import Connection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSBitness, OSName, OSType
+from mfd_typing.cpu_values import CPUArchitecture
+
+from .synthetic import (
+    _SETUP_CLASSES,
+    SyntheticDevconOutput,
+    SyntheticDevice,
+    SyntheticDriverPackage,
+    generate_driver_packages,
+)
+
+_NO_MATCHING_DEVICES = "No matching devices found.\n"
+_MUTATIONS = {
+    "enable": ("Enabled", "{} device(s) are enabled."),
+    "disable": ("Disabled", "{} device(s) disabled."),
+    "restart": ("Restarted", "{} device(s) restarted."),
+    "remove": ("Removed", "{} device(s) were removed."),
+}
+
+
+@dataclass
+class FakeConnectionStats:
+    """Structure for traffic statistics of FakeDevconConnection."""
+
+    round_trips: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    injected_delay: float = 0.0
+    commands: List[str] = field(default_factory=list)
+
+
+class SimulatedWindowsConnection(Connection):
+    """
+    Base of in-process connections to simulated Windows host.
+
+    Every execute_command is one round trip: it costs configured latency plus transfer time of command and output
+    with configured bandwidth, and it is counted in stats.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        os_bitness: OSBitness = OSBitness.OS_64BIT,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize simulated connection.
+
+        :param latency: delay of every round trip in seconds
+        :param bandwidth: transfer speed in bytes per second, None for unlimited
+        :param os_bitness: bitness of simulated Windows host
+        :param sleep: function used for injecting delays
+        """
+        super().__init__()
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.stats = FakeConnectionStats()
+        self._os_bitness = os_bitness
+        self._sleep = sleep
+        self._ip = "127.0.0.1"
+
+    def reset_stats(self) -> None:
+        """Reset traffic statistics."""
+        self.stats = FakeConnectionStats()
+
+    def _account(self, command: str, stdout: str) -> None:
+        """Count round trip and inject its latency and transfer time."""
+        sent, received = len(command.encode()), len(stdout.encode())
+        delay = self.latency
+        if self.bandwidth:
+            delay += (sent + received) / self.bandwidth
+        self.stats.round_trips += 1
+        self.stats.bytes_sent += sent
+        self.stats.bytes_received += received
+        self.stats.injected_delay += delay
+        self.stats.commands.append(command)
+        if delay:
+            self._sleep(delay)
+
+    @staticmethod
+    def _complete(
+        command: str,
+        stdout: str,
+        return_code: int,
+        expected_return_codes: Optional[Iterable],
+        custom_exception: Optional[Type[ConnectionCalledProcessError]],
+        stderr: str = "",
+    ) -> ConnectionCompletedProcess:
+        """Build completed process of command, raise exception if return code is unexpected."""
+        if expected_return_codes is not None and return_code not in expected_return_codes:
+            exception = custom_exception or ConnectionCalledProcessError
+            raise exception(returncode=return_code, cmd=command, output=stdout, stderr=stderr)
+        return ConnectionCompletedProcess(args=command, stdout=stdout, stderr=stderr, return_code=return_code)
+
+    def get_os_type(self) -> OSType:
+        """Get type of client os."""
+        return OSType.WINDOWS
+
+    def get_os_name(self) -> OSName:
+        """Get name of client os."""
+        return OSName.WINDOWS
+
+    def get_os_bitness(self) -> OSBitness:
+        """Get bitness of client os."""
+        return self._os_bitness
+
+    def get_cpu_architecture(self) -> CPUArchitecture:
+        """Get CPU architecture of Host."""
+        return CPUArchitecture.X86_64
+
+    def restart_platform(self) -> None:
+        """Reboot host, simulated host has nothing to reboot."""
+
+    def shutdown_platform(self) -> None:
+        """Shutdown host, simulated host has nothing to shutdown."""
+
+    def wait_for_host(self, timeout: int = 60) -> None:
+        """Wait for host availability, simulated host is always available."""
+
+    @property
+    def path(self) -> Type[PureWindowsPath]:
+        """Path class of simulated Windows host."""
+        return PureWindowsPath
+
+    def disconnect(self) -> None:
+        """Close connection with host, nothing to close for simulated host."""
+
+
+class FakeDevconConnection(SimulatedWindowsConnection):
+    """
+    Connection to simulated Windows host with devcon installed.
+
+    Devices are answered from synthetic device model,
+    mutating commands (enable, disable, remove, rescan, dp_add, dp_delete) change it. Files written
+    with echo redirection are kept in files, so type and rmdir work on them.
+    """
+
+    _read_commands = ("find", "hwids", "drivernodes", "driverfiles", "resources", "status")
+
+    def __init__(
+        self,
+        devices: Optional[Iterable[SyntheticDevice]] = None,
+        *,
+        driver_packages: Optional[Iterable[SyntheticDriverPackage]] = None,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        os_bitness: OSBitness = OSBitness.OS_64BIT,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize fake connection.
+
+        :param devices: device model of simulated host
+        :param driver_packages: third-party driver packages of simulated driver store,
+                                None for packages installed for devices
+        :param latency: delay of every round trip in seconds
+        :param bandwidth: transfer speed in bytes per second, None for unlimited
+        :param os_bitness: bitness of simulated Windows host
+        :param sleep: function used for injecting delays
+        """
+        super().__init__(latency=latency, bandwidth=bandwidth, os_bitness=os_bitness, sleep=sleep)
+        self.devices = list(devices or [])
+        self.driver_packages = list(
+            generate_driver_packages(self.devices) if driver_packages is None else driver_packages
+        )
+        self.files = {}
+        self._removed_devices = []
+        self._renderer = SyntheticDevconOutput()
+
+    def execute_command(
+        self,
+        command: str,
+        *,
+        input_data: str = None,
+        cwd: str = None,
+        timeout: int = None,
+        env: dict = None,
+        stderr_to_stdout: bool = False,
+        discard_stdout: bool = False,
+        discard_stderr: bool = False,
+        skip_logging: bool = False,
+        expected_return_codes: Iterable | None = frozenset({0}),
+        shell: bool = False,
+        custom_exception: Type[ConnectionCalledProcessError] = None,
+    ) -> ConnectionCompletedProcess:
+        """
+        Answer command line, commands chained with & are executed one after another like in cmd.exe.
+
+        :param command: command line to execute
+        :param expected_return_codes: return codes to be considered acceptable, None for any
+        :param custom_exception: exception raised on unexpected return code
+        :return: ConnectionCompletedProcess object
+        :raises ConnectionCalledProcessError: or custom_exception if return code is unexpected
+        """
+        stdout, return_code = "", 0
+        single_commands = command.split(" & ")
+        for index, single_command in enumerate(single_commands):
+            # like cmd.exe, keep whitespace before & as part of the command, so echo prints it
+            if index < len(single_commands) - 1:
+                single_command += " "
+            single_stdout, return_code = self._execute_single(single_command.lstrip())
+            stdout += single_stdout
+        self._account(command, stdout)
+        return self._complete(command, stdout, return_code, expected_return_codes, custom_exception)
+
+    def _execute_single(self, command: str) -> Tuple[str, int]:
+        """Execute single command, return its output and return code."""
+        args = [arg.strip('"') for arg in shlex.split(command, posix=False)]
+        if not args:
+            return "", 0
+        if args[0].lower() == "echo":
+            text, redirect, path = command[5:].partition(">")
+            if redirect:
+                self.files[path.strip().strip('"').lower()] = text + "\n"
+                return "", 0
+            return command[5:] + "\n", 0
+        if args[0].lower() == "type":
+            content = self.files.get(" ".join(args[1:]).lower())
+            return ("", 1) if content is None else (content, 0)
+        if args[0].lower() == "rmdir":
+            directory = [arg for arg in args[1:] if not arg.startswith("/")][0].lower().rstrip("\\") + "\\"
+            self.files = {path: content for path, content in self.files.items() if not path.startswith(directory)}
+            return "", 0
+        if not args[0].lower().endswith(("devcon.exe", "devcon_x64.exe")):
+            return f"'{args[0]}' is not recognized as an internal or external command.\n", 1
+        args = [arg for arg in args[1:] if arg.lower() != "/r"]
+        if not args:
+            return "Device Console Help:\n", 0
+        subcommand = args[0].lower()
+        if subcommand == "help":
+            return "Device Console Help:\n", 0
+        if subcommand in self._read_commands:
+            return self._read_command(subcommand, args[1:])
+        if subcommand in _MUTATIONS:
+            return self._mutate(subcommand, args[1:])
+        handler = getattr(self, f"_devcon_{subcommand}", None)
+        if handler is None:
+            return f"{args[0]}: Invalid command.\n", 1
+        return handler(args[1:])
+
+    def _match(self, patterns: List[str], devices: Optional[List[SyntheticDevice]] = None) -> List[SyntheticDevice]:
+        """Find devices matching devcon patterns: optional =class followed by IDs, @instance IDs or *."""
+        devices = self.devices if devices is None else devices
+        if patterns and patterns[0].startswith("="):
+            setup_class = patterns[0][1:].lower()
+            devices = [device for device in devices if device.setup_class.lower() == setup_class]
+            patterns = patterns[1:]
+        if not patterns or "*" in patterns:
+            return devices
+        regexes = [
+            (pattern.startswith("@"), re.compile(".*".join(map(re.escape, pattern.lstrip("@").split("*"))), re.I))
+            for pattern in patterns
+        ]
+        matched = []
+        for device in devices:
+            for instance_only, regex in regexes:
+                ids = [device.device_instance_id] if instance_only else device.hardware_ids + device.compatible_ids
+                if any(regex.fullmatch(device_id) for device_id in ids):
+                    matched.append(device)
+                    break
+        return matched
+
+    def _read_command(self, command: str, args: List[str]) -> Tuple[str, int]:
+        """Render output of read-only devcon command for matching devices."""
+        devices = self._match(args)
+        if not devices:
+            return _NO_MATCHING_DEVICES, 0
+        return self._renderer.render(command, devices), 0
+
+    def _devcon_listclass(self, args: List[str]) -> Tuple[str, int]:
+        """Answer devcon listclass, known setup classes without devices are listed as empty."""
+        if not args:
+            return "devcon listclass: Invalid use of listclass.\n", 1
+        known_classes = {setup_class.lower() for setup_class in _SETUP_CLASSES}
+        if args[0].lower() not in known_classes | {device.setup_class.lower() for device in self.devices}:
+            return f'There is no "{args[0]}" setup class on the local machine.\n', 0
+        return self._renderer.listclass(self.devices, args[0]), 0
+
+    def _mutate(self, command: str, args: List[str]) -> Tuple[str, int]:
+        """Answer devcon enable, disable, restart or remove and apply it to device model."""
+        devices = self._match(args)
+        if not devices:
+            return _NO_MATCHING_DEVICES, 0
+        status, summary = _MUTATIONS[command]
+        for device in devices:
+            if command in ("enable", "disable"):
+                device.enabled = command == "enable"
+            elif command == "remove":
+                self.devices.remove(device)
+                self._removed_devices.append(device)
+        lines = [f"{device.device_instance_id}: {status}" for device in devices]
+        lines.append(summary.format(len(devices)))
+        return "\n".join(lines) + "\n", 0
+
+    def _devcon_rescan(self, args: List[str]) -> Tuple[str, int]:
+        """Answer devcon rescan, removed devices are enumerated again."""
+        self.devices.extend(self._removed_devices)
+        self._removed_devices = []
+        return "Scanning for new hardware.\nScanning completed.\n", 0
+
+    def _devcon_update(self, args: List[str]) -> Tuple[str, int]:
+        """Answer devcon update."""
+        if len(args) < 2:
+            return "devcon update: Invalid use of update.\n", 1
+        if not self._match([args[1]]):
+            return "devcon failed.\n", 1
+        return f"Updating drivers for {args[1]} from {args[0]}.\nDrivers installed successfully.\n", 0
+
+    def _devcon_dp_enum(self, args: List[str]) -> Tuple[str, int]:
+        """Answer devcon dp_enum."""
+        return self._renderer.dp_enum(self.driver_packages), 0
+
+    def _devcon_dp_add(self, args: List[str]) -> Tuple[str, int]:
+        """Answer devcon dp_add, package is published under the next free oemNN.inf name."""
+        if not args:
+            return "devcon dp_add: Invalid use of dp_add.\n", 1
+        numbers = [int(package.published_name[3:-4]) for package in self.driver_packages]
+        published_name = f"oem{max(numbers, default=0) + 1}.inf"
+        self.driver_packages.append(SyntheticDriverPackage(published_name=published_name))
+        return f"Driver Package '{published_name}' added.\n", 0
+
+    def _devcon_dp_delete(self, args: List[str]) -> Tuple[str, int]:
+        """Answer devcon dp_delete."""
+        args = [arg for arg in args if arg.lower() != "-f"]
+        if not args:
+            return "devcon dp_delete: Invalid use of dp_delete.\n", 1
+        package = next((p for p in self.driver_packages if p.published_name.lower() == args[0].lower()), None)
+        if package is None:
+            return "Deleting the specified Driver Package from the machine failed.\ndevcon failed.\n", 1
+        self.driver_packages.remove(package)
+        return f"Driver Package '{package.published_name}' deleted.\n", 0
@@ -0,0 +1,366 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Recording of devcon sessions on real hosts into on-disk corpora and their deterministic replay."""
+
+import gzip
+import json
+import re
+import shlex
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Type, Union
+
+from mfd_connect import Connection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSBitness, OSName, OSType
+from mfd_typing.cpu_values import CPUArchitecture
+
+from ..exceptions import DevconReplayError
+from .fake_connection import SimulatedWindowsConnection
+
+CORPUS_FORMAT = "mfd_devcon_corpus"
+CORPUS_VERSION = 1
+# delimiters of chained commands are random per process (see mfd_devcon.base), so they are stored normalized
+_DELIMITER_RE = re.compile(r"==mfd_devcon_[0-9a-f]{32}==")
+_DELIMITER_PLACEHOLDER = "==mfd_devcon_delimiter=="
+_DEVCON_EXECUTABLES = ("devcon.exe", "devcon_x64.exe")
+
+
+@dataclass(slots=True)
+class CorpusEntry:
+    """Structure for single recorded command execution."""
+
+    command: str
+    stdout: str
+    return_code: int = 0
+    stderr: str = ""
+
+    @property
+    def subcommand(self) -> Optional[str]:
+        """Devcon subcommand of single devcon command, e.g. hwids, None for chained and other commands."""
+        return devcon_subcommand(self.command)
+
+
+@dataclass
+class DevconCorpus:
+    """
+    Structure for recorded devcon session: platform of the host and every executed command with its output.
+
+    Stored as gzip-compressed JSON lines; outputs identical to an earlier one are stored as reference to it.
+    """
+
+    os_name: OSName = OSName.WINDOWS
+    os_bitness: OSBitness = OSBitness.OS_64BIT
+    os_type: Optional[OSType] = OSType.WINDOWS
+    host: Optional[str] = None
+    entries: List[CorpusEntry] = field(default_factory=list)
+
+    def outputs(self, subcommand: Optional[str] = None) -> Iterator[CorpusEntry]:
+        """
+        Iterate over successful single devcon commands, e.g. to use their outputs as parser fixtures.
+
+        :param subcommand: devcon subcommand to filter by, e.g. hwids, None for all
+        :return: generator of entries
+        """
+        for entry in self.entries:
+            entry_subcommand = entry.subcommand
+            if entry_subcommand is None or entry.return_code != 0:
+                continue
+            if subcommand is None or entry_subcommand == subcommand:
+                yield entry
+
+    def save(self, path: Union[Path, str]) -> None:
+        """
+        Save corpus to file.
+
+        :param path: path of corpus file, conventionally with .jsonl.gz suffix
+        """
+        header = {
+            "format": CORPUS_FORMAT,
+            "version": CORPUS_VERSION,
+            "os_name": self.os_name.name,
+            "os_bitness": self.os_bitness.name,
+            "os_type": self.os_type.name if self.os_type else None,
+            "host": self.host,
+        }
+        seen_outputs: Dict[str, int] = {}
+        with gzip.open(path, "wt", encoding="utf-8") as corpus_file:
+            corpus_file.write(json.dumps(header) + "\n")
+            for index, entry in enumerate(self.entries):
+                record: Dict[str, Any] = {"command": entry.command, "return_code": entry.return_code}
+                if entry.stdout in seen_outputs:
+                    record["stdout_of"] = seen_outputs[entry.stdout]
+                else:
+                    record["stdout"] = entry.stdout
+                    seen_outputs[entry.stdout] = index
+                if entry.stderr:
+                    record["stderr"] = entry.stderr
+                corpus_file.write(json.dumps(record) + "\n")
+
+    @classmethod
+    def load(cls, path: Union[Path, str]) -> "DevconCorpus":
+        """
+        Load corpus from file.
+
+        :param path: path of corpus file
+        :return: loaded corpus
+        :raises DevconReplayError: if file is not a devcon corpus of supported version
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as corpus_file:
+            lines = iter(corpus_file)
+            try:
+                header = json.loads(next(lines))
+            except (StopIteration, ValueError) as e:
+                raise DevconReplayError(f"{path} is not a devcon corpus") from e
+            if header.get("format") != CORPUS_FORMAT or header.get("version") != CORPUS_VERSION:
+                raise DevconReplayError(
+                    f"{path} is not a devcon corpus of version {CORPUS_VERSION}: "
+                    f"{header.get('format')} {header.get('version')}"
+                )
+            entries = []
+            for line in lines:
+                record = json.loads(line)
+                stdout = record["stdout"] if "stdout" in record else entries[record["stdout_of"]].stdout
+                entries.append(CorpusEntry(record["command"], stdout, record["return_code"], record.get("stderr", "")))
+        return cls(
+            os_name=OSName[header["os_name"]],
+            os_bitness=OSBitness[header["os_bitness"]],
+            os_type=OSType[header["os_type"]] if header["os_type"] else None,
+            host=header["host"],
+            entries=entries,
+        )
+
+
+def devcon_subcommand(command: str) -> Optional[str]:
+    """
+    Get devcon subcommand of single devcon command line.
+
+    :param command: command line, e.g. c:\\devcon\\devcon.exe /r restart "@PCI\\..."
+    :return: subcommand, e.g. restart, None if command is not a single devcon command
+    """
+    if " & " in command:
+        return None
+    args = [arg.strip('"') for arg in shlex.split(command, posix=False)]
+    if not args or not args[0].lower().endswith(_DEVCON_EXECUTABLES):
+        return None
+    args = [arg for arg in args[1:] if arg.lower() != "/r"]
+    return args[0].lower() if args else None
+
+
+def _normalize(text: str) -> str:
+    """Replace per-process delimiters of chained commands with placeholder."""
+    return _DELIMITER_RE.sub(_DELIMITER_PLACEHOLDER, text)
+
+
+class RecordingConnection(Connection):
+    """
+    Connection wrapper recording every executed command with its output into DevconCorpus.
+
+    Pass it to Devcon instead of the wrapped connection, then save recorded corpus with save().
+    Everything else is delegated to the wrapped connection.
+    """
+
+    def __init__(self, connection: Connection):
+        """
+        Initialize recording wrapper.
+
+        :param connection: connection to host being recorded
+        """
+        self.connection = connection
+        super().__init__()
+        self.corpus = DevconCorpus(
+            os_name=connection.get_os_name(),
+            os_bitness=connection.get_os_bitness(),
+            os_type=self._get_os_type(connection),
+            host=None if getattr(connection, "_ip", None) is None else str(connection._ip),
+        )
+        self._ip = getattr(connection, "_ip", None)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_os_type(connection: Connection) -> Optional[OSType]:
+        """Get OS type of host, None if connection does not report it."""
+        try:
+            return connection.get_os_type()
+        except NotImplementedError:
+            return None
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "connection":
+            raise AttributeError(name)
+        return getattr(self.connection, name)
+
+    def execute_command(self, command: str, **kwargs) -> ConnectionCompletedProcess:
+        """
+        Execute command on wrapped connection and record it, also when it fails with unexpected return code.
+
+        :param command: command line to execute
+        :param kwargs: arguments of Connection.execute_command
+        :return: ConnectionCompletedProcess object
+        """
+        try:
+            result = self.connection.execute_command(command, **kwargs)
+        except subprocess.CalledProcessError as e:
+            self._record(CorpusEntry(command, e.output or "", e.returncode, e.stderr or ""))
+            raise
+        self._record(CorpusEntry(command, result.stdout or "", result.return_code, result.stderr or ""))
+        return result
+
+    def _record(self, entry: CorpusEntry) -> None:
+        """Append normalized entry to corpus."""
+        entry.command, entry.stdout = _normalize(entry.command), _normalize(entry.stdout)
+        with self._lock:
+            self.corpus.entries.append(entry)
+
+    def save(self, path: Union[Path, str]) -> None:
+        """
+        Save recorded corpus to file.
+
+        :param path: path of corpus file, conventionally with .jsonl.gz suffix
+        """
+        with self._lock:
+            self.corpus.save(path)
+
+    def get_os_type(self) -> OSType:
+        """Get type of client os."""
+        return self.connection.get_os_type()
+
+    def get_os_name(self) -> OSName:
+        """Get name of client os."""
+        return self.connection.get_os_name()
+
+    def get_os_bitness(self) -> OSBitness:
+        """Get bitness of client os."""
+        return self.connection.get_os_bitness()
+
+    def get_cpu_architecture(self) -> CPUArchitecture:
+        """Get CPU architecture of Host."""
+        return self.connection.get_cpu_architecture()
+
+    def restart_platform(self) -> None:
+        """Reboot host."""
+        self.connection.restart_platform()
+
+    def shutdown_platform(self) -> None:
+        """Shutdown host."""
+        self.connection.shutdown_platform()
+
+    def wait_for_host(self, timeout: int = 60) -> None:
+        """Wait for host availability."""
+        self.connection.wait_for_host(timeout=timeout)
+
+    @property
+    def path(self) -> Any:
+        """Path class of host."""
+        return self.connection.path
+
+    def disconnect(self) -> None:
+        """Close connection with host."""
+        self.connection.disconnect()
+
+
+class ReplayConnection(SimulatedWindowsConnection):
+    """
+    Connection answering commands with outputs recorded in DevconCorpus.
+
+    Responses to the same command are served in recorded order, starting over once all were served,
+    so replay is deterministic and can be repeated. With strict=True commands must also come in recorded order.
+    Round trips are accounted like by FakeDevconConnection, with configurable latency and bandwidth.
+    """
+
+    def __init__(
+        self,
+        corpus: Union[DevconCorpus, Path, str],
+        *,
+        strict: bool = False,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize replay connection.
+
+        :param corpus: recorded corpus or path of corpus file
+        :param strict: require commands in exactly recorded order
+        :param latency: delay of every round trip in seconds
+        :param bandwidth: transfer speed in bytes per second, None for unlimited
+        :param sleep: function used for injecting delays
+        """
+        self.corpus = corpus if isinstance(corpus, DevconCorpus) else DevconCorpus.load(corpus)
+        super().__init__(latency=latency, bandwidth=bandwidth, os_bitness=self.corpus.os_bitness, sleep=sleep)
+        if self.corpus.host is not None:
+            self._ip = self.corpus.host
+        self.strict = strict
+        self._responses: Dict[str, List[CorpusEntry]] = {}
+        for entry in self.corpus.entries:
+            self._responses.setdefault(entry.command, []).append(entry)
+        self._served: Dict[str, int] = {}
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def rewind(self) -> None:
+        """Start serving responses from the beginning of the corpus."""
+        with self._lock:
+            self._served = {}
+            self._position = 0
+
+    def execute_command(
+        self,
+        command: str,
+        *,
+        expected_return_codes: Iterable | None = frozenset({0}),
+        custom_exception: Type[ConnectionCalledProcessError] = None,
+        **kwargs,
+    ) -> ConnectionCompletedProcess:
+        """
+        Answer command with recorded output.
+
+        :param command: command line to execute
+        :param expected_return_codes: return codes to be considered acceptable, None for any
+        :param custom_exception: exception raised on unexpected return code
+        :param kwargs: other arguments of Connection.execute_command, ignored
+        :return: ConnectionCompletedProcess object
+        :raises DevconReplayError: if command was not recorded, or in strict mode, not recorded at this position
+        :raises ConnectionCalledProcessError: or custom_exception if recorded return code is unexpected
+        """
+        delimiters = _DELIMITER_RE.findall(command)
+        entry = self._next_entry(_normalize(command))
+        stdout = entry.stdout
+        if delimiters:
+            stdout = stdout.replace(_DELIMITER_PLACEHOLDER, delimiters[0])
+        self._account(command, stdout)
+        return self._complete(
+            command, stdout, entry.return_code, expected_return_codes, custom_exception, stderr=entry.stderr
+        )
+
+    def _next_entry(self, command: str) -> CorpusEntry:
+        """Get recorded response to normalized command."""
+        with self._lock:
+            if self.strict:
+                entries = self.corpus.entries
+                position = self._position % len(entries) if entries else 0
+                if not entries or entries[position].command != command:
+                    expected = entries[position].command if entries else None
+                    raise DevconReplayError(f"Command {command} does not match recorded command {expected}")
+                self._position = position + 1
+                return entries[position]
+            responses = self._responses.get(command)
+            if not responses:
+                raise DevconReplayError(f"Command {command} was not recorded")
+            served = self._served.get(command, 0)
+            self._served[command] = served + 1
+            return responses[served % len(responses)]
+
+    def get_os_type(self) -> OSType:
+        """Get type of recorded host os."""
+        if self.corpus.os_type is None:
+            raise NotImplementedError("OS type was not recorded")
+        return self.corpus.os_type
+
+    def get_os_name(self) -> OSName:
+        """Get name of recorded host os."""
+        return self.corpus.os_name
@@ -0,0 +1,388 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Synthetic devcon device model and output generator."""
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+_INDENT = " " * 4
+
+_SETUP_CLASSES = {
+    "Net": "Network adapters",
+    "System": "System devices",
+    "USB": "Universal Serial Bus controllers",
+    "SoftwareDevice": "Software devices",
+    "Bluetooth": "Bluetooth",
+}
+
+
+@dataclass
+class SyntheticDevice:
+    """Structure describing single device of synthetic device tree."""
+
+    device_instance_id: str
+    name: str
+    setup_class: str
+    hardware_ids: List[str]
+    compatible_ids: List[str] = field(default_factory=list)
+    driver_nodes: List[Dict[str, str]] = field(default_factory=list)
+    installed_from: str = ""
+    driver_files: List[str] = field(default_factory=list)
+    resources: List[str] = field(default_factory=list)
+    enabled: bool = True
+    started: bool = True
+    problem_code: Optional[int] = None
+
+
+@dataclass
+class SyntheticDriverPackage:
+    """Structure describing single third-party driver package of synthetic driver store."""
+
+    published_name: str
+    provider: Optional[str] = None
+    class_name: Optional[str] = None
+    driver_date: Optional[str] = None
+    driver_version: Optional[str] = None
+
+
+def _driver_node(rng: random.Random, inf_file: str, inf_section: str, description: str, provider: str) -> dict:
+    """Create driver node details in format used by DevconParser."""
+    return {
+        "inf_file": inf_file,
+        "inf_section": inf_section,
+        "driver_desc": description,
+        "manufacturer_name": provider,
+        "provider_name": provider,
+        "driver_date": f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/{rng.randint(2006, 2025)}",
+        "driver_version": f"{rng.randint(1, 30)}.{rng.randint(0, 99)}.{rng.randint(0, 9999)}.{rng.randint(0, 99)}",
+        "driver_node_rank": str(rng.choice([0xFF0000, 0xFF2006, 0xFF2001, 0x0D2001])),
+        "driver_node_flags": f"{rng.choice([0x00142044, 0x00102044, 0x00042044, 0x00003044]):08X}",
+    }
+
+
+def _intel_nic(rng: random.Random, index: int, ordinal: int) -> SyntheticDevice:
+    """Create Intel Ethernet physical or virtual function."""
+    if rng.random() < 0.75:
+        dev_id, name, inf = "1889", f"Intel(R) Ethernet Adaptive Virtual Function #{ordinal}", "oem12.inf [VF_1889]"
+        driver = "iavf"
+    else:
+        dev_id, name, inf = "1592", f"Intel(R) Ethernet Network Adapter E810-C-Q2 #{ordinal}", "oem5.inf [F1592]"
+        driver = "icea"
+    hw_base = f"PCI\\VEN_8086&DEV_{dev_id}&SUBSYS_00028086"
+    store = f"C:\\Windows\\System32\\DriverStore\\FileRepository\\{driver}.inf_amd64_{rng.getrandbits(64):016x}"
+    inf_file = f"C:\\Windows\\INF\\{inf.split()[0]}"
+    return SyntheticDevice(
+        device_instance_id=f"{hw_base}&REV_02\\4&273B1A92&0&{index:06X}",
+        name=name,
+        setup_class="Net",
+        hardware_ids=[f"{hw_base}&REV_02", hw_base, f"PCI\\VEN_8086&DEV_{dev_id}&CC_020000"],
+        compatible_ids=[f"PCI\\VEN_8086&DEV_{dev_id}&REV_02", f"PCI\\VEN_8086&DEV_{dev_id}", "PCI\\VEN_8086"],
+        driver_nodes=[
+            _driver_node(rng, inf_file, inf.split()[1].strip("[]"), name.split(" #")[0], "Intel")
+            for _ in range(rng.randint(1, 3))
+        ],
+        installed_from=f"C:\\Windows\\INF\\{inf}",
+        driver_files=[f"{store}\\{driver}.sys", f"{store}\\{driver}msg.dll"],
+        resources=[
+            f"MEM : {0x90000000 + index * 0x20000:08x}-{0x90000000 + index * 0x20000 + 0x1ffff:08x}",
+            f"IRQ : {4294967000 - index}",
+        ],
+    )
+
+
+def _pci_system(rng: random.Random, index: int, ordinal: int) -> SyntheticDevice:
+    """Create PCI base system device."""
+    dev_id = f"2F{rng.randint(0, 255):02X}"
+    hw_base = f"PCI\\VEN_8086&DEV_{dev_id}&SUBSYS_{dev_id}8086"
+    return SyntheticDevice(
+        device_instance_id=f"{hw_base}&REV_02\\3&1C6B4348&0&{index:06X}",
+        name="Base System Device",
+        setup_class="System",
+        hardware_ids=[f"{hw_base}&REV_02", hw_base, f"PCI\\VEN_8086&DEV_{dev_id}&CC_088000"],
+        compatible_ids=[f"PCI\\VEN_8086&DEV_{dev_id}", "PCI\\VEN_8086&CC_088000", "PCI\\CC_0880"],
+        driver_nodes=[_driver_node(rng, "C:\\Windows\\INF\\machine.inf", "NO_DRV", "Base System Device", "Microsoft")],
+        installed_from="C:\\Windows\\INF\\machine.inf [NO_DRV]",
+        resources=[f"MEM : {0x80000000 + index * 0x1000:08x}-{0x80000000 + index * 0x1000 + 0xfff:08x}"],
+    )
+
+
+def _acpi(rng: random.Random, index: int, ordinal: int) -> SyntheticDevice:
+    """Create ACPI device without resources nor driver files."""
+    return SyntheticDevice(
+        device_instance_id=f"ACPI\\PNP0C0F\\{index}",
+        name="PCI Interrupt Link",
+        setup_class="System",
+        hardware_ids=["ACPI\\VEN_PNP&DEV_0C0F", "ACPI\\PNP0C0F", "*PNP0C0F"],
+        driver_nodes=[_driver_node(rng, "C:\\Windows\\INF\\machine.inf", "NO_DRV", "PCI Interrupt Link", "Microsoft")],
+        installed_from="C:\\Windows\\INF\\machine.inf [NO_DRV]",
+    )
+
+
+def _usb(rng: random.Random, index: int, ordinal: int) -> SyntheticDevice:
+    """Create USB hub."""
+    return SyntheticDevice(
+        device_instance_id=f"USB\\VID_8087&PID_800A\\5&30A468B4&0&{index}",
+        name="Generic USB Hub",
+        setup_class="USB",
+        hardware_ids=["USB\\VID_8087&PID_800A&REV_0005", "USB\\VID_8087&PID_800A"],
+        compatible_ids=["USB\\Class_09&SubClass_00&Prot_01", "USB\\Class_09&SubClass_00", "USB\\Class_09"],
+        driver_nodes=[],
+        installed_from="C:\\Windows\\INF\\usb.inf [StandardHub.Dev.NT]",
+        driver_files=["C:\\Windows\\system32\\DRIVERS\\usbhub.sys"],
+    )
+
+
+def _software(rng: random.Random, index: int, ordinal: int) -> SyntheticDevice:
+    """Create software device without hardware resources."""
+    return SyntheticDevice(
+        device_instance_id=f"SWD\\MSRRAS\\MS_MINIPORT{index}",
+        name=f"WAN Miniport (IKEv2) #{ordinal}",
+        setup_class="Net",
+        hardware_ids=["ms_agilevpnminiport"],
+        driver_nodes=[
+            _driver_node(rng, "C:\\Windows\\INF\\netavpna.inf", "Ndi-Mp-AgileVpn", "WAN Miniport (IKEv2)", "Microsoft")
+        ],
+        installed_from="C:\\Windows\\INF\\netavpna.inf [Ndi-Mp-AgileVpn]",
+    )
+
+
+_DEVICE_FACTORIES = ((_intel_nic, 0.4), (_pci_system, 0.25), (_acpi, 0.15), (_usb, 0.1), (_software, 0.1))
+
+
+def generate_devices(count: int, seed: int = 0) -> List[SyntheticDevice]:
+    """
+    Generate reproducible synthetic device tree.
+
+    Tree is dominated by Intel Ethernet physical and virtual functions, mixed with system, ACPI, USB
+    and software devices, which is what the test hosts look like.
+
+    :param count: number of devices to generate
+    :param seed: seed for random generator, same seed gives the same device tree
+    :return: list of generated devices
+    """
+    rng = random.Random(seed)
+    factories = [factory for factory, _ in _DEVICE_FACTORIES]
+    weights = [weight for _, weight in _DEVICE_FACTORIES]
+    ordinals = dict.fromkeys(factories, 0)
+    devices = []
+    for index in range(count):
+        factory = rng.choices(factories, weights)[0]
+        ordinals[factory] += 1
+        devices.append(factory(rng, index, ordinals[factory]))
+    return devices
+
+
+def generate_driver_packages(devices: List[SyntheticDevice]) -> List[SyntheticDriverPackage]:
+    """
+    Generate driver store holding third-party (oemNN.inf) driver packages installed for devices.
+
+    :param devices: synthetic device tree
+    :return: driver packages, one per published INF name, taken from first driver node of the first device using it
+    """
+    packages = {}
+    for device in devices:
+        published_name = device.installed_from.split()[0].rsplit("\\", 1)[-1] if device.installed_from else ""
+        if not published_name.lower().startswith("oem") or published_name in packages or not device.driver_nodes:
+            continue
+        node = device.driver_nodes[0]
+        packages[published_name] = SyntheticDriverPackage(
+            published_name=published_name,
+            provider=node["provider_name"],
+            class_name=_SETUP_CLASSES.get(device.setup_class),
+            driver_date=node["driver_date"],
+            driver_version=node["driver_version"],
+        )
+    return sorted(packages.values(), key=lambda package: int(package.published_name[3:-4]))
+
+
+class SyntheticDevconOutput:
+    """Class rendering devcon command outputs for synthetic devices."""
+
+    def find(self, devices: List[SyntheticDevice]) -> str:
+        """
+        Render output of command: devcon find.
+
+        :param devices: devices matching the command
+        :return: devcon output
+        """
+        lines = [f"{device.device_instance_id:<60}: {device.name}" for device in devices]
+        lines.append(f"{len(devices)} matching device(s) found.")
+        return "\n".join(lines) + "\n"
+
+    def listclass(self, devices: List[SyntheticDevice], setup_class: str) -> str:
+        """
+        Render output of command: devcon listclass.
+
+        :param devices: devices to choose setup class members from
+        :param setup_class: name of device setup class, e.g. Net
+        :return: devcon output
+        """
+        members = [device for device in devices if device.setup_class.lower() == setup_class.lower()]
+        class_name = next((name for name in _SETUP_CLASSES if name.lower() == setup_class.lower()), setup_class)
+        if not members:
+            return f'There are no devices in setup class "{class_name}" ({_SETUP_CLASSES.get(class_name, "")}).\n'
+        lines = [f'Listing {len(members)} devices in setup class "{class_name}" ({_SETUP_CLASSES.get(class_name)}).']
+        lines.extend(f"{device.device_instance_id:<60}: {device.name}" for device in members)
+        return "\n".join(lines) + "\n"
+
+    def hwids(self, devices: List[SyntheticDevice]) -> str:
+        """
+        Render output of command: devcon hwids.
+
+        :param devices: devices matching the command
+        :return: devcon output
+        """
+        lines = []
+        for device in devices:
+            lines.append(device.device_instance_id)
+            lines.append(f"{_INDENT}Name: {device.name}")
+            if not device.hardware_ids and not device.compatible_ids:
+                lines.append(f"{_INDENT}No hardware/compatible IDs found for this device.")
+                continue
+            if device.hardware_ids:
+                lines.append(f"{_INDENT}Hardware IDs:")
+                lines.extend(f"{_INDENT * 2}{hw_id}" for hw_id in device.hardware_ids)
+            if device.compatible_ids:
+                lines.append(f"{_INDENT}Compatible IDs:")
+                lines.extend(f"{_INDENT * 2}{compatible_id}" for compatible_id in device.compatible_ids)
+        lines.append(f"{len(devices)} matching device(s) found.")
+        return "\n".join(lines) + "\n"
+
+    def drivernodes(self, devices: List[SyntheticDevice]) -> str:
+        """
+        Render output of command: devcon drivernodes.
+
+        :param devices: devices matching the command
+        :return: devcon output
+        """
+        lines = []
+        for device in devices:
+            lines.append(device.device_instance_id)
+            lines.append(f"{_INDENT}Name: {device.name}")
+            if not device.driver_nodes:
+                lines.append(f"{_INDENT}No driver nodes found for this device.")
+            for num, node in enumerate(device.driver_nodes):
+                lines.extend(
+                    [
+                        f"Driver node #{num}:",
+                        f"{_INDENT}Inf file is {node['inf_file']}",
+                        f"{_INDENT}Inf section is {node['inf_section']}",
+                        f"{_INDENT}Driver description is {node['driver_desc']}",
+                        f"{_INDENT}Manufacturer name is {node['manufacturer_name']}",
+                        f"{_INDENT}Provider name is {node['provider_name']}",
+                        f"{_INDENT}Driver date is {node['driver_date']}",
+                        f"{_INDENT}Driver version is {node['driver_version']}",
+                        f"{_INDENT}Driver node rank is {node['driver_node_rank']}",
+                        f"{_INDENT}Driver node flags are {node['driver_node_flags']}",
+                        f"{_INDENT * 2}Inf is digitally signed",
+                    ]
+                )
+        lines.append(f"{len(devices)} matching device(s) found.")
+        return "\n".join(lines) + "\n"
+
+    def driverfiles(self, devices: List[SyntheticDevice]) -> str:
+        """
+        Render output of command: devcon driverfiles.
+
+        :param devices: devices matching the command
+        :return: devcon output
+        """
+        lines = []
+        for device in devices:
+            lines.append(device.device_instance_id)
+            lines.append(f"{_INDENT}Name: {device.name}")
+            if device.driver_files:
+                lines.append(
+                    f"{_INDENT}Driver installed from {device.installed_from}. "
+                    f"{len(device.driver_files)} file(s) used by driver:"
+                )
+                lines.extend(f"{_INDENT * 2}{driver_file}" for driver_file in device.driver_files)
+            else:
+                lines.append(
+                    f"{_INDENT}Driver installed from {device.installed_from}. The driver is not using any files."
+                )
+        lines.append(f"{len(devices)} matching device(s) found.")
+        return "\n".join(lines) + "\n"
+
+    def resources(self, devices: List[SyntheticDevice]) -> str:
+        """
+        Render output of command: devcon resources.
+
+        :param devices: devices matching the command
+        :return: devcon output
+        """
+        lines = []
+        for device in devices:
+            lines.append(device.device_instance_id)
+            lines.append(f"{_INDENT}Name: {device.name}")
+            if device.resources:
+                lines.append(f"{_INDENT}Device is currently using the following resources:")
+                lines.extend(f"{_INDENT * 2}{resource}" for resource in device.resources)
+            else:
+                lines.append(f"{_INDENT}Device is not using any resources.")
+        lines.append(f"{len(devices)} matching device(s) found.")
+        return "\n".join(lines) + "\n"
+
+    def status(self, devices: List[SyntheticDevice]) -> str:
+        """
+        Render output of command: devcon status.
+
+        :param devices: devices matching the command
+        :return: devcon output
+        """
+        lines = []
+        for device in devices:
+            lines.append(device.device_instance_id)
+            lines.append(f"{_INDENT}Name: {device.name}")
+            if not device.enabled:
+                lines.append(f"{_INDENT}Device is disabled.")
+            elif device.problem_code is not None:
+                lines.append(f"{_INDENT}Device has a problem: {device.problem_code:02d}.")
+            elif not device.started:
+                lines.append(f"{_INDENT}Device is currently stopped.")
+            else:
+                lines.append(f"{_INDENT}Driver is running.")
+        lines.append(f"{len(devices)} matching device(s) found.")
+        return "\n".join(lines) + "\n"
+
+    def dp_enum(self, packages: List[SyntheticDriverPackage]) -> str:
+        """
+        Render output of command: devcon dp_enum.
+
+        :param packages: third-party driver packages in driver store
+        :return: devcon output
+        """
+        if not packages:
+            return "There are no 3rd party Driver Packages on this machine.\n"
+        lines = ["The following 3rd party Driver Packages are on this machine:"]
+        for package in packages:
+            lines.append(package.published_name)
+            lines.append(f"{_INDENT}Provider: {package.provider or 'unknown'}")
+            lines.append(f"{_INDENT}Class: {package.class_name or 'unknown'}")
+            lines.append(f"{_INDENT}Date: {package.driver_date or 'unknown'}")
+            lines.append(f"{_INDENT}Version: {package.driver_version or 'unknown'}")
+        return "\n".join(lines) + "\n"
+
+    def render(self, command: str, devices: List[SyntheticDevice], setup_class: Optional[str] = None) -> str:
+        """
+        Render output of given devcon command.
+
+        :param command: devcon command, one of: find, listclass, hwids, drivernodes, driverfiles, resources, status
+        :param devices: devices matching the command
+        :param setup_class: device setup class, required for listclass
+        :return: devcon output
+        """
+        if command == "listclass":
+            return self.listclass(devices, setup_class)
+        renderers = {
+            "find": self.find,
+            "hwids": self.hwids,
+            "drivernodes": self.drivernodes,
+            "driverfiles": self.driverfiles,
+            "resources": self.resources,
+            "status": self.status,
+        }
+        if command not in renderers:
+            raise AttributeError(f"Invalid command: {command}. Valid commands: {['listclass', *renderers]}")
+        return renderers[command](devices)
@@ -0,0 +1,151 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+End-to-end benchmark of Devcon workflows against simulated host with injected round trip latency.
+
+Usage:
+    python -m tests.benchmark.bench_end_to_end --devices 500 --latency 0.02 --bandwidth 10000000
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from mfd_devcon import Devcon
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+@dataclass
+class WorkflowBenchmarkResult:
+    """Structure for result of single workflow benchmark."""
+
+    workflow: str
+    round_trips: int
+    bytes_sent: int
+    bytes_received: int
+    injected_delay: float
+    wall_time: float
+
+
+def _vf_names(connection: FakeDevconConnection, count: int) -> List[str]:
+    """Get names of first virtual functions in device model."""
+    return [device.name for device in connection.devices if "Virtual Function" in device.name][:count]
+
+
+def _vf_ids(connection: FakeDevconConnection, count: int) -> List[str]:
+    """Get instance IDs of first virtual functions in device model."""
+    return [device.device_instance_id for device in connection.devices if "Virtual Function" in device.name][:count]
+
+
+def get_device_id_workflow(devcon: Devcon, connection: FakeDevconConnection) -> None:
+    """Resolve names of 8 virtual functions to instance IDs."""
+    for name in _vf_names(connection, 8):
+        devcon.get_device_id(device_name=name)
+
+
+def get_device_ids_workflow(devcon: Devcon, connection: FakeDevconConnection) -> None:
+    """Resolve names of 8 virtual functions to instance IDs from a single enumeration."""
+    devcon.get_device_ids(_vf_names(connection, 8))
+
+
+def enable_disable_workflow(devcon: Devcon, connection: FakeDevconConnection) -> None:
+    """Disable and enable 16 virtual functions."""
+    for device_id in _vf_ids(connection, 16):
+        devcon.disable_devices(device_id=device_id)
+        devcon.enable_devices(device_id=device_id)
+
+
+def batch_enable_disable_workflow(devcon: Devcon, connection: FakeDevconConnection) -> None:
+    """Disable and enable 16 virtual functions, each with one devcon call."""
+    device_ids = _vf_ids(connection, 16)
+    devcon.disable_devices_batch(device_ids)
+    devcon.enable_devices_batch(device_ids)
+
+
+def full_inventory_workflow(devcon: Devcon, connection: FakeDevconConnection) -> None:
+    """Read every piece of information about all devices."""
+    devcon.find_devices(pattern="*")
+    devcon.get_hwids(pattern="*")
+    devcon.get_drivernodes(pattern="*")
+    devcon.get_driverfiles(pattern="*")
+    devcon.get_resources(pattern="*")
+
+
+def snapshot_workflow(devcon: Devcon, connection: FakeDevconConnection) -> None:
+    """Read every piece of information about all devices in a single round trip."""
+    devcon.snapshot(pattern="*")
+
+
+WORKFLOWS: Dict[str, Callable[[Devcon, FakeDevconConnection], None]] = {
+    "get_device_id x8": get_device_id_workflow,
+    "get_device_ids x8": get_device_ids_workflow,
+    "disable+enable x16": enable_disable_workflow,
+    "batch disable+enable x16": batch_enable_disable_workflow,
+    "full inventory": full_inventory_workflow,
+    "snapshot": snapshot_workflow,
+}
+
+
+def _measure(workflow: str, func: Callable[[], None], connection: FakeDevconConnection) -> WorkflowBenchmarkResult:
+    """Measure traffic and wall time of single workflow."""
+    connection.reset_stats()
+    start = time.perf_counter()
+    func()
+    wall_time = time.perf_counter() - start
+    stats = connection.stats
+    return WorkflowBenchmarkResult(
+        workflow, stats.round_trips, stats.bytes_sent, stats.bytes_received, stats.injected_delay, wall_time
+    )
+
+
+def run_end_to_end_benchmarks(
+    devices: int = 500, latency: float = 0.02, bandwidth: Optional[float] = None, seed: int = 0
+) -> List[WorkflowBenchmarkResult]:
+    """
+    Run every workflow against fresh simulated host.
+
+    :param devices: number of devices of simulated host
+    :param latency: injected delay of every round trip in seconds
+    :param bandwidth: simulated transfer speed in bytes per second, None for unlimited
+    :param seed: seed of synthetic device tree
+    :return: benchmark results, the first one is Devcon construction
+    """
+    connection = FakeDevconConnection(generate_devices(devices, seed=seed), latency=latency, bandwidth=bandwidth)
+    results = [_measure("Devcon()", lambda: Devcon(connection=connection), connection)]
+    for workflow, func in WORKFLOWS.items():
+        connection = FakeDevconConnection(generate_devices(devices, seed=seed), latency=latency, bandwidth=bandwidth)
+        devcon = Devcon(connection=connection)
+        results.append(_measure(workflow, lambda: func(devcon, connection), connection))
+    return results
+
+
+def format_results(results: List[WorkflowBenchmarkResult]) -> str:
+    """
+    Format benchmark results as a table.
+
+    :param results: benchmark results
+    :return: printable table
+    """
+    lines = [f"{'workflow':<22}{'round trips':>13}{'sent KiB':>11}{'received KiB':>14}{'delay s':>10}{'wall s':>10}"]
+    for result in results:
+        lines.append(
+            f"{result.workflow:<22}{result.round_trips:>13}{result.bytes_sent / 1024:>11.1f}"
+            f"{result.bytes_received / 1024:>14.1f}{result.injected_delay:>10.3f}{result.wall_time:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run end-to-end benchmarks from command line."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--devices", type=int, default=500)
+    arg_parser.add_argument("--latency", type=float, default=0.02, help="round trip latency in seconds")
+    arg_parser.add_argument("--bandwidth", type=float, default=None, help="bytes per second, unlimited by default")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+    print(format_results(run_end_to_end_benchmarks(args.devices, args.latency, args.bandwidth, args.seed)))
+
+
+if __name__ == "__main__":
+    main()
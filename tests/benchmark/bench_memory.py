@@ -0,0 +1,131 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Benchmark of memory held by parsed records: legacy dict-based records vs slotted and frozen records.
+
+Strings are shared between variants, so only memory of record objects and their containers is compared.
+
+Usage:
+    python -m tests.benchmark.bench_memory --records 100000
+"""
+
+import argparse
+import tracemalloc
+from dataclasses import dataclass, make_dataclass
+from typing import Callable, Iterable, List
+
+from mfd_devcon import DevconParser
+from mfd_devcon.testing import SyntheticDevconOutput, generate_devices
+
+_LegacyHwids = make_dataclass("_LegacyHwids", ["device_pnp", "name", "hardware_ids", "compatible_ids"])
+_LegacyDriverNodes = make_dataclass("_LegacyDriverNodes", ["device_pnp", "name", "driver_nodes"])
+_LegacyResources = make_dataclass("_LegacyResources", ["device_pnp", "name", "resources"])
+
+
+@dataclass
+class MemoryBenchmarkResult:
+    """Structure for result of single memory benchmark."""
+
+    record: str
+    variant: str
+    records: int
+    memory: int
+
+    @property
+    def bytes_per_100k(self) -> float:
+        """Memory held by 100k records in bytes."""
+        return self.memory / self.records * 100_000 if self.records else 0.0
+
+
+def measure(record: str, variant: str, build: Callable[[], list]) -> MemoryBenchmarkResult:
+    """
+    Measure memory held by records built by function.
+
+    :param record: name of record type
+    :param variant: name of record variant
+    :param build: function building list of records
+    :return: benchmark result
+    """
+    tracemalloc.start()
+    records = build()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return MemoryBenchmarkResult(record, variant, len(records), memory)
+
+
+def run_memory_benchmarks(records: int = 100_000, seed: int = 0) -> List[MemoryBenchmarkResult]:
+    """
+    Benchmark memory of hwids, drivernodes and resources records in legacy, slotted and frozen variants.
+
+    :param records: number of records of each type
+    :param seed: seed of synthetic device tree
+    :return: benchmark results
+    """
+    parser = DevconParser()
+    renderer = SyntheticDevconOutput()
+    devices = generate_devices(records, seed=seed)
+    hwids = parser.parse_devcon_hwids(renderer.hwids(devices))
+    drivernodes = parser.parse_devcon_drivernodes(renderer.drivernodes(devices))
+    resources = parser.parse_devcon_resources(renderer.resources(devices))
+    cases = {
+        "hwids": {
+            "legacy": lambda: [
+                _LegacyHwids(e.device_pnp, e.name, list(e.hardware_ids), list(e.compatible_ids)) for e in hwids
+            ],
+            "slotted": lambda: [
+                type(e)(e.device_pnp, e.name, list(e.hardware_ids), list(e.compatible_ids)) for e in hwids
+            ],
+            "frozen": lambda: [e.freeze() for e in hwids],
+        },
+        "drivernodes": {
+            "legacy": lambda: [
+                _LegacyDriverNodes(e.device_pnp, e.name, {num: dict(node) for num, node in e.driver_nodes.items()})
+                for e in drivernodes
+            ],
+            "slotted": lambda: [
+                type(e)(e.device_pnp, e.name, {num: type(node)(**node) for num, node in e.driver_nodes.items()})
+                for e in drivernodes
+            ],
+            "frozen": lambda: [e.freeze() for e in drivernodes],
+        },
+        "resources": {
+            "legacy": lambda: [_LegacyResources(e.device_pnp, e.name, list(e.resources)) for e in resources],
+            "slotted": lambda: [type(e)(e.device_pnp, e.name, list(e.resources)) for e in resources],
+            "frozen": lambda: [e.freeze() for e in resources],
+        },
+    }
+    return [
+        measure(record, variant, build) for record, variants in cases.items() for variant, build in variants.items()
+    ]
+
+
+def format_results(results: Iterable[MemoryBenchmarkResult]) -> str:
+    """
+    Format benchmark results as a table, with memory saved relative to legacy variant.
+
+    :param results: benchmark results
+    :return: printable table
+    """
+    results = list(results)
+    legacy = {result.record: result.bytes_per_100k for result in results if result.variant == "legacy"}
+    lines = [f"{'record':<14}{'variant':<10}{'records':>9}{'MiB per 100k':>14}{'saved':>9}"]
+    for result in results:
+        saved = 1 - result.bytes_per_100k / legacy[result.record] if legacy.get(result.record) else 0.0
+        lines.append(
+            f"{result.record:<14}{result.variant:<10}{result.records:>9}"
+            f"{result.bytes_per_100k / 2**20:>14.2f}{saved:>9.0%}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run memory benchmarks from command line."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--records", type=int, default=100_000)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+    print(format_results(run_memory_benchmarks(args.records, seed=args.seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Benchmark of DevconParser methods on synthetic devcon outputs.
+
+Usage:
+    python -m tests.benchmark.bench_parsers --devices 10 1000 100000 --repeat 5
+    python -m tests.benchmark.bench_parsers --corpus host1.jsonl.gz host2.jsonl.gz
+"""
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Union
+
+from mfd_devcon import DevconParser
+from mfd_devcon.testing import (
+    DevconCorpus,
+    FakeDevconConnection,
+    SyntheticDevconOutput,
+    generate_devices,
+    generate_driver_packages,
+)
+
+_DEVCON = "devcon.exe"
+_SNAPSHOT_DELIMITER = "==mfd_devcon_benchmark=="
+
+_CORPUS_PARSERS: Dict[str, Callable[[DevconParser, str], Any]] = {
+    "find": lambda parser, output: parser.parse_devcon_devices(output),
+    "listclass": lambda parser, output: parser.parse_devcon_devices(output, command="listclass"),
+    "hwids": lambda parser, output: parser.parse_devcon_hwids(output),
+    "drivernodes": lambda parser, output: parser.parse_devcon_drivernodes(output),
+    "driverfiles": lambda parser, output: parser.parse_devcon_driverfiles(output),
+    "resources": lambda parser, output: parser.parse_devcon_resources(output),
+    "status": lambda parser, output: parser.parse_devcon_status(output),
+    "dp_enum": lambda parser, output: parser.parse_devcon_dp_enum(output),
+    "enable": lambda parser, output: parser.parse_devcon_mutation(output).devices,
+    "disable": lambda parser, output: parser.parse_devcon_mutation(output).devices,
+    "restart": lambda parser, output: parser.parse_devcon_mutation(output).devices,
+    "remove": lambda parser, output: parser.parse_devcon_mutation(output).devices,
+}
+
+
+@dataclass
+class ParserBenchmarkResult:
+    """Structure for result of single parser benchmark."""
+
+    method: str
+    devices: int
+    output_bytes: int
+    best_time: float
+    peak_memory: int
+
+    @property
+    def mb_per_second(self) -> float:
+        """Parse throughput in megabytes of output per second."""
+        return self.output_bytes / self.best_time / 1e6 if self.best_time else float("inf")
+
+    @property
+    def devices_per_second(self) -> float:
+        """Parse throughput in devices per second."""
+        return self.devices / self.best_time if self.best_time else float("inf")
+
+
+def measure(method: str, func: Callable[[], object], devices: int, output_bytes: int, repeat: int):
+    """
+    Measure best wall time and peak traced memory of func.
+
+    Memory is measured in separate run, so tracemalloc overhead does not affect timings.
+
+    :param method: name of benchmarked method
+    :param func: callable parsing prepared output
+    :param devices: number of devices in the output
+    :param output_bytes: size of the output
+    :param repeat: number of timed runs, best one is reported
+    :return: benchmark result
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return ParserBenchmarkResult(method, devices, output_bytes, min(timings), peak_memory)
+
+
+def _snapshot_output(devices: list) -> str:
+    """Get chained find, hwids, drivernodes, driverfiles and resources output of devices, as Devcon.snapshot runs."""
+    command = f" & echo {_SNAPSHOT_DELIMITER} & ".join(
+        f"{_DEVCON} {subcommand} *" for subcommand in ("find", "hwids", "drivernodes", "driverfiles", "resources")
+    )
+    return FakeDevconConnection(devices).execute_command(command).stdout
+
+
+def run_parser_benchmarks(device_counts: Iterable[int], repeat: int = 3, seed: int = 0) -> List[ParserBenchmarkResult]:
+    """
+    Benchmark every DevconParser.parse_* method for each number of devices.
+
+    :param device_counts: numbers of synthetic devices to benchmark against
+    :param repeat: number of timed runs per method
+    :param seed: seed of synthetic device tree
+    :return: benchmark results
+    """
+    parser = DevconParser()
+    renderer = SyntheticDevconOutput()
+    results = []
+    for count in device_counts:
+        devices = generate_devices(count, seed=seed)
+        cases = {
+            "parse_devcon_hwids": (renderer.hwids(devices), parser.parse_devcon_hwids, {}),
+            "parse_devcon_drivernodes": (renderer.drivernodes(devices), parser.parse_devcon_drivernodes, {}),
+            "parse_devcon_hwids[lazy, first 5]": (
+                renderer.hwids(devices),
+                lambda output: parser.parse_devcon_hwids(output, lazy=True)[:5],
+                {},
+            ),
+            "parse_devcon_driverfiles": (renderer.driverfiles(devices), parser.parse_devcon_driverfiles, {}),
+            "parse_devcon_resources": (renderer.resources(devices), parser.parse_devcon_resources, {}),
+            "parse_devcon_devices[find]": (renderer.find(devices), parser.parse_devcon_devices, {}),
+            "parse_devcon_devices[listclass]": (
+                renderer.listclass(devices, "Net"),
+                parser.parse_devcon_devices,
+                {"command": "listclass"},
+            ),
+            "parse_devcon_status": (renderer.status(devices), parser.parse_devcon_status, {}),
+            "parse_devcon_dp_enum": (
+                renderer.dp_enum(generate_driver_packages(devices)),
+                parser.parse_devcon_dp_enum,
+                {},
+            ),
+            "parse_devcon_mutation": (
+                FakeDevconConnection(devices).execute_command(f"{_DEVCON} disable *").stdout,
+                lambda output: parser.parse_devcon_mutation(output).devices,
+                {},
+            ),
+            "parse_devcon_snapshot": (
+                _snapshot_output(devices),
+                parser.parse_devcon_snapshot,
+                {"delimiter": _SNAPSHOT_DELIMITER},
+            ),
+        }
+        for method, (output, parse, kwargs) in cases.items():
+            parsed = len(parse(output, **kwargs))
+            results.append(
+                measure(method, lambda: parse(output, **kwargs), parsed, len(output.encode()), repeat=repeat)
+            )
+    return results
+
+
+def run_corpus_benchmarks(corpus_paths: Iterable[Union[Path, str]], repeat: int = 3) -> List[ParserBenchmarkResult]:
+    """
+    Benchmark DevconParser on outputs recorded on real hosts with RecordingConnection.
+
+    Every distinct output of a supported devcon command is parsed, so parser errors on recorded outputs fail the run.
+
+    :param corpus_paths: paths of corpus files
+    :param repeat: number of timed runs per output
+    :return: benchmark results, method is labeled with devcon command and corpus file name
+    """
+    parser = DevconParser()
+    results = []
+    for path in corpus_paths:
+        seen_outputs = set()
+        for entry in DevconCorpus.load(path).outputs():
+            parse = _CORPUS_PARSERS.get(entry.subcommand)
+            if parse is None or entry.stdout in seen_outputs:
+                continue
+            seen_outputs.add(entry.stdout)
+            output = entry.stdout
+            parsed = len(parse(parser, output))
+            results.append(
+                measure(
+                    f"{entry.subcommand} [{Path(path).name}]",
+                    lambda: parse(parser, output),
+                    parsed,
+                    len(output.encode()),
+                    repeat=repeat,
+                )
+            )
+    return results
+
+
+def format_results(results: Iterable[ParserBenchmarkResult]) -> str:
+    """
+    Format benchmark results as a table.
+
+    :param results: benchmark results
+    :return: printable table
+    """
+    lines = [
+        f"{'method':<34}{'devices':>9}{'output KiB':>12}{'best ms':>11}{'MB/s':>9}{'devices/s':>12}{'peak KiB':>11}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.method:<34}{result.devices:>9}{result.output_bytes / 1024:>12.1f}{result.best_time * 1e3:>11.2f}"
+            f"{result.mb_per_second:>9.1f}{result.devices_per_second:>12.0f}{result.peak_memory / 1024:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run parser benchmarks from command line."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--devices", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--corpus", nargs="+", default=None, help="recorded corpora to benchmark instead")
+    args = arg_parser.parse_args()
+    if args.corpus:
+        print(format_results(run_corpus_benchmarks(args.corpus, repeat=args.repeat)))
+    else:
+        print(format_results(run_parser_benchmarks(args.devices, repeat=args.repeat, seed=args.seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.async_devcon` module."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mfd_devcon import AsyncDevcon, DevconDevices, InMemoryMetrics
+from mfd_devcon.exceptions import DevconException
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+class TestAsyncDevcon:
+    @pytest.fixture()
+    def connection(self):
+        return FakeDevconConnection(generate_devices(10, seed=4))
+
+    def test_create_and_find_devices(self, connection):
+        async def main():
+            async with await AsyncDevcon.create(connection=connection) as devcon:
+                return await devcon.find_devices(pattern="*")
+
+        devices = asyncio.run(main())
+        assert len(devices) == 10
+        assert isinstance(devices[0], DevconDevices)
+        assert connection.stats.round_trips == 2
+
+    def test_create_with_metrics_sink(self, connection):
+        metrics = InMemoryMetrics()
+
+        async def main():
+            async with await AsyncDevcon.create(connection=connection, metrics_sink=metrics) as devcon:
+                await devcon.find_devices(pattern="*")
+                await devcon.get_hwids(pattern="*")
+
+        asyncio.run(main())
+        assert [(call.method, call.device_count) for call in metrics.calls()] == [
+            ("find_devices", 10),
+            ("get_hwids", 10),
+        ]
+
+    def test_iter_devices_is_async_generator(self, connection):
+        async def main():
+            async with await AsyncDevcon.create(connection=connection) as devcon:
+                return [device.device_instance_id async for device in devcon.iter_devices(pattern="*")]
+
+        assert asyncio.run(main()) == [device.device_instance_id for device in connection.devices]
+
+    def test_exceptions_are_propagated(self, connection):
+        async def main():
+            async with await AsyncDevcon.create(connection=connection) as devcon:
+                await devcon.find_devices(device_id="PCI\\VEN_0000&DEV_0000\\0")
+
+        with pytest.raises(DevconException, match="No matching devices found"):
+            asyncio.run(main())
+
+    def test_hosts_are_driven_concurrently(self):
+        connections = [
+            FakeDevconConnection(generate_devices(5, seed=seed), latency=0.2, sleep=time.sleep) for seed in range(4)
+        ]
+
+        async def main():
+            devcons = await asyncio.gather(*(AsyncDevcon.create(connection=connection) for connection in connections))
+            start = time.perf_counter()
+            results = await asyncio.gather(*(devcon.find_devices(pattern="*") for devcon in devcons))
+            elapsed = time.perf_counter() - start
+            await asyncio.gather(*(devcon.aclose() for devcon in devcons))
+            return results, elapsed
+
+        results, elapsed = asyncio.run(main())
+        assert [len(devices) for devices in results] == [5] * 4
+        assert elapsed < 0.6
+
+    def test_cancel_queued_call(self, connection):
+        release = threading.Event()
+
+        async def main():
+            async with await AsyncDevcon.create(connection=connection) as devcon:
+                connection._sleep = lambda delay: release.wait()
+                connection.latency = 1
+                running = asyncio.ensure_future(devcon.find_devices(pattern="*"))
+                queued = asyncio.ensure_future(devcon.disable_devices(pattern="*"))
+                await asyncio.sleep(0.05)
+                queued.cancel()
+                await asyncio.sleep(0.05)
+                release.set()
+                await running
+                with pytest.raises(asyncio.CancelledError):
+                    await queued
+
+        asyncio.run(main())
+        assert all(device.enabled for device in connection.devices)
+        assert not any("disable" in command for command in connection.stats.commands)
+
+    def test_attributes_and_private_members(self, connection):
+        async def main():
+            async with await AsyncDevcon.create(connection=connection) as devcon:
+                assert devcon.known_errors == devcon.devcon.known_errors
+                assert "get_hwids" in dir(devcon)
+                with pytest.raises(AttributeError):
+                    devcon._connection
+
+        asyncio.run(main())
+
+    def test_invalid_max_workers(self, connection):
+        with pytest.raises(ValueError, match="max_workers"):
+            AsyncDevcon(devcon=None, max_workers=0)
@@ -0,0 +1,79 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for batch mutation methods of `mfd_devcon` module."""
+
+import pytest
+
+from mfd_devcon import Devcon, DevconCache, DeviceOutcome
+from mfd_devcon.exceptions import DevconException
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+class TestDevconBatch:
+    @pytest.fixture()
+    def connection(self):
+        return FakeDevconConnection(generate_devices(40, seed=3))
+
+    @pytest.fixture()
+    def devcon(self, connection):
+        devcon = Devcon(connection=connection)
+        connection.reset_stats()
+        return devcon
+
+    @pytest.fixture()
+    def device_ids(self, connection):
+        return [device.device_instance_id for device in connection.devices[:10]]
+
+    def test_disable_enable_batch_single_call(self, devcon, connection, device_ids):
+        result = devcon.disable_devices_batch(device_ids)
+        assert [outcome.outcome for outcome in result.values()] == [DeviceOutcome.DISABLED] * 10
+        assert not any(device.enabled for device in connection.devices[:10])
+        result = devcon.enable_devices_batch(device_ids)
+        assert [outcome.outcome for outcome in result.values()] == [DeviceOutcome.ENABLED] * 10
+        assert all(device.enabled for device in connection.devices[:10])
+        assert connection.stats.round_trips == 2
+
+    def test_batch_packing_respects_command_length(self, devcon, connection, device_ids):
+        devcon.max_command_length = len(f"{devcon._tool_exec} restart") + 3 * (len(max(device_ids, key=len)) + 4)
+        result = devcon.restart_devices_batch(device_ids)
+        assert list(result) == device_ids
+        assert {outcome.outcome for outcome in result.values()} == {DeviceOutcome.RESTARTED}
+        assert 1 < connection.stats.round_trips < len(device_ids)
+        assert all(len(command) <= devcon.max_command_length for command in connection.stats.commands)
+
+    def test_batch_too_long_device_id(self, devcon, device_ids):
+        devcon.max_command_length = 10
+        with pytest.raises(DevconException, match="exceeds 10 chars"):
+            devcon.disable_devices_batch(device_ids)
+
+    def test_batch_not_found_and_duplicates(self, devcon, connection, device_ids):
+        result = devcon.remove_devices_batch([device_ids[0], "PCI\\VEN_0000&DEV_0000\\0", device_ids[0]])
+        assert list(result) == [device_ids[0], "PCI\\VEN_0000&DEV_0000\\0"]
+        assert result[device_ids[0]].outcome is DeviceOutcome.REMOVED
+        assert result[device_ids[0]].status == "Removed"
+        assert result["PCI\\VEN_0000&DEV_0000\\0"].outcome is DeviceOutcome.NOT_FOUND
+        assert connection.stats.commands[0].count(device_ids[0]) == 1
+        assert device_ids[0] not in [device.device_instance_id for device in connection.devices]
+
+    def test_batch_reboot_flag(self, devcon, connection, device_ids):
+        devcon.disable_devices_batch(device_ids[:1], reboot=True)
+        assert connection.stats.commands == [f'{devcon._tool_exec} /r disable "@{device_ids[0]}"']
+
+    def test_batch_without_inputs(self, devcon):
+        with pytest.raises(AttributeError, match="devcon enable"):
+            devcon.enable_devices_batch([])
+
+    def test_batch_invalidates_cache(self, connection, device_ids):
+        devcon = Devcon(connection=connection, cache=DevconCache())
+        devcon.find_devices(pattern="*")
+        devcon.disable_devices_batch(device_ids)
+        assert len(devcon._cache) == 0
+
+    def test_batch_operation_not_permitted(self, devcon, mocker, device_ids):
+        mocker.patch.object(
+            devcon._connection,
+            "execute_command",
+            return_value=mocker.Mock(stdout="devcon failed. Operation not permitted\n"),
+        )
+        with pytest.raises(DevconException, match="Operation not permitted"):
+            devcon.enable_devices_batch(device_ids)
@@ -0,0 +1,91 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.cache` module."""
+
+import pytest
+
+from mfd_devcon import Devcon, DevconCache
+from mfd_devcon.exceptions import DevconException
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+class TestDevconCache:
+    @pytest.fixture()
+    def clock(self):
+        return [0.0]
+
+    @pytest.fixture()
+    def cache(self, clock):
+        return DevconCache(ttl=10, max_size=2, clock=lambda: clock[0])
+
+    def test_ttl_expiry(self, cache, clock):
+        cache.put("find *", "output")
+        clock[0] = 9.9
+        assert cache.get("find *") == "output"
+        clock[0] = 10
+        assert cache.get("find *") is None
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 0)
+
+    def test_lru_eviction(self, cache):
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_no_ttl(self, clock):
+        cache = DevconCache(ttl=None, clock=lambda: clock[0])
+        cache.put("a", "1")
+        clock[0] = 1e9
+        assert cache.get("a") == "1"
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            DevconCache(max_size=0)
+
+
+class TestDevconWithCache:
+    @pytest.fixture()
+    def connection(self):
+        return FakeDevconConnection(generate_devices(20, seed=5))
+
+    @pytest.fixture()
+    def devcon(self, connection):
+        devcon = Devcon(connection=connection, cache=DevconCache(ttl=60))
+        connection.reset_stats()
+        return devcon
+
+    def test_repeated_queries_are_served_from_cache(self, devcon, connection):
+        name = connection.devices[0].name
+        assert devcon.get_device_id(device_name=name) == devcon.get_device_id(device_name=name)
+        assert devcon.find_devices(pattern="=net") == devcon.find_devices(pattern="=net")
+        assert devcon.listclass(class_name="net") == devcon.listclass(class_name="net")
+        assert connection.stats.round_trips == 2
+
+    def test_cached_results_are_independent(self, devcon):
+        resources = devcon.get_resources(pattern="*", resource_filter="irq")
+        assert devcon.get_resources(pattern="*") != resources
+
+    @pytest.mark.parametrize("mutation", ["enable_devices", "disable_devices", "restart_devices", "remove_devices"])
+    def test_mutation_invalidates_cache(self, devcon, connection, mutation):
+        device_id = connection.devices[0].device_instance_id
+        devcon.get_hwids(pattern="*")
+        getattr(devcon, mutation)(device_id=device_id)
+        devcon.get_hwids(pattern="*")
+        assert connection.stats.round_trips == 3
+
+    def test_rescan_and_explicit_invalidate(self, devcon, connection):
+        devcon.find_devices(pattern="*")
+        devcon.rescan_devices()
+        devcon.find_devices(pattern="*")
+        devcon.invalidate()
+        devcon.find_devices(pattern="*")
+        assert connection.stats.round_trips == 4
+
+    def test_errors_are_not_cached(self, devcon, connection):
+        for _ in range(2):
+            with pytest.raises(DevconException):
+                devcon.find_devices(device_id="PCI\\NOT_PRESENT")
+        assert connection.stats.round_trips == 2
@@ -0,0 +1,140 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for driver package deployment methods of `mfd_devcon` module."""
+
+import pytest
+
+from mfd_devcon import Devcon
+from mfd_devcon.exceptions import DevconException, DevconExecutionError
+from mfd_devcon.testing import FakeDevconConnection, SyntheticDriverPackage
+
+
+class TestDeployDriverPackage:
+    @pytest.fixture()
+    def connection(self):
+        return FakeDevconConnection(
+            driver_packages=[SyntheticDriverPackage("oem3.inf", "Intel", "Network adapters", "1/1/2024", "1.0.0.0")]
+        )
+
+    @pytest.fixture()
+    def devcon(self, connection):
+        return Devcon(connection=connection)
+
+    @pytest.fixture()
+    def copy(self, mocker):
+        mocker.patch("mfd_devcon.base.LocalConnection")
+        return mocker.patch("mfd_devcon.base.rpc_copy_utils.copy")
+
+    @pytest.fixture()
+    def package_dir(self, tmp_path):
+        package_dir = tmp_path / "icea"
+        package_dir.mkdir()
+        (package_dir / "icea.inf").write_text("[Version]\nDriverVer=05/13/2024,1.15.121.0\n")
+        (package_dir / "icea.sys").write_bytes(b"\x00" * 64)
+        return package_dir
+
+    def test_first_deployment(self, devcon, connection, copy, package_dir):
+        deployment = devcon.deploy_driver_package(package_dir, "icea.inf")
+        assert deployment.copied
+        assert deployment.published_name == "oem4.inf"
+        assert deployment.remote_path.startswith("c:\\mfd_tools\\devcon\\packages\\icea_")
+        assert deployment.remote_path.endswith("\\icea\\icea.inf")
+        assert deployment.removed == []
+        copy.assert_called_once()
+        assert copy.call_args.kwargs["source"] == package_dir
+        assert "oem4.inf" in devcon.get_driver_packages()
+
+    def test_unchanged_package_is_skipped(self, devcon, connection, copy, package_dir):
+        first = devcon.deploy_driver_package(package_dir, "icea.inf")
+        connection.reset_stats()
+        second = devcon.deploy_driver_package(package_dir, "icea.inf")
+        assert not second.copied
+        assert (second.published_name, second.content_hash, second.remote_path) == (
+            first.published_name,
+            first.content_hash,
+            first.remote_path,
+        )
+        assert copy.call_count == 1
+        assert connection.stats.round_trips == 1
+
+    def test_changed_package_replaces_stale(self, devcon, connection, copy, package_dir):
+        first = devcon.deploy_driver_package(package_dir, "icea.inf")
+        (package_dir / "icea.sys").write_bytes(b"\x01" * 64)
+        second = devcon.deploy_driver_package(package_dir, "icea.inf")
+        assert second.copied
+        assert second.content_hash != first.content_hash
+        assert second.published_name == "oem5.inf"
+        assert second.removed == ["oem4.inf"]
+        assert [package.published_name for package in connection.driver_packages] == ["oem3.inf", "oem5.inf"]
+        assert any(
+            "rmdir /s /q" in command and first.content_hash[:16] in command for command in connection.stats.commands
+        )
+
+    def test_removed_from_driver_store_is_redeployed(self, devcon, connection, copy, package_dir):
+        devcon.deploy_driver_package(package_dir, "icea.inf")
+        devcon.delete_driver_package("oem4.inf")
+        assert devcon.deploy_driver_package(package_dir, "icea.inf").copied
+        assert copy.call_count == 2
+
+    def test_package_in_use_is_not_fatal(self, devcon, connection, copy, package_dir, mocker):
+        devcon.deploy_driver_package(package_dir, "icea.inf")
+        (package_dir / "icea.sys").write_bytes(b"\x01" * 64)
+        in_use = ("Deleting the specified Driver Package from the machine failed.\n", 0)
+        dp_delete = mocker.patch.object(connection, "_devcon_dp_delete", return_value=in_use)
+        second = devcon.deploy_driver_package(package_dir, "icea.inf")
+        assert (second.copied, second.published_name) == (True, "oem5.inf")
+        assert (second.removed, second.failed_to_remove) == ([], ["oem4.inf"])
+        manifest = next(content for path, content in connection.files.items() if path.endswith(".deployment"))
+        assert manifest.split() == [second.content_hash, "oem5.inf", "oem4.inf"]
+
+        third = devcon.deploy_driver_package(package_dir, "icea.inf")
+        assert not third.copied and third.failed_to_remove == ["oem4.inf"]
+        assert copy.call_count == 2
+
+        mocker.stop(dp_delete)
+        fourth = devcon.deploy_driver_package(package_dir, "icea.inf")
+        assert not fourth.copied
+        assert (fourth.removed, fourth.failed_to_remove) == (["oem4.inf"], [])
+        assert [package.published_name for package in connection.driver_packages] == ["oem3.inf", "oem5.inf"]
+        manifest = next(content for path, content in connection.files.items() if path.endswith(".deployment"))
+        assert manifest.split() == [second.content_hash, "oem5.inf"]
+        assert devcon.deploy_driver_package(package_dir, "icea.inf").removed == []
+
+    def test_dp_enum_not_permitted(self, devcon, connection, copy, package_dir, mocker):
+        mocker.patch.object(connection, "_devcon_dp_enum", return_value=("Operation not permitted\n", 0))
+        with pytest.raises(DevconException, match="Operation not permitted"):
+            devcon.deploy_driver_package(package_dir, "icea.inf")
+        copy.assert_not_called()
+
+    def test_force(self, devcon, copy, package_dir):
+        devcon.deploy_driver_package(package_dir, "icea.inf")
+        assert devcon.deploy_driver_package(package_dir, "icea.inf", force=True).copied
+
+    def test_missing_inf(self, devcon, copy, package_dir):
+        with pytest.raises(AttributeError, match="missing.inf"):
+            devcon.deploy_driver_package(package_dir, "missing.inf")
+        copy.assert_not_called()
+
+
+class TestDriverPackageCommands:
+    @pytest.fixture()
+    def devcon(self):
+        return Devcon(connection=FakeDevconConnection())
+
+    def test_add_driver_package(self, devcon):
+        assert devcon.add_driver_package("c:\\drivers\\icea.inf") == "oem1.inf"
+
+    def test_add_driver_package_failed(self, devcon, mocker):
+        mocker.patch.object(
+            devcon._connection,
+            "execute_command",
+            return_value=mocker.Mock(stdout="Adding the specified Driver Package to the machine failed.\n"),
+        )
+        with pytest.raises(DevconException, match="Error while adding driver package"):
+            devcon.add_driver_package("c:\\drivers\\icea.inf")
+
+    def test_delete_driver_package(self, devcon):
+        devcon.add_driver_package("c:\\drivers\\icea.inf")
+        assert "deleted" in devcon.delete_driver_package("oem1.inf", force=True)
+        with pytest.raises(DevconExecutionError):
+            devcon.delete_driver_package("oem1.inf")
@@ -0,0 +1,72 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.diff` module."""
+
+import pytest
+
+from mfd_devcon import Devcon, FieldChange, diff_inventories
+from mfd_devcon.parser import DevconDevices, DevconResources
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+class TestDiffInventories:
+    @pytest.fixture()
+    def connection(self):
+        return FakeDevconConnection(generate_devices(30, seed=12))
+
+    @pytest.fixture()
+    def devcon(self, connection):
+        return Devcon(connection=connection)
+
+    def test_no_changes(self, devcon):
+        inventory_diff = diff_inventories(devcon.snapshot(pattern="*"), devcon.snapshot(pattern="*"))
+        assert not inventory_diff
+        assert (inventory_diff.added, inventory_diff.removed, inventory_diff.modified) == ([], [], [])
+
+    def test_snapshot_changes(self, devcon, connection):
+        before = devcon.snapshot(pattern="*")
+        removed = connection.devices[0]
+        devcon.remove_devices(device_id=removed.device_instance_id)
+        nic = next(device for device in connection.devices if device.driver_nodes and device.resources)
+        nic.driver_nodes[0]["driver_version"] = "99.0.0.1"
+        nic.installed_from = "c:\\windows\\inf\\oem99.inf"
+        nic.resources = nic.resources[:-1]
+        added = generate_devices(31, seed=12)[30]
+        connection.devices.append(added)
+        inventory_diff = diff_inventories(before, devcon.snapshot(pattern="*"))
+        assert [device.device_instance_id for device in inventory_diff.added] == [added.device_instance_id]
+        assert [device.device_instance_id for device in inventory_diff.removed] == [removed.device_instance_id]
+        (change,) = inventory_diff.modified
+        assert change.device_instance_id == nic.device_instance_id
+        assert change.get("driver_nodes.0.driver_version").new == "99.0.0.1"
+        assert change.get("driver_files.installed_from").new == "c:\\windows\\inf\\oem99.inf"
+        assert change.get("resources").new == nic.resources
+        assert change.get("device_desc") is None
+
+    @pytest.mark.parametrize("frozen", [False, True])
+    def test_drivernodes_driver_version_change(self, devcon, connection, frozen):
+        before = devcon.get_drivernodes(pattern="*")
+        device = next(device for device in connection.devices if device.driver_nodes)
+        old_version = device.driver_nodes[0]["driver_version"]
+        device.driver_nodes[0] = {**device.driver_nodes[0], "driver_version": "99.0.0.1"}
+        after = devcon.get_drivernodes(pattern="*")
+        if frozen:
+            before, after = [record.freeze() for record in before], [record.freeze() for record in after]
+        (change,) = diff_inventories(before, after).modified
+        assert change.device_instance_id == device.device_instance_id
+        assert change.changes == [FieldChange("driver_nodes.0.driver_version", old_version, "99.0.0.1")]
+
+    def test_keyed_case_insensitive_and_frozen(self):
+        old = [DevconResources("ROOT\\NET\\0000", "Adapter", ["IRQ : 16"])]
+        new = [DevconResources("root\\net\\0000", "Adapter", ["IRQ : 17"]).freeze()]
+        (change,) = diff_inventories(old, new).modified
+        assert change.changes == [FieldChange("resources", ["IRQ : 16"], ["IRQ : 17"])]
+
+    def test_device_desc_change(self):
+        old = [DevconDevices("ROOT\\NET\\0000", "Adapter")]
+        inventory_diff = diff_inventories(old, [DevconDevices("ROOT\\NET\\0000", "Adapter #2")])
+        assert inventory_diff.modified[0].changes == [FieldChange("device_desc", "Adapter", "Adapter #2")]
+
+    def test_record_without_key(self):
+        with pytest.raises(AttributeError, match="no device_instance_id"):
+            diff_inventories([object()], [])
@@ -0,0 +1,135 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for typed driver nodes and `mfd_devcon.driver_selection` module."""
+
+import dataclasses
+import datetime
+import json
+
+import pytest
+
+from mfd_devcon import (
+    Devcon,
+    DevconDriverNodes,
+    DriverNode,
+    newest_version,
+    parse_driver_date,
+    parse_driver_version,
+    select_best_driver,
+)
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+def _node(version, date, rank, provider="Intel", flags="00142044"):
+    return DriverNode(
+        provider_name=provider,
+        driver_version=version,
+        driver_date=date,
+        driver_node_rank=rank,
+        driver_node_flags=flags,
+    )
+
+
+class TestTypedDriverNode:
+    def test_typed_fields(self):
+        node = _node("1.10.0.0", "5/13/2024", "16719878")
+        assert node.version == (1, 10, 0, 0)
+        assert node.version > _node("1.9.99.0", None, None).version
+        assert node.date == datetime.date(2024, 5, 13)
+        assert node.rank == 16719878
+        assert node.flags == 0x142044
+
+    def test_unknown_and_invalid_fields(self):
+        node = DriverNode(driver_version="unknown", driver_date="13/45/2024", driver_node_rank="n/a")
+        assert (node.version, node.date, node.rank, node.flags) == ((), None, None, None)
+        assert DriverNode(driver_node_rank="0xFF0000").rank == 0xFF0000
+
+    def test_compatible_with_dict(self):
+        node = _node("1.0.0.0", "1/1/2024", "0")
+        assert node.version == (1, 0, 0, 0)
+        assert node == {
+            "provider_name": "Intel",
+            "driver_version": "1.0.0.0",
+            "driver_date": "1/1/2024",
+            "driver_node_rank": "0",
+            "driver_node_flags": "00142044",
+        }
+        assert hash(node) == hash(_node("1.0.0.0", "1/1/2024", "0"))
+        assert "version" not in node and len(node) == 5
+        assert "_typed" not in repr(node)
+
+    def test_asdict_after_typed_access(self):
+        node = _node("1.10.0.0", "5/13/2024", "16719878")
+        assert node.date == datetime.date(2024, 5, 13)
+        assert "_typed" not in {node_field.name for node_field in dataclasses.fields(node)}
+        assert json.loads(json.dumps(dataclasses.asdict(node)))["driver_date"] == "5/13/2024"
+        assert not hasattr(node, "__dict__")
+
+    def test_parse_helpers(self):
+        assert parse_driver_version(" 30.0.0.17 ") == (30, 0, 0, 17)
+        assert parse_driver_version("2.1-beta.3") == (2,)
+        assert parse_driver_version(None) == ()
+        assert parse_driver_date("6/21/2006") == datetime.date(2006, 6, 21)
+        assert parse_driver_date("") is None
+
+
+class TestDriverSelection:
+    @pytest.fixture()
+    def records(self):
+        return [
+            DevconDriverNodes(
+                "PCI\\VEN_8086&DEV_1592\\1",
+                "E810",
+                {
+                    "0": _node("1.15.121.0", "5/13/2024", "16719878"),
+                    "1": _node("1.16.0.0", "6/1/2024", "16719878"),
+                    "2": _node("30.0.0.0", "1/1/2025", "16719879", provider="Contoso"),
+                },
+            ),
+            DevconDriverNodes(
+                "PCI\\VEN_8086&DEV_1889\\2",
+                "VF",
+                {
+                    "0": _node("1.9.0.0", "1/1/2023", "0"),
+                    "1": _node("1.10.0.0", "1/1/2023", "0"),
+                },
+            ).freeze(),
+            DevconDriverNodes("ROOT\\NO_DRIVER\\3", "No driver", {}),
+        ]
+
+    def test_select_best_driver(self, records):
+        best = select_best_driver(records)
+        assert best["PCI\\VEN_8086&DEV_1592\\1"].driver_version == "1.16.0.0"
+        assert best["PCI\\VEN_8086&DEV_1889\\2"].driver_version == "1.10.0.0"
+        assert best["ROOT\\NO_DRIVER\\3"] is None
+
+    def test_rank_wins_over_date_and_version(self):
+        record = DevconDriverNodes(
+            "PCI\\1", "", {"0": _node("2.0.0.0", "1/1/2025", None), "1": _node("1.0.0.0", "1/1/2020", "16719878")}
+        )
+        assert select_best_driver([record])["PCI\\1"].driver_version == "1.0.0.0"
+
+    def test_newest_version(self, records):
+        assert newest_version(records) == {
+            "PCI\\VEN_8086&DEV_1592\\1": (30, 0, 0, 0),
+            "PCI\\VEN_8086&DEV_1889\\2": (1, 10, 0, 0),
+            "ROOT\\NO_DRIVER\\3": None,
+        }
+        assert newest_version(records, provider="intel")["PCI\\VEN_8086&DEV_1592\\1"] == (1, 16, 0, 0)
+        assert select_best_driver(records, provider="CONTOSO")["PCI\\VEN_8086&DEV_1889\\2"] is None
+
+    def test_legacy_dict_nodes(self):
+        record = DevconDriverNodes("PCI\\1", "", {"0": {"driver_version": "1.2.3.4", "driver_node_rank": "1"}})
+        assert newest_version([record]) == {"PCI\\1": (1, 2, 3, 4)}
+
+    def test_devcon_results(self):
+        devcon = Devcon(connection=FakeDevconConnection(generate_devices(30, seed=25)))
+        nodes = devcon.get_drivernodes(pattern="*")
+        snapshot = devcon.snapshot(pattern="*")
+        best = select_best_driver(nodes)
+        assert select_best_driver(snapshot) == best
+        assert select_best_driver(devcon.get_drivernodes(pattern="*", lazy=True)) == best
+        assert len(best) == 30
+        for record in nodes:
+            if record.driver_nodes:
+                assert best[record.device_pnp].rank == min(node.rank for node in record.driver_nodes.values())
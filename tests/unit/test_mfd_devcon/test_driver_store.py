@@ -0,0 +1,104 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.driver_store` module."""
+
+from textwrap import dedent
+
+import pytest
+
+from mfd_devcon import Devcon, DevconCache, DevconDriverPackage, DevconParser, DriverPackageIndex
+from mfd_devcon.exceptions import DevconParserException
+from mfd_devcon.testing import FakeDevconConnection, SyntheticDriverPackage, generate_devices
+
+
+class TestParseDevconDpEnum:
+    def test_parse_packages(self):
+        output = dedent(
+            """\
+            The following 3rd party Driver Packages are on this machine:
+            oem5.inf
+                Provider: Intel
+                Class: Network adapters
+                Date: 05/13/2024
+                Version: 1.15.121.0
+            oem7.inf
+                Provider: unknown
+                Class: unknown
+            """
+        )
+        assert DevconParser().parse_devcon_dp_enum(output) == [
+            DevconDriverPackage("oem5.inf", "Intel", "Network adapters", "05/13/2024", "1.15.121.0"),
+            DevconDriverPackage("oem7.inf"),
+        ]
+
+    def test_parse_no_packages(self):
+        assert DevconParser().parse_devcon_dp_enum("There are no 3rd party Driver Packages on this machine.\n") == []
+
+    def test_parse_invalid_output(self):
+        with pytest.raises(DevconParserException, match="for dp_enum"):
+            DevconParser().parse_devcon_dp_enum("devcon.exe failed.\n")
+
+
+class TestDriverPackageIndex:
+    @pytest.fixture()
+    def index(self):
+        return DriverPackageIndex(
+            [
+                DevconDriverPackage("oem5.inf", "Intel", "Network adapters", "05/13/2024", "1.9.0.0"),
+                DevconDriverPackage("oem12.inf", "Intel", "Network adapters", "06/01/2024", "1.10.0.0"),
+                DevconDriverPackage("oem13.inf", "Intel", "System devices", "06/01/2024", "1.10"),
+                DevconDriverPackage("oem20.inf", "Contoso", "Network adapters", "01/01/2020", "30.1.0.0"),
+            ]
+        )
+
+    def test_by_inf(self, index):
+        assert index.by_inf("OEM12.INF").driver_version == "1.10.0.0"
+        assert index.by_inf("C:\\Windows\\INF\\oem5.inf").published_name == "oem5.inf"
+        assert index.by_inf("oem99.inf") is None
+        assert "oem20.inf" in index and "oem21.inf" not in index
+
+    def test_by_provider_class_version(self, index):
+        assert [package.published_name for package in index.by_provider("intel")] == [
+            "oem5.inf",
+            "oem12.inf",
+            "oem13.inf",
+        ]
+        assert [package.published_name for package in index.by_class("network ADAPTERS")] == [
+            "oem5.inf",
+            "oem12.inf",
+            "oem20.inf",
+        ]
+        assert [package.published_name for package in index.by_version("1.10.0.0")] == ["oem12.inf", "oem13.inf"]
+
+    def test_find_and_newest(self, index):
+        assert index.find(provider="Intel", class_name="Network adapters", version="1.10") == [
+            index.by_inf("oem12.inf")
+        ]
+        assert index.find(provider="Fabrikam") == []
+        assert index.newest(provider="Intel", class_name="Network adapters").published_name == "oem12.inf"
+        assert index.newest(class_name="Network adapters").published_name == "oem20.inf"
+        assert index.newest(provider="Fabrikam") is None
+        assert len(index) == 4
+
+
+class TestGetDriverPackages:
+    def test_packages_of_devices(self):
+        connection = FakeDevconConnection(generate_devices(30, seed=19))
+        devcon = Devcon(connection=connection)
+        connection.reset_stats()
+        index = devcon.get_driver_packages()
+        assert connection.stats.round_trips == 1
+        assert [package.published_name for package in index] == ["oem5.inf", "oem12.inf"]
+        assert index.by_inf("oem12.inf").provider == "Intel"
+
+    def test_cached_until_invalidated(self):
+        connection = FakeDevconConnection(
+            driver_packages=[SyntheticDriverPackage("oem1.inf", "Intel", "Network adapters", "1/1/2024", "1.0.0.0")]
+        )
+        devcon = Devcon(connection=connection, cache=DevconCache())
+        connection.reset_stats()
+        assert len(devcon.get_driver_packages()) == len(devcon.get_driver_packages()) == 1
+        assert connection.stats.round_trips == 1
+        connection.driver_packages = []
+        devcon.invalidate()
+        assert len(devcon.get_driver_packages()) == 0
@@ -0,0 +1,79 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.testing.fake_connection` module."""
+
+import pytest
+
+from mfd_devcon import Devcon
+from mfd_devcon.exceptions import DevconException, DevconExecutionError
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+from tests.benchmark.bench_end_to_end import run_end_to_end_benchmarks
+
+
+class TestFakeDevconConnection:
+    @pytest.fixture()
+    def delays(self):
+        return []
+
+    @pytest.fixture()
+    def connection(self, delays):
+        return FakeDevconConnection(generate_devices(20, seed=2), latency=0.5, bandwidth=1000, sleep=delays.append)
+
+    @pytest.fixture()
+    def devcon(self, connection, delays):
+        devcon = Devcon(connection=connection)
+        connection.reset_stats()
+        delays.clear()
+        return devcon
+
+    def test_devcon_construction(self, connection):
+        devcon = Devcon(connection=connection)
+        assert devcon._tool_exec == "c:\\mfd_tools\\devcon\\devcon_x64.exe"
+        assert connection.stats.commands == ["c:\\mfd_tools\\devcon\\devcon_x64.exe help"]
+
+    def test_round_trip_accounting(self, devcon, connection, delays):
+        devices = devcon.find_devices(pattern="*")
+        assert len(devices) == 20
+        assert connection.stats.round_trips == 1
+        assert connection.stats.bytes_received > 0
+        assert delays == [pytest.approx(0.5 + (connection.stats.bytes_sent + connection.stats.bytes_received) / 1000)]
+        assert connection.stats.injected_delay == pytest.approx(delays[0])
+
+    def test_match_by_class_and_instance_id(self, devcon, connection):
+        net_devices = [device.device_instance_id for device in connection.devices if device.setup_class == "Net"]
+        assert [device.device_instance_id for device in devcon.find_devices(pattern="=net")] == net_devices
+        assert devcon.get_hwids(device_id=net_devices[0])[0].device_pnp == net_devices[0]
+        assert devcon.find_devices(pattern="PCI\\VEN_8086&DEV_1889*")
+
+    def test_disable_enable_changes_model(self, devcon, connection):
+        device = connection.devices[0]
+        assert "1 device(s) disabled." in devcon.disable_devices(device_id=device.device_instance_id)
+        assert device.enabled is False
+        devcon.enable_devices(device_id=device.device_instance_id)
+        assert device.enabled is True
+
+    def test_remove_and_rescan(self, devcon, connection):
+        device_id = connection.devices[0].device_instance_id
+        devcon.remove_devices(device_id=device_id)
+        with pytest.raises(DevconException, match="No matching devices found"):
+            devcon.find_devices(device_id=device_id)
+        devcon.rescan_devices()
+        assert devcon.find_devices(device_id=device_id)[0].device_instance_id == device_id
+
+    def test_chained_commands_are_one_round_trip(self, connection):
+        output = connection.execute_command("echo first & echo second", shell=True)
+        assert output.stdout == "first \nsecond\n"
+        assert connection.stats.round_trips == 1
+
+    def test_unexpected_return_code(self, connection):
+        with pytest.raises(DevconExecutionError):
+            connection.execute_command("devcon_x64.exe unknown", custom_exception=DevconExecutionError)
+
+    def test_run_end_to_end_benchmarks(self):
+        results = {result.workflow: result for result in run_end_to_end_benchmarks(devices=50, latency=0)}
+        assert results["Devcon()"].round_trips == 1
+        assert results["full inventory"].round_trips == 5
+        assert results["get_device_ids x8"].round_trips == 1
+        assert results["snapshot"].round_trips == 1
+        assert results["disable+enable x16"].round_trips == 32
+        assert results["batch disable+enable x16"].round_trips == 2
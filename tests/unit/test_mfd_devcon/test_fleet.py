@@ -0,0 +1,117 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.fleet` module."""
+
+import threading
+import time
+
+import pytest
+
+from mfd_devcon import Devcon, DevconCache, DevconFleet, DevconFleetHostBusy, DevconFleetTimeout
+from mfd_devcon.exceptions import DevconException
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+class TestDevconFleet:
+    @pytest.fixture()
+    def connections(self):
+        return [FakeDevconConnection(generate_devices(5 + seed, seed=seed)) for seed in range(6)]
+
+    def test_run_method_on_every_host(self, connections):
+        results = DevconFleet(connections, max_workers=3).run("find_devices", pattern="*")
+        assert [result.connection for result in results] == connections
+        assert [len(result.value) for result in results] == [5, 6, 7, 8, 9, 10]
+        assert all(result.ok for result in results)
+
+    def test_run_function(self, connections):
+        results = DevconFleet(connections).run(lambda devcon, pattern: len(devcon.find_devices(pattern=pattern)), "*")
+        assert [result.value for result in results] == [5, 6, 7, 8, 9, 10]
+
+    def test_devcons_are_reused(self, connections):
+        fleet = DevconFleet(connections, cache_factory=DevconCache)
+        fleet.run("find_devices", pattern="*")
+        devcons = fleet.devcons
+        fleet.run("find_devices", pattern="*")
+        assert fleet.devcons == devcons
+        assert all(isinstance(devcon, Devcon) and devcon._cache.hits == 1 for devcon in devcons)
+        assert [connection.stats.round_trips for connection in connections] == [2] * 6
+
+    def test_per_host_errors(self, connections):
+        connections[1].devices = []
+        results = DevconFleet(connections).run("find_devices", pattern="*")
+        assert isinstance(results[1].error, DevconException)
+        assert results[1].value is None
+        assert [result.ok for result in results] == [True, False, True, True, True, True]
+
+    def test_concurrency_limit(self, connections):
+        lock, running, peak = threading.Lock(), [0], [0]
+
+        def sleep(delay):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(delay)
+            with lock:
+                running[0] -= 1
+
+        for connection in connections:
+            connection.latency, connection._sleep = 0.05, sleep
+        results = DevconFleet(connections, max_workers=2).run("find_devices", pattern="*")
+        assert all(result.ok for result in results)
+        assert peak[0] == 2
+
+    def test_slow_host_times_out_without_holding_others(self, connections):
+        release = threading.Event()
+        connections[0].latency, connections[0]._sleep = 1, lambda delay: release.wait()
+        for connection in connections[1:]:
+            connection.latency, connection._sleep = 0.05, time.sleep
+        fleet = DevconFleet(connections, max_workers=2, timeout=0.3)
+        start = time.perf_counter()
+        results = fleet.run("find_devices", pattern="*")
+        elapsed = time.perf_counter() - start
+        release.set()
+        assert isinstance(results[0].error, DevconFleetTimeout)
+        assert results[0].duration >= 0.3
+        assert all(result.ok for result in results[1:])
+        assert elapsed < 1
+
+    def test_run_timeout_overrides_fleet_timeout(self, connections):
+        release = threading.Event()
+        connections[0].latency, connections[0]._sleep = 1, lambda delay: release.wait()
+        results = DevconFleet(connections, timeout=None).run("find_devices", pattern="*", timeout=0.1)
+        release.set()
+        assert isinstance(results[0].error, DevconFleetTimeout)
+
+    def test_hung_host_does_not_starve_queued_hosts(self, connections):
+        release = threading.Event()
+        connections[0].latency, connections[0]._sleep = 1, lambda delay: release.wait()
+        fleet = DevconFleet(connections[:3], max_workers=1, timeout=0.5)
+        start = time.perf_counter()
+        results = fleet.run("find_devices", pattern="*")
+        elapsed = time.perf_counter() - start
+        assert isinstance(results[0].error, DevconFleetTimeout)
+        assert all(result.ok and result.duration < 0.5 for result in results[1:])
+        assert elapsed < 1
+        assert fleet.busy == [connections[0]]
+        release.set()
+        fleet.close()
+        assert fleet.busy == []
+
+    def test_busy_host_is_not_started_again(self, connections):
+        release = threading.Event()
+        connections[0].latency, connections[0]._sleep = 1, lambda delay: release.wait()
+        with DevconFleet(connections, max_workers=2, timeout=0.2) as fleet:
+            fleet.run("find_devices", pattern="*")
+            assert fleet.busy == [connections[0]]
+            executor = fleet._executor
+            results = fleet.run("find_devices", pattern="*")
+            assert isinstance(results[0].error, DevconFleetHostBusy)
+            assert all(result.ok for result in results[1:])
+            assert fleet._executor is executor and executor._max_workers == 2 + len(connections)
+            release.set()
+        assert fleet.busy == []
+        assert connections[0].stats.round_trips == 2
+
+    def test_invalid_max_workers(self, connections):
+        with pytest.raises(ValueError, match="max_workers"):
+            DevconFleet(connections, max_workers=0)
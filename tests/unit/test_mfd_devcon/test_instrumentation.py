@@ -0,0 +1,186 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.instrumentation` module."""
+
+import math
+
+import pytest
+from mfd_common_libs import log_levels
+
+from mfd_devcon import (
+    Devcon,
+    DevconCache,
+    DevconCallMetrics,
+    DevconFleet,
+    InMemoryMetrics,
+    PrometheusTextfileExporter,
+    current_call,
+)
+from mfd_devcon.exceptions import DevconException
+from mfd_devcon.instrumentation import TimedParser, percentile
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+class TestPercentile:
+    def test_interpolation(self):
+        values = [1.0, 2.0, 3.0, 4.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile([7.0], 99) == 7.0
+        assert math.isnan(percentile([], 50))
+
+
+class TestInstrumentedDevcon:
+    @pytest.fixture()
+    def connection(self):
+        return FakeDevconConnection(generate_devices(12, seed=22))
+
+    @pytest.fixture()
+    def metrics(self):
+        return InMemoryMetrics()
+
+    @pytest.fixture()
+    def devcon(self, connection, metrics):
+        return Devcon(connection=connection, metrics_sink=metrics)
+
+    def test_no_sink_is_not_instrumented(self, connection):
+        devcon = Devcon(connection=connection)
+        assert not isinstance(devcon.parser, TimedParser)
+        assert devcon.find_devices(pattern="*")
+
+    def test_read_call(self, devcon, metrics):
+        devices = devcon.find_devices(pattern="*")
+        [call] = metrics.calls()
+        assert call.method == "find_devices"
+        assert call.host == "127.0.0.1"
+        assert call.subcommand == "find"
+        assert call.round_trips == 1
+        assert call.stdout_bytes > 0
+        assert call.device_count == len(devices) == 12
+        assert call.duration >= call.execution_time > 0
+        assert call.parse_time > 0
+        assert call.exception is None
+        assert current_call() is None
+
+    def test_nested_calls_are_accounted_to_outermost(self, devcon, metrics):
+        devcon.get_device_id("missing device")
+        [call] = metrics.calls()
+        assert (call.method, call.subcommand, call.round_trips) == ("get_device_id", "find", 1)
+
+    def test_chained_subcommands(self, devcon, metrics):
+        devcon.snapshot(pattern="*")
+        [call] = metrics.calls()
+        assert call.subcommand == "find+hwids+drivernodes+driverfiles+resources"
+        assert call.round_trips == 1
+
+    def test_cache_hit_costs_no_round_trip(self, connection, metrics):
+        devcon = Devcon(connection=connection, cache=DevconCache(), metrics_sink=metrics)
+        devcon.get_hwids(pattern="*")
+        devcon.get_hwids(pattern="*")
+        first, second = metrics.calls(method="get_hwids")
+        assert first.round_trips == 1 and first.stdout_bytes > 0
+        assert second.round_trips == second.stdout_bytes == 0
+        assert second.subcommand == "hwids"
+
+    def test_mutating_call(self, devcon, metrics):
+        devcon.restart_devices(pattern="*", reboot=True)
+        [call] = metrics.calls()
+        assert (call.method, call.subcommand, call.device_count) == ("restart_devices", "restart", None)
+
+    def test_exception_class(self, devcon, metrics, mocker):
+        mocker.patch.object(
+            devcon._connection, "execute_command", return_value=mocker.Mock(stdout="No matching devices found.")
+        )
+        with pytest.raises(DevconException):
+            devcon.enable_devices(device_id="PCI\\VEN_8086")
+        with pytest.raises(AttributeError):
+            devcon.disable_devices()
+        assert [(call.method, call.exception) for call in metrics.calls()] == [
+            ("enable_devices", "DevconException"),
+            ("disable_devices", "AttributeError"),
+        ]
+
+    def test_percentiles_and_summary(self, devcon, metrics):
+        for _ in range(5):
+            devcon.get_hwids(pattern="*")
+        devcon.find_devices(pattern="*")
+        assert len(metrics.calls(method="get_hwids", host="127.0.0.1")) == 5
+        assert metrics.calls(host="10.0.0.1") == []
+        percentiles = metrics.percentiles("stdout_bytes", method="get_hwids")
+        assert percentiles[50] == percentiles[99] > 0
+        summary = metrics.summary()
+        assert summary["get_hwids"]["calls"] == 5
+        assert summary["get_hwids"]["round_trips"] == 5
+        assert summary["find_devices"]["errors"] == 0
+        assert summary["find_devices"]["execution_time_p99"] > 0
+
+    def test_max_calls(self):
+        metrics = InMemoryMetrics(max_calls=2)
+        for method in ("a", "b", "c"):
+            metrics(DevconCallMetrics(method=method))
+        assert [call.method for call in metrics.calls()] == ["b", "c"]
+
+    def test_failing_sink_does_not_affect_call(self, connection, mocker, caplog):
+        def sink(metrics):
+            raise RuntimeError("sink is down")
+
+        devcon = Devcon(connection=connection, metrics_sink=sink)
+        with caplog.at_level(log_levels.MODULE_DEBUG, logger="mfd_devcon.instrumentation"):
+            assert len(devcon.find_devices(pattern="*")) == 12
+            mocker.patch.object(
+                devcon._connection, "execute_command", return_value=mocker.Mock(stdout="No matching devices found.")
+            )
+            with pytest.raises(DevconException):
+                devcon.enable_devices(device_id="PCI\\VEN_8086")
+        assert [message for message in caplog.messages if "sink is down" in message] == [
+            f"Metrics sink {sink!r} failed for find_devices: RuntimeError: sink is down",
+            f"Metrics sink {sink!r} failed for enable_devices: RuntimeError: sink is down",
+        ]
+
+    def test_fleet_shares_sink(self, metrics):
+        connections = [FakeDevconConnection(generate_devices(3, seed=seed)) for seed in range(3)]
+        DevconFleet(connections, metrics_sink=metrics).run("find_devices", pattern="*")
+        assert metrics.summary()["find_devices"]["calls"] == 3
+
+
+class TestPrometheusTextfileExporter:
+    def test_render(self, tmp_path):
+        path = tmp_path / "devcon.prom"
+        exporter = PrometheusTextfileExporter(path, flush_every=2, quantiles=(50, 99))
+        exporter(DevconCallMetrics("find_devices", "10.0.0.1", ["find"], 0.5, 0.4, 1, 2_000_000, 0.1, device_count=12))
+        assert not path.exists()
+        exporter(
+            DevconCallMetrics("enable_devices", "10.0.0.1", ["enable"], 1.5, 1.5, 1, 10, exception="DevconException")
+        )
+        text = path.read_text()
+        assert "# TYPE devcon_calls_total counter" in text
+        labels = 'host="10.0.0.1",method="enable_devices",subcommand="enable",exception="DevconException"'
+        assert f"devcon_calls_total{{{labels}}} 1" in text
+        assert (
+            'devcon_stdout_bytes_total{host="10.0.0.1",method="find_devices",subcommand="find",exception=""} 2000000'
+            in text
+        )
+        assert 'devcon_devices_total{host="10.0.0.1",method="find_devices",subcommand="find",exception=""} 12' in text
+        assert "# TYPE devcon_execution_time_seconds summary" in text
+        assert 'devcon_execution_time_seconds{host="10.0.0.1",method="find_devices",quantile="0.99"} 0.4' in text
+        assert 'devcon_duration_seconds_count{host="10.0.0.1",method="enable_devices"} 1' in text
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_summary_sum_and_count_are_cumulative(self, tmp_path):
+        exporter = PrometheusTextfileExporter(tmp_path / "devcon.prom", InMemoryMetrics(max_calls=2), flush_every=0)
+        for duration in (1.0, 2.0, 4.0):
+            exporter(DevconCallMetrics("find_devices", "10.0.0.1", ["find"], duration))
+        text = exporter.render()
+        labels = '{host="10.0.0.1",method="find_devices"}'
+        assert f"devcon_duration_seconds_sum{labels} 7.0" in text
+        assert f"devcon_duration_seconds_count{labels} 3" in text
+        assert 'devcon_duration_seconds{host="10.0.0.1",method="find_devices",quantile="0.5"} 3.0' in text
+
+    def test_label_values_are_escaped(self, tmp_path):
+        exporter = PrometheusTextfileExporter(tmp_path / "devcon.prom", flush_every=0)
+        exporter(DevconCallMetrics("find_devices", 'host"1\\'))
+        assert 'host="host\\"1\\\\"' in exporter.render()
+        assert not (tmp_path / "devcon.prom").exists()
+        exporter.write()
+        assert (tmp_path / "devcon.prom").read_text() == exporter.render()
@@ -0,0 +1,159 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.inventory` module."""
+
+import pytest
+
+from mfd_devcon import Devcon, DeviceInventory
+from mfd_devcon.exceptions import DevconException
+from mfd_devcon.parser import DevconDevices
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+class TestDeviceInventory:
+    @pytest.fixture()
+    def inventory(self):
+        return DeviceInventory(
+            [
+                DevconDevices("PCI\\VEN_8086&DEV_1592&SUBSYS_00028086&REV_02\\4&273B1A92&0&000002", "E810-C-Q2 #2"),
+                DevconDevices("PCI\\VEN_8086&DEV_1889&SUBSYS_00028086&REV_02\\4&273B1A92&0&000001", "Adaptive VF #1"),
+                DevconDevices("PCI\\VEN_8086&DEV_1889&SUBSYS_00018086&REV_02\\4&273B1A92&0&000003", "Adaptive VF #2"),
+                DevconDevices("ACPI\\PNP0C0F\\5", "PCI Interrupt Link"),
+                DevconDevices("ACPI\\PNP0C0F\\6", "PCI Interrupt Link"),
+            ],
+            setup_classes={"ACPI\\PNP0C0F\\5": "System", "acpi\\pnp0c0f\\6": "System"},
+        )
+
+    def test_by_name(self, inventory):
+        assert [device.device_instance_id for device in inventory.by_name(" Adaptive VF #1 ")] == [
+            "PCI\\VEN_8086&DEV_1889&SUBSYS_00028086&REV_02\\4&273B1A92&0&000001"
+        ]
+        assert len(inventory.by_name("PCI Interrupt Link")) == 2
+        assert inventory.by_name("adaptive vf #1") == []
+
+    def test_by_instance_id(self, inventory):
+        assert inventory.by_instance_id("acpi\\pnp0c0f\\5").device_desc == "PCI Interrupt Link"
+        assert inventory.by_instance_id("ACPI\\PNP0C0F\\7") is None
+        assert "ACPI\\pnp0c0f\\6" in inventory
+        assert len(inventory) == 5
+
+    def test_by_class(self, inventory):
+        assert [device.device_instance_id for device in inventory.by_class("system")] == [
+            "ACPI\\PNP0C0F\\5",
+            "ACPI\\PNP0C0F\\6",
+        ]
+        assert inventory.by_class("Net") == []
+
+    def test_by_ids(self, inventory):
+        assert len(inventory.by_ids("8086")) == 3
+        assert [device.device_desc for device in inventory.by_ids("8086", "1889")] == [
+            "Adaptive VF #1",
+            "Adaptive VF #2",
+        ]
+        assert [device.device_desc for device in inventory.by_ids("8086", "1889", "00018086")] == ["Adaptive VF #2"]
+        with pytest.raises(AttributeError, match="device together with subsystem"):
+            inventory.by_ids("8086", subsystem="00018086")
+
+    def test_startswith(self, inventory):
+        assert [device.device_desc for device in inventory.startswith("adaptive")] == [
+            "Adaptive VF #1",
+            "Adaptive VF #2",
+        ]
+        assert inventory.startswith("Intel") == []
+
+    def test_search(self, inventory):
+        assert [device.device_desc for device in inventory.search("E810 C Q2 #2")] == ["E810-C-Q2 #2"]
+        assert inventory.search("something else entirely") == []
+
+
+class TestGetDeviceInventory:
+    @pytest.fixture()
+    def connection(self):
+        return FakeDevconConnection(generate_devices(40, seed=5))
+
+    @pytest.fixture()
+    def devcon(self, connection):
+        devcon = Devcon(connection=connection)
+        connection.reset_stats()
+        return devcon
+
+    @pytest.mark.parametrize("command", ["find", "listclass"])
+    def test_classes_in_single_round_trip(self, devcon, connection, command):
+        inventory = devcon.get_device_inventory(["Net", "System", "Bluetooth"], command=command)
+        assert connection.stats.round_trips == 1
+        for setup_class in ("Net", "System"):
+            assert [device.device_instance_id for device in inventory.by_class(setup_class)] == [
+                device.device_instance_id for device in connection.devices if device.setup_class == setup_class
+            ]
+        assert inventory.by_class("Bluetooth") == []
+        net_device = next(device for device in connection.devices if device.setup_class == "Net")
+        assert inventory.by_name(net_device.name)[0].device_instance_id == net_device.device_instance_id
+
+    def test_unknown_setup_class(self, devcon):
+        with pytest.raises(DevconException, match='There is no "Nett" setup class'):
+            devcon.get_device_inventory(["Net", "Nett"], command="listclass")
+
+    def test_all_devices(self, devcon, connection):
+        inventory = devcon.get_device_inventory()
+        assert len(inventory) == 40
+        assert connection.stats.commands == [f'{devcon._tool_exec} find "*"']
+
+    @pytest.mark.parametrize(
+        "class_names, command, match",
+        [
+            (["Net"], "hwids", "Invalid value = hwids"),
+            (None, "listclass", "class_names"),
+            ([], "find", "class_names cannot be empty"),
+        ],
+    )
+    def test_invalid_inputs(self, devcon, class_names, command, match):
+        with pytest.raises(AttributeError, match=match):
+            devcon.get_device_inventory(class_names, command=command)
+
+
+class TestGetDeviceIds:
+    @pytest.fixture()
+    def connection(self):
+        connection = FakeDevconConnection(generate_devices(40, seed=5))
+        net_devices = [device for device in connection.devices if device.setup_class == "Net"]
+        net_devices[1].name = net_devices[0].name
+        return connection
+
+    @pytest.fixture()
+    def devcon(self, connection):
+        devcon = Devcon(connection=connection)
+        connection.reset_stats()
+        return devcon
+
+    @pytest.fixture()
+    def net_devices(self, connection):
+        return [device for device in connection.devices if device.setup_class == "Net"]
+
+    @pytest.mark.parametrize("command", ["find", "listclass"])
+    def test_single_enumeration(self, devcon, connection, net_devices, command):
+        names = [device.name for device in net_devices[2:10]] + ["Missing adapter"]
+        device_ids = devcon.get_device_ids(names, command=command)
+        assert device_ids == {
+            **{device.name: device.device_instance_id for device in net_devices[2:10]},
+            "Missing adapter": None,
+        }
+        assert connection.stats.round_trips == 1
+        assert device_ids[net_devices[5].name] == devcon.get_device_id(net_devices[5].name, command=command)
+
+    def test_duplicates(self, devcon, net_devices):
+        name = net_devices[0].name
+        with pytest.raises(DevconException, match="matches many devices"):
+            devcon.get_device_ids([name])
+        assert devcon.get_device_ids([name], duplicates="first") == {name: net_devices[0].device_instance_id}
+        assert devcon.get_device_ids([name, "Missing adapter"], duplicates="all") == {
+            name: [net_devices[0].device_instance_id, net_devices[1].device_instance_id],
+            "Missing adapter": [],
+        }
+
+    def test_unknown_setup_class(self, devcon):
+        with pytest.raises(DevconException, match='There is no "Nett" setup class'):
+            devcon.get_device_ids(["Missing adapter"], command="listclass", class_name="Nett")
+
+    def test_invalid_duplicates(self, devcon):
+        with pytest.raises(AttributeError, match="Invalid value = any"):
+            devcon.get_device_ids(["name"], duplicates="any")
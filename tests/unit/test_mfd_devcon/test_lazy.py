@@ -0,0 +1,58 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.lazy` module."""
+
+import pytest
+
+from mfd_devcon import Devcon, DevconParser, LazyDeviceList
+from mfd_devcon.exceptions import DevconParserException
+from mfd_devcon.testing import FakeDevconConnection, SyntheticDevconOutput, generate_devices
+
+
+class TestLazyDeviceList:
+    @pytest.fixture()
+    def devices(self):
+        return generate_devices(50, seed=10)
+
+    @pytest.mark.parametrize("command", ["hwids", "drivernodes", "resources"])
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_equal_to_eager_parsing(self, devices, command, newline):
+        output = getattr(SyntheticDevconOutput(), command)(devices).replace("\n", newline)
+        parse = getattr(DevconParser(), f"parse_devcon_{command}")
+        lazy = parse(output, lazy=True)
+        assert isinstance(lazy, LazyDeviceList)
+        assert lazy == parse(output)
+
+    def test_blocks_parsed_on_demand(self, devices):
+        lazy = DevconParser().parse_devcon_hwids(SyntheticDevconOutput().hwids(devices), lazy=True)
+        assert len(lazy) == 50
+        assert lazy._blocks is None
+        assert lazy[-1].device_pnp == devices[-1].device_instance_id
+        assert lazy[3:5] == DevconParser().parse_devcon_hwids(SyntheticDevconOutput().hwids(devices[3:5]))
+        assert lazy.parsed == 3
+        assert lazy[-1] is lazy[49]
+        with pytest.raises(IndexError):
+            lazy[50]
+
+    def test_validation_on_demand(self, devices):
+        output = SyntheticDevconOutput().hwids(devices).replace("50 matching", "51 matching")
+        lazy = DevconParser().parse_devcon_hwids(output, lazy=True)
+        assert len(lazy) == 51
+        with pytest.raises(DevconParserException, match="for hwids"):
+            lazy.validate()
+        with pytest.raises(DevconParserException, match="for hwids"):
+            lazy[0]
+
+    def test_missing_trailer(self, devices):
+        output = SyntheticDevconOutput().hwids(devices).replace("matching device(s) found", "")
+        with pytest.raises(DevconParserException):
+            len(DevconParser().parse_devcon_hwids(output, lazy=True))
+
+    def test_devcon_lazy_methods(self):
+        connection = FakeDevconConnection(generate_devices(30, seed=11))
+        devcon = Devcon(connection=connection)
+        assert devcon.get_hwids(pattern="*", lazy=True) == devcon.get_hwids(pattern="*")
+        assert devcon.get_drivernodes(pattern="*", lazy=True) == devcon.get_drivernodes(pattern="*")
+        resources = devcon.get_resources(pattern="*", resource_filter="IRQ", lazy=True)
+        assert resources == devcon.get_resources(pattern="*", resource_filter="IRQ")
+        assert all("IRQ" in resource for entry in resources for resource in entry.resources)
@@ -12,8 +12,18 @@ from mfd_typing import OSName
 
 from mfd_connect.util import rpc_copy_utils
 from mfd_devcon import Devcon
-from mfd_devcon.exceptions import DevconNotAvailable, DevconException, DevconExecutionError
-from mfd_devcon.parser import DevconHwids, DevconDriverNodes, DevconDriverFiles, DevconDevices, DevconResources
+from mfd_devcon.exceptions import DevconNotAvailable, DevconException, DevconExecutionError, DevconParserException
+from mfd_devcon.parser import (
+    DevconParser,
+    DevconHwids,
+    DevconDriverNodes,
+    DevconDriverFiles,
+    DevconDevices,
+    DevconResources,
+    DevconDeviceOutcome,
+    DevconMutationResult,
+    DeviceOutcome,
+)
 
 
 class TestMfdDevcon:
@@ -513,6 +523,149 @@ class TestMfdDevcon:
         )
         assert devcon.get_drivernodes(pattern="=net") == expected_output
 
+    def test_get_drivernodes_with_crlf_line_endings(self, devcon):
+        output = (
+            "ACPI\\FIXEDBUTTON\\2&DABA3FF&0\r\n"
+            "    Name: ACPI Fixed Feature Button\r\n"
+            "Driver node #0:\r\n"
+            "    Inf file is C:\\windows\\INF\\machine.inf\r\n"
+            "    Driver version is 10.0.22000.1\r\n"
+            "1 matching device(s) found.\r\n"
+        )
+        devcon._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, return_code=0, stderr=""
+        )
+        assert devcon.get_drivernodes(pattern="=system") == [
+            DevconDriverNodes(
+                device_pnp="ACPI\\FIXEDBUTTON\\2&DABA3FF&0",
+                name="ACPI Fixed Feature Button",
+                driver_nodes={"0": {"inf_file": "C:\\windows\\INF\\machine.inf", "driver_version": "10.0.22000.1"}},
+            )
+        ]
+
+    @pytest.mark.parametrize("command", ["hwids", "drivernodes", "resources"])
+    @pytest.mark.parametrize("trailer", ["3 matching device(s) found.", ""])
+    def test_get_commands_with_mismatched_device_count(self, devcon, command, trailer):
+        output = dedent(
+            """\
+        ROOT\\SYSTEM\\0000
+            Name: Plug and Play Software Device Enumerator
+        ROOT\\BASICRENDER\\0000
+            Name: Microsoft Basic Render Driver
+        """
+        )
+        func_dict = {
+            "hwids": devcon.get_hwids,
+            "drivernodes": devcon.get_drivernodes,
+            "resources": devcon.get_resources,
+        }
+        devcon._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output + trailer, return_code=0, stderr=""
+        )
+        with pytest.raises(DevconParserException, match=f"for {command}"):
+            func_dict[command](pattern="*")
+
+    def test_get_hwids_for_many_devices(self, devcon):
+        block = dedent(
+            """\
+        PCI\\VEN_8086&DEV_1889&SUBSYS_00008086&REV_02\\{index:04X}
+            Name: Intel(R) Ethernet Adaptive Virtual Function #{index}
+            Hardware IDs:
+                PCI\\VEN_8086&DEV_1889&SUBSYS_00008086&REV_02
+                PCI\\VEN_8086&DEV_1889&SUBSYS_00008086
+            Compatible IDs:
+                PCI\\VEN_8086&DEV_1889
+        """
+        )
+        output = "".join(block.format(index=index) for index in range(512)) + "512 matching device(s) found.\n"
+        devcon._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, return_code=0, stderr=""
+        )
+        hwids = devcon.get_hwids(pattern="*")
+        assert len(hwids) == 512
+        assert hwids[-1].device_pnp == "PCI\\VEN_8086&DEV_1889&SUBSYS_00008086&REV_02\\01FF"
+        assert hwids[-1].name == "Intel(R) Ethernet Adaptive Virtual Function #511"
+        assert hwids[-1].compatible_ids == ["PCI\\VEN_8086&DEV_1889"]
+
+    def test_iter_hwids_yields_devices_before_trailer_validation(self, devcon):
+        output = dedent(
+            """\
+        ROOT\\SYSTEM\\0000
+            Name: Plug and Play Software Device Enumerator
+            Hardware IDs:
+                root\\swenum
+        ROOT\\BASICRENDER\\0000
+            Name: Microsoft Basic Render Driver
+            Hardware IDs:
+                ROOT\\BasicRender
+        3 matching device(s) found.
+            """
+        )
+        devcon._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, return_code=0, stderr=""
+        )
+        hwids = devcon.iter_hwids(pattern="*")
+        devcon._connection.execute_command.assert_called_once()
+        assert next(hwids) == DevconHwids(
+            device_pnp="ROOT\\SYSTEM\\0000",
+            name="Plug and Play Software Device Enumerator",
+            hardware_ids=["root\\swenum"],
+            compatible_ids=[],
+        )
+        assert next(hwids).device_pnp == "ROOT\\BASICRENDER\\0000"
+        with pytest.raises(DevconParserException):
+            next(hwids)
+
+    def test_iter_devices(self, devcon):
+        output = dedent(
+            """\
+        ACPI_HAL\\PNP0C08\\0                                          : Microsoft ACPI-Compliant System
+        HTREE\\ROOT\\0
+        2 matching device(s) found.
+            """
+        )
+        devcon._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, return_code=0, stderr=""
+        )
+        assert list(devcon.iter_devices(pattern="*")) == [
+            DevconDevices(device_instance_id="ACPI_HAL\\PNP0C08\\0", device_desc="Microsoft ACPI-Compliant System"),
+            DevconDevices(device_instance_id="HTREE\\ROOT\\0", device_desc=""),
+        ]
+
+    def test_iter_resources_with_resource_filter(self, devcon):
+        output = dedent(
+            """\
+        PCI\\VEN_8086&DEV_8D2D&SUBSYS_06001028&REV_05\\3&3259BAD1&0&D0
+            Name: Standard Enhanced PCI to USB Host Controller
+            Device is currently using the following resources:
+                MEM : 91e03000-91e033ff
+                IRQ : 18
+        1 matching device(s) found.
+            """
+        )
+        devcon._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, return_code=0, stderr=""
+        )
+        assert list(devcon.iter_resources(pattern="*", resource_filter="irq")) == [
+            DevconResources(
+                device_pnp="PCI\\VEN_8086&DEV_8D2D&SUBSYS_06001028&REV_05\\3&3259BAD1&0&D0",
+                name="Standard Enhanced PCI to USB Host Controller",
+                resources=["IRQ : 18"],
+            )
+        ]
+
+    @pytest.mark.parametrize("command", ["hwids", "find", "drivernodes", "resources"])
+    def test_iter_commands_without_inputs(self, devcon, command):
+        func_dict = {
+            "hwids": devcon.iter_hwids,
+            "find": devcon.iter_devices,
+            "drivernodes": devcon.iter_drivernodes,
+            "resources": devcon.iter_resources,
+        }
+        with pytest.raises(AttributeError, match=f"devcon {command}"):
+            func_dict[command]()
+        devcon._connection.execute_command.assert_not_called()
+
     def test_get_driverfiles(self, devcon):
         output = dedent(
             """\
@@ -785,3 +938,62 @@ class TestMfdDevcon:
             args="", stdout=output, return_code=0, stderr=""
         )
         assert devcon.get_device_id(device_name="Microsoft ACPI-Compliant") is None
+
+    def test_parse_devcon_mutation(self):
+        output = dedent(
+            """\
+            PCI\\VEN_8086&DEV_1889&SUBSYS_00008086&REV_01\\4&1B2A7F4&0&0000: Disabled
+            PCI\\VEN_8086&DEV_1889&SUBSYS_00008086&REV_01\\4&1B2A7F4&0&0001: Disabled on reboot
+            PCI\\VEN_8086&DEV_1592&SUBSYS_00028086&REV_02\\3&1C6B4348&0&0000: Disable failed
+            Not all of 2 device(s) disabled, at least one requires reboot to complete the operation.
+            """
+        )
+        assert DevconParser().parse_devcon_mutation(output) == DevconMutationResult(
+            devices=[
+                DevconDeviceOutcome(
+                    "PCI\\VEN_8086&DEV_1889&SUBSYS_00008086&REV_01\\4&1B2A7F4&0&0000",
+                    DeviceOutcome.DISABLED,
+                    "Disabled",
+                ),
+                DevconDeviceOutcome(
+                    "PCI\\VEN_8086&DEV_1889&SUBSYS_00008086&REV_01\\4&1B2A7F4&0&0001",
+                    DeviceOutcome.REQUIRES_REBOOT,
+                    "Disabled on reboot",
+                ),
+                DevconDeviceOutcome(
+                    "PCI\\VEN_8086&DEV_1592&SUBSYS_00028086&REV_02\\3&1C6B4348&0&0000",
+                    DeviceOutcome.FAILED,
+                    "Disable failed",
+                ),
+            ],
+            count=2,
+            requires_reboot=True,
+        )
+
+    @pytest.mark.parametrize(
+        "output, count, outcome",
+        [
+            ("ROOT\\NET\\0000: Enabled\n1 device(s) are enabled.\n", 1, DeviceOutcome.ENABLED),
+            ("ROOT\\NET\\0000: Restarted\n1 device(s) restarted.\n", 1, DeviceOutcome.RESTARTED),
+            ("ROOT\\NET\\0000: Requires reboot\n1 device(s) restarted.\n", 1, DeviceOutcome.REQUIRES_REBOOT),
+            ("ROOT\\NET\\0000: Removed\n1 device(s) were removed.\n", 1, DeviceOutcome.REMOVED),
+            ("ROOT\\NET\\0000: Something new\n", None, DeviceOutcome.UNKNOWN),
+        ],
+    )
+    def test_parse_devcon_mutation_outcomes(self, output, count, outcome):
+        result = DevconParser().parse_devcon_mutation(output)
+        assert result.count == count
+        assert [device.outcome for device in result.devices] == [outcome]
+        assert result.requires_reboot is (outcome is DeviceOutcome.REQUIRES_REBOOT)
+
+    @pytest.mark.parametrize(
+        "output",
+        [
+            "No matching devices found.\n",
+            "No devices were disabled, either because the devices do not exist or because the devices could not be"
+            " disabled.\n",
+            "No devices were restarted.\n",
+        ],
+    )
+    def test_parse_devcon_mutation_no_devices(self, output):
+        assert DevconParser().parse_devcon_mutation(output) == DevconMutationResult(count=0)
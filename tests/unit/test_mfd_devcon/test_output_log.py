@@ -0,0 +1,104 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.output_log` module."""
+
+import logging
+
+import pytest
+from mfd_common_libs import log_levels
+
+from mfd_devcon import Devcon, DevconParser, OutputLogPolicy, configure_output_logging, get_output_log_policy
+from mfd_devcon.output_log import BoundedText
+from mfd_devcon.testing import FakeDevconConnection, SyntheticDevconOutput, generate_devices
+
+
+@pytest.fixture(autouse=True)
+def default_policy():
+    yield
+    configure_output_logging()
+
+
+@pytest.fixture()
+def hwids_output():
+    return SyntheticDevconOutput().hwids(generate_devices(200, seed=23))
+
+
+class TestBoundedText:
+    def test_truncates_head_and_tail(self):
+        text = "a" * 10 + "b" * 100 + "c" * 10
+        message = str(BoundedText("output: ", text, 20))
+        assert message.startswith("output: " + "a" * 10)
+        assert message.endswith("c" * 10)
+        assert "[100 of 120 chars truncated]" in message
+
+    def test_short_and_unbounded(self):
+        assert str(BoundedText("", "abc", 3)) == "abc"
+        assert str(BoundedText("", "x" * 5000, None)) == "x" * 5000
+
+    def test_is_lazy(self, mocker):
+        text = mocker.MagicMock(spec=str)
+        BoundedText("", text, 10)
+        text.__len__.assert_not_called()
+
+
+class TestOutputLogging:
+    def test_raw_output_is_bounded(self, caplog, hwids_output):
+        configure_output_logging(OutputLogPolicy(max_chars=1000))
+        with caplog.at_level(log_levels.MODULE_DEBUG, logger="mfd_devcon.parser"):
+            DevconParser().parse_devcon_hwids(hwids_output)
+        [message] = caplog.messages
+        assert message.startswith("devcon hwids output:\n")
+        assert f"of {len(hwids_output)} chars truncated" in message
+        assert len(message) < 1100
+
+    def test_disabled_level_builds_no_message(self, caplog, hwids_output, mocker):
+        str_spy = mocker.spy(BoundedText, "__str__")
+        with caplog.at_level(logging.INFO, logger="mfd_devcon.parser"):
+            DevconParser().parse_devcon_hwids(hwids_output)
+        assert caplog.messages == []
+        str_spy.assert_not_called()
+
+    def test_sampling(self, caplog, hwids_output):
+        configure_output_logging(OutputLogPolicy(sample_every=3))
+        with caplog.at_level(log_levels.MODULE_DEBUG, logger="mfd_devcon.parser"):
+            for _ in range(6):
+                DevconParser().parse_devcon_hwids(hwids_output)
+        sampled = [message for message in caplog.messages if "not sampled" not in message]
+        assert len(sampled) == 2
+        assert len(caplog.messages) == 6
+
+    def test_commands_are_bounded(self, caplog):
+        configure_output_logging(OutputLogPolicy(max_chars=100))
+        devcon = Devcon(connection=FakeDevconConnection())
+        device_ids = [f"PCI\\VEN_8086&DEV_{index:04X}\\{index}" for index in range(50)]
+        with caplog.at_level(log_levels.MODULE_DEBUG, logger="mfd_devcon.base"):
+            devcon.restart_devices_batch(device_ids)
+        [message] = [message for message in caplog.messages if "using command" in message]
+        assert message.startswith("Run devcon restart using command: ")
+        assert "chars truncated" in message
+
+    def test_capture_file(self, caplog, hwids_output, tmp_path):
+        capture_file = tmp_path / "capture.log"
+        configure_output_logging(OutputLogPolicy(max_chars=100, capture_file=capture_file, capture_max_bytes=10**6))
+        with caplog.at_level(logging.INFO, logger="mfd_devcon.parser"):
+            DevconParser().parse_devcon_hwids(hwids_output)
+        assert caplog.messages == []
+        assert hwids_output in capture_file.read_text()
+        previous = configure_output_logging()
+        assert previous.capture_file == capture_file
+        assert get_output_log_policy() == OutputLogPolicy()
+
+    def test_capture_file_rotation(self, hwids_output, tmp_path):
+        capture_file = tmp_path / "capture.log"
+        configure_output_logging(
+            OutputLogPolicy(capture_file=capture_file, capture_max_bytes=len(hwids_output), capture_backup_count=2)
+        )
+        for _ in range(5):
+            DevconParser().parse_devcon_hwids(hwids_output)
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["capture.log", "capture.log.1", "capture.log.2"]
+
+    def test_invalid_policy(self):
+        with pytest.raises(AttributeError, match="sample_every"):
+            OutputLogPolicy(sample_every=0)
+        with pytest.raises(AttributeError, match="max_chars"):
+            OutputLogPolicy(max_chars=-1)
@@ -0,0 +1,65 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.platform_probe` module."""
+
+import gc
+
+import pytest
+from mfd_common_libs.exceptions import UnexpectedOSException
+from mfd_typing import OSBitness, OSName, OSType
+
+from mfd_devcon import Devcon, PlatformInfo, forget_platform, probe_platform
+from mfd_devcon.exceptions import DevconNotAvailable
+from mfd_devcon.platform_probe import _platforms
+from mfd_devcon.testing import FakeDevconConnection
+
+
+class TestPlatformProbe:
+    @pytest.fixture()
+    def connection(self, mocker):
+        connection = FakeDevconConnection(os_bitness=OSBitness.OS_32BIT)
+        for method in ("get_os_name", "get_os_bitness", "get_os_type"):
+            mocker.spy(connection, method)
+        return connection
+
+    def test_probe_is_memoized(self, connection):
+        assert probe_platform(connection) == PlatformInfo(OSName.WINDOWS, OSBitness.OS_32BIT, OSType.WINDOWS)
+        assert probe_platform(connection) is probe_platform(connection)
+        assert connection.get_os_name.call_count == connection.get_os_bitness.call_count == 1
+        forget_platform(connection)
+        probe_platform(connection)
+        assert connection.get_os_name.call_count == 2
+
+    def test_memo_does_not_keep_connection_alive(self):
+        probe_platform(FakeDevconConnection())
+        gc.collect()
+        assert not any(isinstance(connection, FakeDevconConnection) for connection in list(_platforms.keys()))
+
+    def test_devcon_construction_costs_no_remote_calls_after_first(self, connection):
+        devcon = Devcon(connection=connection)
+        assert devcon._tool_exec == "c:\\mfd_tools\\devcon\\devcon.exe"
+        assert connection.stats.round_trips == 1
+        for _ in range(3):
+            Devcon(connection=connection).check_if_available()
+        assert connection.stats.round_trips == 1
+        assert connection.get_os_name.call_count == connection.get_os_bitness.call_count == 1
+        devcon.check_if_available(force=True)
+        assert connection.stats.round_trips == 2
+
+    def test_availability_is_per_tool_path(self, connection):
+        Devcon(connection=connection)
+        Devcon(connection=connection, absolute_path_to_binary_dir="d:\\tools\\")
+        assert connection.stats.round_trips == 2
+
+    def test_unavailable_tool_is_not_remembered(self, connection, mocker):
+        mocker.patch.object(connection, "execute_command", side_effect=DevconNotAvailable(returncode=1, cmd=""))
+        for _ in range(2):
+            with pytest.raises(DevconNotAvailable):
+                Devcon(connection=connection)
+        assert connection.execute_command.call_count == 2
+
+    def test_unexpected_os(self, mocker):
+        connection = FakeDevconConnection()
+        mocker.patch.object(connection, "get_os_name", return_value=OSName.LINUX)
+        with pytest.raises(UnexpectedOSException, match="Linux"):
+            Devcon(connection=connection)
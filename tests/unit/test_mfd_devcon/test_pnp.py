@@ -0,0 +1,56 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.pnp` module."""
+
+import pickle
+from collections import Counter
+
+import pytest
+
+from mfd_devcon import DevconParser, PnpId
+from mfd_devcon.testing import SyntheticDevconOutput, generate_devices
+
+
+class TestPnpId:
+    def test_pci_id(self):
+        pnp_id = PnpId("PCI\\VEN_8086&DEV_1592&SUBSYS_00028086&REV_02\\4&273B1A92&0&000002")
+        assert pnp_id.bus == "PCI"
+        assert pnp_id.hardware_id == "VEN_8086&DEV_1592&SUBSYS_00028086&REV_02"
+        assert pnp_id.instance_path == "4&273B1A92&0&000002"
+        assert (pnp_id.vendor, pnp_id.device, pnp_id.subsystem, pnp_id.revision) == ("8086", "1592", "00028086", "02")
+        assert pnp_id.vendor_device == ("8086", "1592")
+        assert str(pnp_id) == "PCI\\VEN_8086&DEV_1592&SUBSYS_00028086&REV_02\\4&273B1A92&0&000002"
+
+    def test_usb_and_acpi_ids(self):
+        usb_id = PnpId("USB\\VID_8087&PID_0029\\5&2BE2C1A&0&14")
+        assert (usb_id.bus, usb_id.vendor, usb_id.device, usb_id.subsystem) == ("USB", "8087", "0029", None)
+        acpi_id = PnpId("ACPI\\PNP0C0F\\5")
+        assert (acpi_id.bus, acpi_id.hardware_id, acpi_id.instance_path, acpi_id.vendor) == (
+            "ACPI",
+            "PNP0C0F",
+            "5",
+            None,
+        )
+        assert PnpId("HTREE").instance_path == ""
+
+    def test_equality_hash_and_interning(self):
+        assert PnpId("ROOT\\NET\\0000") == PnpId("root\\net\\0000")
+        assert len({PnpId("ROOT\\NET\\0000"), PnpId("root\\net\\0000")}) == 1
+        assert PnpId("ROOT\\NET\\0000") != "ROOT\\NET\\0000"
+        assert PnpId.parse("ROOT\\NET\\0001") is PnpId.parse("ROOT\\NET\\0001")
+        assert pickle.loads(pickle.dumps(PnpId("ROOT\\NET\\0000"))) == PnpId("ROOT\\NET\\0000")
+
+    def test_immutable(self):
+        pnp_id = PnpId("ROOT\\NET\\0000")
+        with pytest.raises(AttributeError):
+            pnp_id.bus = "PCI"
+        with pytest.raises(AttributeError):
+            pnp_id.other = 1
+
+    def test_records_pnp_id(self):
+        devices = generate_devices(200, seed=8)
+        hwids = DevconParser().parse_devcon_hwids(SyntheticDevconOutput().hwids(devices))
+        assert [entry.pnp_id for entry in hwids] == [PnpId(device.device_instance_id) for device in devices]
+        assert hwids[0].pnp_id is PnpId.parse(devices[0].device_instance_id)
+        groups = Counter(entry.pnp_id.vendor_device for entry in hwids if entry.pnp_id.vendor == "8086")
+        assert groups[("8086", "1889")] == sum("DEV_1889" in device.device_instance_id for device in devices)
@@ -0,0 +1,170 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.testing.recording` module."""
+
+import gzip
+import json
+
+import pytest
+from mfd_typing import OSBitness
+
+from mfd_devcon import Devcon
+from mfd_devcon.exceptions import DevconException, DevconExecutionError, DevconReplayError
+from mfd_devcon.testing import (
+    CorpusEntry,
+    DevconCorpus,
+    FakeDevconConnection,
+    RecordingConnection,
+    ReplayConnection,
+    devcon_subcommand,
+    generate_devices,
+)
+from tests.benchmark.bench_parsers import run_corpus_benchmarks
+
+
+@pytest.fixture()
+def recorded(tmp_path):
+    connection = RecordingConnection(FakeDevconConnection(generate_devices(40, seed=24), os_bitness=OSBitness.OS_32BIT))
+    devcon = Devcon(connection=connection)
+    results = {
+        "snapshot": devcon.snapshot(pattern="*"),
+        "hwids": devcon.get_hwids(pattern="=Net"),
+        "status": devcon.get_status(pattern="*"),
+    }
+    devcon.get_hwids(pattern="=Net")
+    device_id = results["hwids"][0].device_pnp
+    devcon.disable_devices(device_id=device_id)
+    results["disabled"] = devcon.get_status(device_ids=[device_id])
+    devcon.enable_devices(device_id=device_id)
+    results["enabled"] = devcon.get_status(device_ids=[device_id])
+    with pytest.raises(DevconExecutionError):
+        devcon.delete_driver_package("oem99.inf")
+    path = tmp_path / "host.jsonl.gz"
+    connection.save(path)
+    return path, connection, results, device_id
+
+
+class TestRecordingConnection:
+    def test_records_every_command(self, recorded):
+        _, connection, _, _ = recorded
+        commands = [entry.command for entry in connection.corpus.entries]
+        assert len(commands) == 10
+        assert commands[0] == "c:\\mfd_tools\\devcon\\devcon.exe help"
+        assert "==mfd_devcon_delimiter==" in commands[1]
+        assert connection.corpus.entries[-1].return_code == 1
+        assert connection.corpus.host == "127.0.0.1"
+        assert connection.get_os_bitness() == OSBitness.OS_32BIT
+        assert connection.devices is connection.connection.devices
+
+    def test_corpus_file_is_compact(self, recorded):
+        path, connection, _, _ = recorded
+        with gzip.open(path, "rt") as corpus_file:
+            header, *records = [json.loads(line) for line in corpus_file]
+        assert header["format"] == "mfd_devcon_corpus" and header["os_bitness"] == "OS_32BIT"
+        assert len(records) == 10
+        assert records[4] == {"command": records[2]["command"], "return_code": 0, "stdout_of": 2}
+        assert path.stat().st_size < sum(len(entry.stdout) for entry in connection.corpus.entries) / 2
+
+    def test_load_round_trip(self, recorded):
+        path, connection, _, _ = recorded
+        assert DevconCorpus.load(path) == connection.corpus
+
+    def test_load_invalid_file(self, tmp_path):
+        path = tmp_path / "invalid.jsonl.gz"
+        with gzip.open(path, "wt") as corpus_file:
+            corpus_file.write('{"format": "other"}\n')
+        with pytest.raises(DevconReplayError, match="not a devcon corpus"):
+            DevconCorpus.load(path)
+
+    def test_outputs(self, recorded):
+        path, _, _, _ = recorded
+        corpus = DevconCorpus.load(path)
+        assert [entry.subcommand for entry in corpus.outputs()] == [
+            "help",
+            "hwids",
+            "status",
+            "hwids",
+            "disable",
+            "status",
+            "enable",
+            "status",
+        ]
+        assert len(list(corpus.outputs("status"))) == 3
+
+
+class TestReplayConnection:
+    def test_replay_reproduces_session(self, recorded):
+        path, _, results, device_id = recorded
+        connection = ReplayConnection(path)
+        devcon = Devcon(connection=connection)
+        assert devcon._tool_exec == "c:\\mfd_tools\\devcon\\devcon.exe"
+        assert devcon.snapshot(pattern="*") == results["snapshot"]
+        assert devcon.get_hwids(pattern="=Net") == results["hwids"]
+        assert devcon.get_status(pattern="*") == results["status"]
+        devcon.disable_devices(device_id=device_id)
+        assert devcon.get_status(device_ids=[device_id]) == results["disabled"]
+        devcon.enable_devices(device_id=device_id)
+        assert devcon.get_status(device_ids=[device_id]) == results["enabled"]
+        with pytest.raises(DevconExecutionError):
+            devcon.delete_driver_package("oem99.inf")
+        assert connection.stats.round_trips == 9
+
+    def test_responses_cycle(self, recorded):
+        path, _, results, device_id = recorded
+        devcon = Devcon(connection=ReplayConnection(path))
+        states = [devcon.get_status(device_ids=[device_id]) for _ in range(3)]
+        assert states == [results["disabled"], results["enabled"], results["disabled"]]
+
+    def test_unknown_command(self, recorded):
+        path, _, _, _ = recorded
+        devcon = Devcon(connection=ReplayConnection(path))
+        with pytest.raises(DevconReplayError, match="was not recorded"):
+            devcon.get_drivernodes(pattern="*")
+
+    def test_strict_order(self, recorded):
+        path, _, results, _ = recorded
+        connection = ReplayConnection(path, strict=True)
+        devcon = Devcon(connection=connection)
+        with pytest.raises(DevconReplayError, match="does not match recorded command"):
+            devcon.get_hwids(pattern="=Net")
+        connection.rewind()
+        devcon.check_if_available(force=True)
+        assert devcon.snapshot(pattern="*") == results["snapshot"]
+
+    def test_latency_is_accounted(self):
+        corpus = DevconCorpus(entries=[CorpusEntry("c:\\devcon\\devcon_x64.exe help", "Device Console Help:\n")])
+        delays = []
+        connection = ReplayConnection(corpus, latency=0.5, sleep=delays.append)
+        Devcon(connection=connection, absolute_path_to_binary_dir="c:\\devcon")
+        assert delays == [0.5]
+
+    def test_mutation_errors_are_replayed(self):
+        corpus = DevconCorpus(
+            entries=[
+                CorpusEntry("c:\\devcon\\devcon_x64.exe help", "Device Console Help:\n"),
+                CorpusEntry('c:\\devcon\\devcon_x64.exe enable "@PCI\\1"', "No matching devices found.\n"),
+            ]
+        )
+        devcon = Devcon(connection=ReplayConnection(corpus), absolute_path_to_binary_dir="c:\\devcon")
+        with pytest.raises(DevconException, match="No matching devices found"):
+            devcon.enable_devices(device_id="PCI\\1")
+
+
+class TestCorpusBenchmarks:
+    def test_devcon_subcommand(self):
+        assert devcon_subcommand('c:\\devcon\\devcon.exe /r restart "@PCI\\1"') == "restart"
+        assert devcon_subcommand('"c:\\program files\\devcon_x64.exe" hwids *') == "hwids"
+        assert devcon_subcommand("c:\\devcon\\devcon.exe find * & echo x & c:\\devcon\\devcon.exe hwids *") is None
+        assert devcon_subcommand('type "c:\\manifest"') is None
+
+    def test_run_corpus_benchmarks(self, recorded):
+        path, _, _, _ = recorded
+        results = run_corpus_benchmarks([path], repeat=1)
+        assert [(result.method, result.devices) for result in results] == [
+            ("hwids [host.jsonl.gz]", 24),
+            ("status [host.jsonl.gz]", 40),
+            ("disable [host.jsonl.gz]", 1),
+            ("status [host.jsonl.gz]", 1),
+            ("enable [host.jsonl.gz]", 1),
+            ("status [host.jsonl.gz]", 1),
+        ]
@@ -0,0 +1,71 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for slotted and frozen records of `mfd_devcon.parser` module."""
+
+import dataclasses
+
+import pytest
+
+from mfd_devcon import DevconParser, DriverNode
+from mfd_devcon.parser import DevconDevices, DevconDriverFiles, DevconDriverNodes, DevconHwids, DevconResources
+from mfd_devcon.testing import SyntheticDevconOutput, generate_devices
+from tests.benchmark.bench_memory import run_memory_benchmarks
+
+
+class TestRecords:
+    @pytest.mark.parametrize(
+        "record",
+        [
+            DevconHwids("ROOT\\NET\\0000", "Adapter", ["ROOT\\NET"], ["NET"]),
+            DevconDriverNodes("ROOT\\NET\\0000", "Adapter", {"0": DriverNode(inf_file="net.inf")}),
+            DevconDriverFiles("ROOT\\NET\\0000", "Adapter", "net.inf", ["net.sys"]),
+            DevconDevices("ROOT\\NET\\0000", "Adapter"),
+            DevconResources("ROOT\\NET\\0000", "Adapter", ["IRQ : 16"]),
+        ],
+    )
+    def test_slotted_and_freeze(self, record):
+        assert not hasattr(record, "__dict__")
+        frozen = record.freeze()
+        assert hash(frozen) == hash(record.freeze())
+        assert frozen.pnp_id == record.pnp_id
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            setattr(frozen, dataclasses.fields(frozen)[0].name, "other")
+
+    def test_driver_node_is_read_only_mapping(self):
+        node = DriverNode(inf_file="C:\\windows\\INF\\machine.inf", driver_version="10.0.22000.1")
+        assert node == {"inf_file": "C:\\windows\\INF\\machine.inf", "driver_version": "10.0.22000.1"}
+        assert node["driver_version"] == node.driver_version == "10.0.22000.1"
+        assert node.get("driver_date") is None
+        assert list(node) == ["inf_file", "driver_version"]
+        assert len(node) == 2
+        with pytest.raises(KeyError):
+            node["driver_date"]
+        with pytest.raises(KeyError):
+            node["freeze"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            node.driver_date = "1/1/2025"
+        assert len({node, DriverNode(**node)}) == 1
+
+    def test_driver_node_legacy_dict_shape(self):
+        node = DriverNode(inf_file="oem3.inf", driver_version="1.0.0.0")
+        assert node.version == (1, 0, 0, 0)
+        legacy = node.as_dict()
+        assert type(legacy) is dict
+        assert legacy == {"inf_file": "oem3.inf", "driver_version": "1.0.0.0"}
+        legacy["inf_file"] = "oem4.inf"
+        assert node.inf_file == "oem3.inf"
+        with pytest.raises(TypeError, match="as_dict"):
+            node["inf_file"] = "oem4.inf"
+
+    def test_parsed_driver_nodes(self):
+        devices = generate_devices(20, seed=9)
+        parsed = DevconParser().parse_devcon_drivernodes(SyntheticDevconOutput().drivernodes(devices))
+        for entry, device in zip(parsed, devices):
+            assert all(isinstance(node, DriverNode) for node in entry.driver_nodes.values())
+            assert entry.freeze().driver_nodes == tuple(device.driver_nodes)
+
+    def test_run_memory_benchmarks(self):
+        results = {(result.record, result.variant): result for result in run_memory_benchmarks(records=500)}
+        for record in ("hwids", "drivernodes", "resources"):
+            assert results[(record, "slotted")].memory < results[(record, "legacy")].memory
+            assert results[(record, "frozen")].memory < results[(record, "legacy")].memory
@@ -0,0 +1,53 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `Devcon.snapshot`."""
+
+import pytest
+
+from mfd_devcon import Devcon, DevconParser
+from mfd_devcon.exceptions import DevconException, DevconParserException
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+class TestSnapshot:
+    @pytest.fixture()
+    def connection(self):
+        return FakeDevconConnection(generate_devices(30, seed=7))
+
+    @pytest.fixture()
+    def devcon(self, connection):
+        devcon = Devcon(connection=connection)
+        connection.reset_stats()
+        return devcon
+
+    def test_snapshot_is_single_round_trip(self, devcon, connection):
+        snapshot = devcon.snapshot(pattern="=net")
+        assert connection.stats.round_trips == 1
+        assert [device.device_instance_id for device in snapshot] == [
+            device.device_instance_id for device in devcon.find_devices(pattern="=net")
+        ]
+
+    def test_snapshot_matches_separate_commands(self, devcon, connection):
+        device_id = connection.devices[3].device_instance_id
+        (snapshot,) = devcon.snapshot(device_id=device_id)
+        assert snapshot.device_desc == connection.devices[3].name
+        assert snapshot.hwids == devcon.get_hwids(device_id=device_id)[0]
+        assert snapshot.driver_nodes == devcon.get_drivernodes(device_id=device_id)[0]
+        assert snapshot.driver_files == devcon.get_driverfiles(device_id=device_id)[0]
+        assert snapshot.resources == devcon.get_resources(device_id=device_id)[0]
+
+    def test_snapshot_no_matching_devices(self, devcon):
+        with pytest.raises(DevconException, match="No matching devices found"):
+            devcon.snapshot(device_id="PCI\\NOT_PRESENT")
+
+    def test_snapshot_without_inputs(self, devcon):
+        with pytest.raises(AttributeError):
+            devcon.snapshot()
+
+    def test_parse_snapshot_with_missing_section(self):
+        with pytest.raises(DevconParserException, match="expected 5 outputs, got 2"):
+            DevconParser().parse_devcon_snapshot("0 matching device(s) found.\n==d==\n", "==d==")
+
+    def test_parse_devices_after_echo_delimiter(self):
+        output = " \nROOT\\NET\\0000: Virtual Adapter\n1 matching device(s) found.\n"
+        assert [device.device_instance_id for device in DevconParser().iter_devices(output)] == ["ROOT\\NET\\0000"]
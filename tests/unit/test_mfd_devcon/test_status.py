@@ -0,0 +1,142 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for devcon status support of `mfd_devcon` module."""
+
+from textwrap import dedent
+
+import pytest
+
+from mfd_devcon import Devcon, DevconCache, DevconDeviceStatus, DevconParser, DeviceState, LazyDeviceList
+from mfd_devcon.exceptions import DevconException, DevconParserException
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+class TestParseDevconStatus:
+    def test_parse_states(self):
+        output = dedent(
+            """\
+            PCI\\VEN_8086&DEV_1572&SUBSYS_00018086&REV_01\\6805CAFFFF2E3C7800
+                Name: Intel(R) Ethernet Converged Network Adapter X710
+                Driver is running.
+            PCI\\VEN_8086&DEV_1572&SUBSYS_00018086&REV_01\\6805CAFFFF2E3C7801
+                Name: Intel(R) Ethernet Converged Network Adapter X710 #2
+                Device is disabled.
+            PCI\\VEN_8086&DEV_1592&SUBSYS_00028086&REV_02\\000100FFFF00000000
+                Name: Intel(R) Ethernet Network Adapter E810-C-Q2
+                Device has a problem: 28.
+            ROOT\\NET\\0000
+                Name: Microsoft KM-TEST Loopback Adapter
+                Device has a problem reported by the driver.
+            SWD\\MSRRAS\\MS_NDISWANIP
+                Name: WAN Miniport (IP)
+                Device is currently stopped.
+            5 matching device(s) found.
+            """
+        )
+        assert DevconParser().parse_devcon_status(output) == [
+            DevconDeviceStatus(
+                "PCI\\VEN_8086&DEV_1572&SUBSYS_00018086&REV_01\\6805CAFFFF2E3C7800",
+                "Intel(R) Ethernet Converged Network Adapter X710",
+                DeviceState.RUNNING,
+                None,
+                ["Driver is running."],
+            ),
+            DevconDeviceStatus(
+                "PCI\\VEN_8086&DEV_1572&SUBSYS_00018086&REV_01\\6805CAFFFF2E3C7801",
+                "Intel(R) Ethernet Converged Network Adapter X710 #2",
+                DeviceState.DISABLED,
+                None,
+                ["Device is disabled."],
+            ),
+            DevconDeviceStatus(
+                "PCI\\VEN_8086&DEV_1592&SUBSYS_00028086&REV_02\\000100FFFF00000000",
+                "Intel(R) Ethernet Network Adapter E810-C-Q2",
+                DeviceState.PROBLEM,
+                28,
+                ["Device has a problem: 28."],
+            ),
+            DevconDeviceStatus(
+                "ROOT\\NET\\0000",
+                "Microsoft KM-TEST Loopback Adapter",
+                DeviceState.PROBLEM,
+                None,
+                ["Device has a problem reported by the driver."],
+            ),
+            DevconDeviceStatus(
+                "SWD\\MSRRAS\\MS_NDISWANIP",
+                "WAN Miniport (IP)",
+                DeviceState.STOPPED,
+                None,
+                ["Device is currently stopped."],
+            ),
+        ]
+
+    def test_parse_unknown_state(self):
+        output = "ROOT\\NET\\0000\n    Name: Adapter\n    Device status is unavailable.\n1 matching device(s) found.\n"
+        (status,) = DevconParser().parse_devcon_status(output)
+        assert status.state is DeviceState.UNKNOWN
+        assert status.status == ["Device status is unavailable."]
+
+    def test_parse_mismatched_trailer(self):
+        with pytest.raises(DevconParserException, match="for status"):
+            DevconParser().parse_devcon_status("ROOT\\NET\\0000\n    Driver is running.\n2 matching device(s) found.\n")
+
+
+class TestGetStatus:
+    @pytest.fixture()
+    def connection(self):
+        return FakeDevconConnection(generate_devices(40, seed=18))
+
+    @pytest.fixture()
+    def devcon(self, connection):
+        devcon = Devcon(connection=connection)
+        connection.reset_stats()
+        return devcon
+
+    def test_many_devices_single_call(self, devcon, connection):
+        devices = connection.devices[:10]
+        devices[1].enabled = False
+        devices[2].problem_code = 10
+        devices[3].started = False
+        statuses = devcon.get_status([device.device_instance_id for device in devices])
+        assert connection.stats.round_trips == 1
+        assert [status.device_pnp for status in statuses] == [device.device_instance_id for device in devices]
+        assert [status.state for status in statuses[:4]] == [
+            DeviceState.RUNNING,
+            DeviceState.DISABLED,
+            DeviceState.PROBLEM,
+            DeviceState.STOPPED,
+        ]
+        assert statuses[2].problem_code == 10
+
+    def test_packing_respects_command_length(self, devcon, connection):
+        device_ids = [device.device_instance_id for device in connection.devices[:10]]
+        devcon.max_command_length = len(f"{devcon._tool_exec} status") + 3 * (len(max(device_ids, key=len)) + 4)
+        statuses = devcon.get_status(device_ids)
+        assert [status.device_pnp for status in statuses] == device_ids
+        assert 1 < connection.stats.round_trips < len(device_ids)
+
+    def test_pattern_lazy(self, devcon):
+        statuses = devcon.get_status(pattern="=net", lazy=True)
+        assert isinstance(statuses, LazyDeviceList)
+        assert statuses == devcon.get_status(pattern="=net")
+
+    def test_status_bypasses_cache(self, connection):
+        devcon = Devcon(connection=connection, cache=DevconCache())
+        device = connection.devices[0]
+        before = devcon.get_status(pattern="*")
+        before_by_id = devcon.get_status([device.device_instance_id])
+        device.enabled = False
+        after = devcon.get_status(pattern="*")
+        assert before != after
+        assert (before[0].state, after[0].state) == (DeviceState.RUNNING, DeviceState.DISABLED)
+        assert devcon.get_status([device.device_instance_id]) != before_by_id
+        assert devcon._cache.hits == 0
+
+    def test_no_matching_devices(self, devcon):
+        with pytest.raises(DevconException, match="No matching devices found"):
+            devcon.get_status(["ROOT\\MISSING\\0000"])
+
+    def test_missing_inputs(self, devcon):
+        with pytest.raises(AttributeError):
+            devcon.get_status()
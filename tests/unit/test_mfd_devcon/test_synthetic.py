@@ -0,0 +1,78 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_devcon.testing.synthetic` module."""
+
+import pytest
+
+from mfd_devcon import DevconParser
+from mfd_devcon.testing import SyntheticDevconOutput, generate_devices
+from tests.benchmark.bench_parsers import run_parser_benchmarks
+
+
+class TestSyntheticDevconOutput:
+    @pytest.fixture()
+    def devices(self):
+        return generate_devices(200, seed=1)
+
+    def test_generate_devices_is_reproducible(self):
+        assert generate_devices(50, seed=3) == generate_devices(50, seed=3)
+        assert generate_devices(50, seed=3) != generate_devices(50, seed=4)
+
+    def test_generate_devices_unique_instance_ids(self, devices):
+        assert len({device.device_instance_id for device in devices}) == len(devices)
+
+    def test_hwids_round_trip(self, devices):
+        parsed = DevconParser().parse_devcon_hwids(SyntheticDevconOutput().hwids(devices))
+        assert [entry.device_pnp for entry in parsed] == [device.device_instance_id for device in devices]
+        assert [entry.hardware_ids for entry in parsed] == [device.hardware_ids for device in devices]
+        assert [entry.compatible_ids for entry in parsed] == [device.compatible_ids for device in devices]
+
+    def test_drivernodes_round_trip(self, devices):
+        parsed = DevconParser().parse_devcon_drivernodes(SyntheticDevconOutput().drivernodes(devices))
+        assert [entry.driver_nodes for entry in parsed] == [
+            {str(num): node for num, node in enumerate(device.driver_nodes)} for device in devices
+        ]
+
+    def test_driverfiles_round_trip(self, devices):
+        parsed = DevconParser().parse_devcon_driverfiles(SyntheticDevconOutput().driverfiles(devices))
+        assert sorted((entry.device_pnp, tuple(entry.driver_files)) for entry in parsed) == sorted(
+            (device.device_instance_id, tuple(device.driver_files)) for device in devices
+        )
+
+    def test_resources_round_trip(self, devices):
+        parsed = DevconParser().parse_devcon_resources(SyntheticDevconOutput().resources(devices))
+        assert [entry.resources for entry in parsed] == [device.resources for device in devices]
+
+    def test_find_and_listclass_round_trip(self, devices):
+        parser, renderer = DevconParser(), SyntheticDevconOutput()
+        found = parser.parse_devcon_devices(renderer.find(devices))
+        assert [(entry.device_instance_id, entry.device_desc) for entry in found] == [
+            (device.device_instance_id, device.name) for device in devices
+        ]
+        listed = parser.parse_devcon_devices(renderer.listclass(devices, "net"), command="listclass")
+        assert len(listed) == len([device for device in devices if device.setup_class == "Net"])
+
+    def test_render_invalid_command(self, devices):
+        with pytest.raises(AttributeError, match="Invalid command"):
+            SyntheticDevconOutput().render("stack", devices)
+
+    def test_run_parser_benchmarks(self):
+        results = run_parser_benchmarks([5], repeat=1)
+        assert {result.method for result in results} == {
+            "parse_devcon_hwids",
+            "parse_devcon_hwids[lazy, first 5]",
+            "parse_devcon_drivernodes",
+            "parse_devcon_driverfiles",
+            "parse_devcon_resources",
+            "parse_devcon_devices[find]",
+            "parse_devcon_devices[listclass]",
+            "parse_devcon_status",
+            "parse_devcon_dp_enum",
+            "parse_devcon_mutation",
+            "parse_devcon_snapshot",
+        }
+        assert all(result.peak_memory > 0 for result in results)
+        devices = {result.method: result.devices for result in results}
+        assert (
+            devices["parse_devcon_status"] == devices["parse_devcon_mutation"] == devices["parse_devcon_snapshot"] == 5
+        )
@@ -0,0 +1,114 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for Devcon.wait_for method."""
+
+import pytest
+
+from mfd_devcon import Devcon, DevconCache
+from mfd_devcon.exceptions import DevconWaitTimeout
+from mfd_devcon.testing import FakeDevconConnection, generate_devices
+
+
+class FakeClock:
+    """Clock advancing only when slept, running scheduled actions once their time has come."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self.actions = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        for action in [action for action in self.actions if action[0] <= self.now]:
+            self.actions.remove(action)
+            action[1]()
+
+    def at(self, when, action):
+        self.actions.append((when, action))
+
+
+class TestWaitFor:
+    @pytest.fixture()
+    def connection(self):
+        return FakeDevconConnection(generate_devices(20, seed=17))
+
+    @pytest.fixture()
+    def clock(self, mocker):
+        clock = FakeClock()
+        mocker.patch("mfd_devcon.base.time", clock)
+        return clock
+
+    @pytest.fixture()
+    def devcon(self, connection, clock):
+        devcon = Devcon(connection=connection)
+        connection.reset_stats()
+        return devcon
+
+    @pytest.fixture()
+    def device_ids(self, connection):
+        return [device.device_instance_id for device in connection.devices[:5]]
+
+    def test_returns_immediately_if_condition_holds(self, devcon, connection, clock, device_ids):
+        assert devcon.wait_for(device_ids, state="present") == 0
+        assert connection.stats.round_trips == 1
+        assert clock.sleeps == []
+
+    def test_adaptive_backoff_until_started(self, devcon, connection, clock, device_ids):
+        for device in connection.devices[:5]:
+            device.started = False
+        clock.at(1.0, lambda: setattr(connection.devices[0], "started", True))
+        clock.at(2.0, lambda: [setattr(device, "started", True) for device in connection.devices[1:5]])
+        assert devcon.wait_for(device_ids, state="started", initial_interval=0.1, max_interval=1) == pytest.approx(2.5)
+        assert clock.sleeps == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0])
+        assert connection.stats.round_trips == 6
+        assert all(" status " in command for command in connection.stats.commands)
+
+    def test_absent_after_remove(self, devcon, connection, clock, device_ids):
+        clock.at(0.3, lambda: connection.devices.remove(connection.devices[0]))
+        devcon.wait_for([device_ids[0]], state="absent")
+        assert connection.stats.round_trips == 3
+
+    def test_patterns_disabled(self, devcon, connection, clock):
+        clock.at(0.1, lambda: devcon.disable_devices(pattern="=net"))
+        devcon.wait_for(patterns=["=net"], state="disabled")
+        assert not any(device.enabled for device in connection.devices if device.setup_class == "Net")
+
+    def test_patterns_present_after_rescan(self, devcon, connection, clock, device_ids):
+        devcon.remove_devices(device_id=device_ids[0])
+        clock.at(0.5, devcon.rescan_devices)
+        devcon.wait_for(patterns=[f"@{device_ids[0]}"], state="present")
+
+    def test_timeout(self, devcon, connection, clock, device_ids):
+        connection.devices[1].problem_code = 28
+        with pytest.raises(DevconWaitTimeout, match=device_ids[1].replace("\\", "\\\\")):
+            devcon.wait_for(device_ids, state="started", timeout=3, max_interval=1)
+        assert clock.now == pytest.approx(3)
+
+    def test_one_query_per_poll_bypassing_cache(self, connection, clock, device_ids):
+        devcon = Devcon(connection=connection, cache=DevconCache())
+        devcon.find_devices(pattern="*")
+        connection.devices[0].enabled = False
+        clock.at(0.3, lambda: setattr(connection.devices[0], "enabled", True))
+        connection.reset_stats()
+        devcon.wait_for(device_ids, state="started")
+        assert connection.stats.round_trips == 3
+        devcon.find_devices(pattern="*")
+        assert connection.stats.round_trips == 4
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"device_ids": ["A"], "patterns": ["*"]},
+            {"device_ids": ["A"], "state": "running"},
+            {"device_ids": ["A"], "initial_interval": 0},
+            {"device_ids": ["A"], "backoff": 0.5},
+        ],
+    )
+    def test_invalid_inputs(self, devcon, kwargs):
+        with pytest.raises(AttributeError):
+            devcon.wait_for(**kwargs)